@@ -0,0 +1,8 @@
+"""
+Benchmarks for pydref-serializers, run against a real in-memory Django project.
+
+Run a benchmark module from the repository root, e.g.:
+
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.bench_extractor
+"""
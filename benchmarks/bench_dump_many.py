@@ -0,0 +1,56 @@
+"""
+Compares dumping a list of serializers to a JSON array item by item (joining the
+`model_dump_json` of each item, or `json.dumps` of each `model_dump`) against the
+single call of `dump_many_json`.
+"""
+import json
+import sys
+import time
+
+from .project import populate, setup_django
+
+setup_django()
+
+from pydref_serializers import ModelSerializerBuilder  # noqa: E402
+
+from .benchapp.models import Book  # noqa: E402
+
+SIZES = tuple(map(int, sys.argv[1:])) or (100, 10_000, 100_000)
+
+
+def measure(function, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    populate(max(SIZES))
+    BookSerializer = ModelSerializerBuilder(Book).build()
+    for size in SIZES:
+        items = BookSerializer.from_queryset(Book.objects.order_by("pk")[:size])
+        timings = {
+            "join(model_dump_json)": measure(
+                lambda: "[" + ",".join(s.model_dump_json() for s in items) + "]"
+            ),
+            "json.dumps(model_dump)": measure(
+                lambda: json.dumps([s.model_dump(mode="json") for s in items])
+            ),
+            "dump_many_json": measure(lambda: BookSerializer.dump_many_json(items)),
+            "dump_many_json(include)": measure(
+                lambda: BookSerializer.dump_many_json(
+                    items, include={"id", "title", "status"}
+                )
+            ),
+        }
+        baseline = timings["join(model_dump_json)"]
+        print(f"{size} items:")
+        for name, elapsed in timings.items():
+            print(f"  {name:>24}: {elapsed:.4f}s ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
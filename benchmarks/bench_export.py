@@ -0,0 +1,48 @@
+"""
+Measures how `export_queryset` scales with the number of worker processes.
+
+SQLite in-memory databases cannot be shared between processes, so this benchmark
+uses a temporary database file.
+"""
+import io
+import os
+import sys
+import tempfile
+import time
+
+from .project import populate, setup_django
+
+DATABASE = os.path.join(tempfile.mkdtemp(), "bench_export.sqlite3")
+setup_django(DATABASE)
+
+from pydref_serializers import ModelSerializerBuilder  # noqa: E402
+from pydref_serializers.exporters import export_queryset  # noqa: E402
+
+from .benchapp.models import Book  # noqa: E402
+
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+WORKERS = (1, 2, 4, 8)
+
+
+def main() -> None:
+    populate(ROWS)
+    builder = ModelSerializerBuilder(Book)
+    baseline = None
+    for workers in WORKERS:
+        if workers > os.cpu_count():
+            break
+        start = time.perf_counter()
+        result = export_queryset(
+            builder, Book.objects.all(), output=io.BytesIO(), workers=workers
+        )
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"{workers} worker(s): {result.rows} rows in {elapsed:.2f}s "
+            f"({baseline / elapsed:.1f}x)"
+        )
+    os.remove(DATABASE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Compares the per-instance cost of `django.forms.models.model_to_dict` against the
+precompiled `ModelExtractor` used by built serializers.
+"""
+import timeit
+
+from .project import populate, setup_django
+
+setup_django()
+
+from django.forms.models import model_to_dict  # noqa: E402
+
+from pydref_serializers import ModelSerializerBuilder  # noqa: E402
+
+from .benchapp.models import Book  # noqa: E402
+
+NUMBER = 100_000
+
+
+def main() -> None:
+    populate(1, tags=2)
+    # model_to_dict reads the many-to-many tags, which would query them on every call.
+    book = Book.objects.prefetch_related("tags").get()
+    for fields in (None, ("title", "pages")):
+        builder = ModelSerializerBuilder(Book)
+        if fields:
+            builder.with_fields(*fields)
+        extractor = builder.build().config["extractor"]
+        baseline = timeit.timeit(lambda: model_to_dict(book), number=NUMBER)
+        compiled = timeit.timeit(lambda: extractor(book), number=NUMBER)
+        label = ",".join(fields) if fields else "all fields"
+        print(
+            f"{label:>16}: model_to_dict {baseline / NUMBER * 1e6:.2f}us, "
+            f"extractor {compiled / NUMBER * 1e6:.2f}us "
+            f"({baseline / compiled:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Compares serializing a queryset through model instances (`from_model` per row and
+`from_queryset`) against the `values_list` tuple path of `from_values`.
+"""
+import sys
+import time
+
+from .project import populate, setup_django
+
+setup_django()
+
+from pydref_serializers import ModelSerializerBuilder  # noqa: E402
+
+from .benchapp.models import Book  # noqa: E402
+
+SIZES = tuple(map(int, sys.argv[1:])) or (1_000, 100_000, 1_000_000)
+
+
+def measure(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    populate(max(SIZES))
+    BookSerializer = ModelSerializerBuilder(Book).build()
+    for size in SIZES:
+        queryset = Book.objects.order_by("pk")[:size]
+        timings = {
+            "from_model": measure(
+                lambda: [BookSerializer.from_model(book) for book in queryset.all()]
+            ),
+            "from_queryset": measure(lambda: BookSerializer.from_queryset(queryset)),
+            "from_values": measure(lambda: BookSerializer.from_values(queryset)),
+            "from_values(trusted)": measure(
+                lambda: BookSerializer.from_values(queryset, trusted=True)
+            ),
+        }
+        baseline = timings["from_model"]
+        print(f"{size} rows:")
+        for name, elapsed in timings.items():
+            print(f"  {name:>20}: {elapsed:.3f}s ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
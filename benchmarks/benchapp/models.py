@@ -0,0 +1,72 @@
+import os
+
+from django.db import models
+
+
+class Author(models.Model):
+    name = models.CharField(max_length=100)
+    email = models.EmailField()
+
+
+class Tag(models.Model):
+    name = models.SlugField(max_length=50)
+
+
+class Book(models.Model):
+    class Status(models.TextChoices):
+        DRAFT = "draft", "Draft"
+        PUBLISHED = "published", "Published"
+
+    title = models.CharField(max_length=200)
+    summary = models.TextField(blank=True)
+    pages = models.PositiveIntegerField()
+    price = models.DecimalField(max_digits=8, decimal_places=2)
+    rating = models.FloatField(null=True)
+    status = models.CharField(max_length=20, choices=Status.choices)
+    is_available = models.BooleanField(default=True)
+    published_at = models.DateTimeField(null=True)
+    author = models.ForeignKey(Author, on_delete=models.CASCADE, related_name="books")
+    tags = models.ManyToManyField(Tag, related_name="books")
+
+
+class Cover(models.Model):
+    book = models.OneToOneField(Book, on_delete=models.CASCADE)
+    color = models.CharField(max_length=20)
+
+
+class Sample(models.Model):
+    """
+    A model with one field of every type of `DJANGO_FIELD_MAP`.
+    """
+
+    class Level(models.IntegerChoices):
+        LOW = 1, "Low"
+        HIGH = 2, "High"
+
+    id = models.AutoField(primary_key=True)
+    integer = models.IntegerField()
+    small_integer = models.SmallIntegerField()
+    big_integer = models.BigIntegerField()
+    positive_integer = models.PositiveIntegerField()
+    positive_small_integer = models.PositiveSmallIntegerField()
+    float_number = models.FloatField(null=True)
+    decimal = models.DecimalField(max_digits=10, decimal_places=2)
+    char = models.CharField(max_length=100)
+    text = models.TextField(blank=True)
+    slug = models.SlugField()
+    email = models.EmailField()
+    url = models.URLField()
+    file_path = models.FilePathField(path=os.path.dirname(__file__))
+    attachment = models.FileField(null=True)
+    image = models.ImageField(null=True)
+    flag = models.BooleanField(default=False)
+    binary = models.BinaryField()
+    day = models.DateField()
+    moment = models.DateTimeField()
+    duration = models.DurationField()
+    time_of_day = models.TimeField()
+    uuid = models.UUIDField()
+    ip_address = models.GenericIPAddressField(null=True)
+    data = models.JSONField(default=dict)
+    level = models.IntegerField(choices=Level.choices)
+    author = models.ForeignKey(Author, null=True, on_delete=models.SET_NULL)
@@ -0,0 +1,120 @@
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import django
+from django.conf import settings
+from django.db import connection
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def setup_django(database_name: str = ":memory:") -> None:
+    """
+    Configures and sets up a minimal Django project for the benchmarks.
+
+    Args:
+        database_name (str, optional): The SQLite database to use. Defaults to an in-memory database.
+    """
+    if not settings.configured:
+        settings.configure(
+            DATABASES={
+                "default": {
+                    "ENGINE": "django.db.backends.sqlite3",
+                    "NAME": database_name,
+                }
+            },
+            INSTALLED_APPS=["benchmarks.benchapp"],
+            DEFAULT_AUTO_FIELD="django.db.models.BigAutoField",
+            USE_TZ=True,
+        )
+    django.setup()
+
+
+def create_tables() -> None:
+    """
+    Creates the tables of all the benchmark models.
+    """
+    from django.apps import apps
+
+    with connection.schema_editor() as editor:
+        for model in apps.get_app_config("benchapp").get_models():
+            editor.create_model(model)
+
+
+def populate(rows: int, *, tags: int = 0, samples: bool = False) -> None:
+    """
+    Creates the tables and `rows` books of a single author.
+
+    Args:
+        rows (int): The number of books (and samples) to create.
+        tags (int, optional): The number of tags given to every book. Defaults to 0.
+        samples (bool, optional): Whether to create `rows` samples too. Defaults to False.
+    """
+    from .benchapp.models import Author, Book, Sample, Tag
+
+    create_tables()
+    author = Author.objects.create(name="Author", email="author@example.com")
+    books = Book.objects.bulk_create(
+        (
+            Book(
+                title=f"Title {i}",
+                summary="Summary " * 10,
+                pages=100 + i % 500,
+                price=Decimal("9.99"),
+                rating=None if i % 3 else 4.5,
+                status=Book.Status.PUBLISHED,
+                author=author,
+            )
+            for i in range(rows)
+        ),
+        batch_size=10_000,
+    )
+    if tags:
+        created_tags = Tag.objects.bulk_create(
+            Tag(name=f"tag-{i}") for i in range(tags)
+        )
+        Book.tags.through.objects.bulk_create(
+            (
+                Book.tags.through(book_id=book.pk, tag_id=tag.pk)
+                for book in books
+                for tag in created_tags
+            ),
+            batch_size=10_000,
+        )
+    if not samples:
+        return
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    Sample.objects.bulk_create(
+        (
+            Sample(
+                integer=i,
+                small_integer=i % 100,
+                big_integer=i * 1_000_000,
+                positive_integer=i + 1,
+                positive_small_integer=i % 100 + 1,
+                float_number=None if i % 2 else i / 3,
+                decimal=Decimal("12.34"),
+                char=f"Sample {i}",
+                text="Text " * 20,
+                slug=f"sample-{i}",
+                email=f"sample{i}@example.com",
+                url=f"https://example.com/{i}",
+                file_path=Sample._meta.get_field("file_path").path + "/models.py",
+                binary=b"\x00\x01" * 16,
+                day=date(2024, 1, 1),
+                moment=now,
+                duration=timedelta(minutes=i % 60),
+                time_of_day=time(12, 30),
+                uuid=uuid4(),
+                ip_address="127.0.0.1",
+                data={"index": i},
+                level=Sample.Level.LOW if i % 2 else Sample.Level.HIGH,
+                author=author,
+            )
+            for i in range(rows)
+        ),
+        batch_size=5_000,
+    )
@@ -0,0 +1,238 @@
+"""
+Runs the benchmark suite and reports the results as JSON, so they can be compared
+across commits:
+
+    python -m benchmarks.run --output before.json
+    git checkout other-branch
+    python -m benchmarks.run --output after.json --compare before.json
+
+Each case reports the best time per operation over `--repeat` runs. Queryset cases
+time a whole queryset of `--rows` rows, so their operation is the whole queryset.
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import timeit
+from typing import Any, Callable
+
+from .project import populate, setup_django
+
+setup_django()
+
+import django  # noqa: E402
+import pydantic  # noqa: E402
+
+from pydref_serializers import ModelSerializerBuilder  # noqa: E402
+from pydref_serializers.fieldsets import FieldSet  # noqa: E402
+
+from .benchapp.models import Author, Book, Sample, Tag  # noqa: E402
+
+# The default mapping of these fields does not validate the values of Django
+# instances (`FieldFile` objects for `FilePath`, decoded objects for `Json`), so
+# row benchmarks leave them out. They are still covered by the build benchmarks.
+UNVALIDATED_SAMPLE_FIELDS = ("attachment", "image", "data")
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def measure(function: Callable[[], Any], number: int, repeat: int) -> dict[str, float]:
+    """
+    Returns the best time per call of `function` over `repeat` runs of `number` calls.
+    """
+    best = min(timeit.repeat(function, number=number, repeat=repeat)) / number
+    return {"seconds": best, "ops_per_second": 1 / best if best else float("inf")}
+
+
+def cases() -> dict[str, tuple[Callable[[], Any], int]]:
+    """
+    Returns the benchmark cases, by name, with the number of calls per run.
+    """
+    sample_fields = [
+        field.name
+        for field in Sample._meta.fields
+        if field.name not in UNVALIDATED_SAMPLE_FIELDS
+    ]
+    sample_builder = ModelSerializerBuilder(Sample).with_fields(*sample_fields)
+    SampleSerializer = sample_builder.build()
+    BookSerializer = (
+        ModelSerializerBuilder(Book)
+        .with_nested(
+            author=ModelSerializerBuilder(Author), tags=ModelSerializerBuilder(Tag)
+        )
+        .build()
+    )
+    samples = list(SampleSerializer.prepare_queryset(Sample.objects.order_by("pk")))
+    sample, serialized = samples[0], SampleSerializer.from_model(samples[0])
+    serialized_rows = SampleSerializer.from_models(samples)
+    adapter = SampleSerializer.list_adapter()
+    sample_queryset = Sample.objects.order_by("pk")
+    # The cursor of the last page, found through a filtered queryset.
+    last_pk = samples[-1].pk
+    deep_cursor = SampleSerializer.paginate(
+        Sample.objects.filter(pk__gt=last_pk - 100), limit=50
+    ).next_cursor
+    book_queryset = Book.objects.order_by("pk")
+
+    def build_uncached():
+        ModelSerializerBuilder(Sample, cache=None).build()
+
+    def build_deferred():
+        ModelSerializerBuilder(Sample, cache=None).build(defer=True)
+
+    def build_cached():
+        ModelSerializerBuilder(Sample).build()
+
+    projected = ("id", "char", "level", "moment")
+
+    def build_projection():
+        ModelSerializerBuilder(Sample, cache=None).with_fields(*projected).build()
+
+    def compile_fieldset():
+        FieldSet.compile(SampleSerializer, projected)
+
+    return {
+        "build.all_fields": (build_uncached, 10),
+        "build.all_fields.deferred": (build_deferred, 10),
+        "build.all_fields.cached": (build_cached, 1000),
+        "build.projection": (build_projection, 10),
+        "build.projection.fieldset": (compile_fieldset, 10),
+        "build.projection.fieldset.cached": (
+            lambda: SampleSerializer.fieldset(include=projected),
+            1000,
+        ),
+        "instance.from_model": (lambda: SampleSerializer.from_model(sample), 1000),
+        "instance.from_model.trusted": (
+            lambda: SampleSerializer.from_model(sample, trusted=True),
+            1000,
+        ),
+        "instance.model_dump": (serialized.model_dump, 1000),
+        "instance.model_dump_json": (serialized.model_dump_json, 1000),
+        "batch.from_models": (lambda: SampleSerializer.from_models(samples), 1),
+        "batch.from_models.trusted": (
+            lambda: SampleSerializer.from_models(samples, trusted=True),
+            1,
+        ),
+        "batch.dump_python": (lambda: adapter.dump_python(serialized_rows), 1),
+        "batch.dump_json": (lambda: adapter.dump_json(serialized_rows), 1),
+        "queryset.from_queryset": (
+            lambda: SampleSerializer.from_queryset(sample_queryset),
+            1,
+        ),
+        "queryset.from_values": (
+            lambda: SampleSerializer.from_values(sample_queryset),
+            1,
+        ),
+        "queryset.fieldset.from_queryset": (
+            lambda: SampleSerializer.fieldset(include=projected).from_queryset(
+                sample_queryset
+            ),
+            1,
+        ),
+        "queryset.paginate.first": (
+            lambda: SampleSerializer.paginate(Sample.objects.all(), limit=50),
+            100,
+        ),
+        "queryset.paginate.deep": (
+            lambda: SampleSerializer.paginate(
+                Sample.objects.all(), deep_cursor, limit=50
+            ),
+            100,
+        ),
+        "queryset.offset.deep": (
+            lambda: SampleSerializer.from_queryset(
+                sample_queryset[len(samples) - 50 :]
+            ),
+            100,
+        ),
+        "queryset.stream_json": (
+            lambda: b"".join(SampleSerializer.stream_json(sample_queryset)),
+            1,
+        ),
+        "queryset.nested.from_queryset": (
+            lambda: BookSerializer.from_queryset(book_queryset),
+            1,
+        ),
+        "queryset.nested.dump_many_json": (
+            lambda: BookSerializer.dump_many_json(book_queryset),
+            1,
+        ),
+        "queryset.nested.normalize": (
+            lambda: BookSerializer.normalize(book_queryset, as_json=True),
+            1,
+        ),
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict[str, Any], baseline: dict[str, Any]) -> None:
+    """
+    Prints the speedup of each case over the same case of a baseline report.
+    """
+    for name, result in results["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:>36}: new")
+            continue
+        ratio = before["seconds"] / result["seconds"]
+        print(f"{name:>36}: {ratio:.2f}x {'faster' if ratio >= 1 else 'slower'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--only", help="Only run the cases starting with this prefix")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    parser.add_argument("--compare", help="A JSON report to compare the results to")
+    args = parser.parse_args()
+
+    populate(args.rows, tags=2, samples=True)
+    results = {}
+    for name, (function, number) in cases().items():
+        if args.only and not name.startswith(args.only):
+            continue
+        results[name] = measure(function, number, args.repeat)
+        print(f"{name:>36}: {results[name]['seconds'] * 1e3:10.3f}ms", file=sys.stderr)
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "rows": args.rows,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "pydantic": pydantic.VERSION,
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(report, output, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare) as baseline:
+            compare(report, json.load(baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,2 +1,13 @@
 from .builders import ModelSerializerBuilder
-from .serializers import ModelSerializer
+from .cache import CacheInfo, SerializerCache, serializer_cache
+from .observers import (
+    InMemoryObserver,
+    LoggingObserver,
+    SerializerObserver,
+    observe,
+    set_observer,
+)
+from .output_cache import LocalOutputCache, OutputCache
+from .pagination import Page
+from .registry import SerializerRegistry, WarmupResult, serializer_registry
+from .serializers import DeferredModelSerializer, ModelSerializer
@@ -0,0 +1,31 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+from .registry import (
+    DEFAULT_WARMUP_MODULES,
+    autodiscover_serializers,
+    serializer_registry,
+)
+
+
+class PydrefSerializersConfig(AppConfig):
+    """
+    Optional Django app warming up the serializers of the installed apps.
+
+    With the `PYDREF_WARMUP` setting enabled, the serializers built in the
+    `PYDREF_WARMUP_MODULES` modules of the installed apps (`serializers` by default)
+    are imported and compiled when the app registry is ready, in every process that
+    sets Django up. It also provides the `pydref_warmup` management command, which
+    checks that the schemas compile.
+    """
+
+    name = "pydref_serializers"
+    verbose_name = "PyDReF Serializers"
+
+    def ready(self):
+        if not getattr(settings, "PYDREF_WARMUP", False):
+            return
+        autodiscover_serializers(
+            getattr(settings, "PYDREF_WARMUP_MODULES", DEFAULT_WARMUP_MODULES)
+        )
+        serializer_registry.warmup()
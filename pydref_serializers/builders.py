@@ -1,14 +1,27 @@
 import logging
 from dataclasses import dataclass
 from dataclasses import field as DataclassField
+from time import perf_counter
 
+from django.db.models import Field as DjangoField
+from django.db.models import ForeignObjectRel
 from django.db.models import Model as DjangoModel
-from pydantic import create_model
-from typing_extensions import Self, Set, Type
+from pydantic import Field, create_model
+from typing_extensions import Any, Dict, Self, Set, Tuple, Type
 
+from .cache import SerializerCache, serializer_cache
+from .extractors import ModelExtractor
 from .getters import _FieldGetter, default_get_fields
-from .mappers.fields import FieldMapper, _FieldMapper
-from .serializers import ConfigSerializerDict, ModelSerializer
+from .mappers.fields import _FieldMapper, default_field_mapper
+from .mappers.passthrough import uses_raw_json
+from .observers import BuildEvent, get_observer
+from .registry import SerializerRegistry, serializer_registry
+from .relations import Relation
+from .serializers import (
+    ConfigSerializerDict,
+    DeferredModelSerializer,
+    ModelSerializer,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,12 +36,24 @@ class ModelSerializerBuilder:
         fields (Set[str] | None): The fields to include in the serialized output.
         fields_getter (_FieldGetter): A function that returns the fields to include in the serializer.
         field_mapper (_FieldMapper): A mapper that maps Django fields to Pydantic fields.
+        cache (SerializerCache | None): The cache used to reuse identical builds. Set to None to always build a new class.
+        relations (Dict[str, ModelSerializerBuilder]): The builders of the nested serializers, by relation name.
+        registry (SerializerRegistry | None): The registry the built classes are added to. Set to None to not register them.
     """
 
     model: Type[DjangoModel]
     fields: Set[str] | None = None
     fields_getter: _FieldGetter = default_get_fields
-    field_mapper: _FieldMapper = DataclassField(default_factory=FieldMapper)
+    field_mapper: _FieldMapper = default_field_mapper
+    cache: SerializerCache | None = DataclassField(
+        default=serializer_cache, repr=False, compare=False
+    )
+    relations: Dict[str, "ModelSerializerBuilder"] = DataclassField(
+        default_factory=dict
+    )
+    registry: SerializerRegistry | None = DataclassField(
+        default=serializer_registry, repr=False, compare=False
+    )
 
     def with_fields(self, *field_names) -> Self:
         """
@@ -64,33 +89,175 @@ class ModelSerializerBuilder:
         self.fields -= set(field_names)
         return self
 
-    def build(self, partial=False) -> Type[ModelSerializer]:
+    def with_nested(self, **builders: "ModelSerializerBuilder") -> Self:
+        """
+        Serializes relations with nested serializers.
+
+        Foreign keys and one to one relations (forward or reverse) are serialized as a
+        nested object, reverse foreign keys and many to many relations as a list of
+        them. A nested relation replaces the plain foreign key value of the field.
+
+        Args:
+            **builders: The builders of the nested serializers, by relation name (as accepted by `Model._meta.get_field`).
+
+        Returns:
+            Self: Returns the instance of the builder to allow for method chaining.
+        """
+        self.relations.update(builders)
+        return self
+
+    def cache_key(self, partial=False) -> tuple | None:
+        """
+        Returns the key identifying the serializer class this builder would build.
+
+        Args:
+            partial (bool, optional): Whether the key is for a partial serializer. Defaults to False.
+
+        Returns:
+            tuple | None: The cache key, or None if the builder configuration is not hashable.
+        """
+        key = (
+            self.model,
+            None if self.fields is None else frozenset(self.fields),
+            partial,
+            self.fields_getter,
+            self.field_mapper,
+            getattr(self.field_mapper, "version", None),
+            tuple(
+                (name, builder.cache_key(partial))
+                for name, builder in sorted(self.relations.items())
+            ),
+        )
+        if any(nested_key is None for _, nested_key in key[-1]):
+            return None
+        try:
+            hash(key)
+        except TypeError:
+            logger.debug(f"Builder for {self.model} is not hashable, skipping cache")
+            return None
+        return key
+
+    def build(self, partial=False, defer=False) -> Type[ModelSerializer]:
         """
         Builds a new ModelSerializer class based on the provided Django model and fields.
 
+        Identical builds (same model, fields, partial flag, fields getter and field mapper)
+        return the same class from the builder cache.
+
         Args:
             partial (bool, optional): Whether to create a partial serializer. Defaults to False.
+            defer (bool, optional): Whether to defer the compilation of the pydantic-core schema (of this and the nested serializers) to their first use or to a registry warm-up. Defaults to False.
 
         Returns:
-            Type[ModelSerializer]: The newly created ModelSerializer class.
+            Type[ModelSerializer]: The newly created (or cached) ModelSerializer class.
         """
-        django_fields = self.fields_getter(self.model, self.fields)
+        observer = get_observer()
+        start = perf_counter() if observer is not None else 0.0
+        built = []
+
+        def build():
+            built.append(True)
+            return self._build(partial, defer)
+
+        key = self.cache_key(partial) if self.cache is not None else None
+        if key is None:
+            serializer = build()
+        else:
+            serializer = self.cache.get_or_build(key, build)
+        if not defer:
+            # The cached class may have been built deferred.
+            serializer.compile_schema()
+        if observer is not None:
+            observer.on_build(
+                BuildEvent(
+                    serializer,
+                    self.model,
+                    perf_counter() - start,
+                    cached=not built,
+                    partial=partial,
+                    deferred=defer,
+                )
+            )
+        return serializer
+
+    def _build(self, partial=False, defer=False) -> Type[ModelSerializer]:
+        django_fields = [
+            field
+            for field in self.fields_getter(self.model, self.fields)
+            if field.name not in self.relations
+        ]
         pydantic_fields = {
             field.name: self.field_mapper(field, partial=partial)
             for field in django_fields
         }
+        raw_json = any(
+            uses_raw_json(annotation) for annotation, _ in pydantic_fields.values()
+        )
+        relations = []
+        for name, builder in self.relations.items():
+            relation, pydantic_fields[name] = self._build_relation(
+                name, builder, partial, defer
+            )
+            relations.append(relation)
+            raw_json = raw_json or relation.serializer.has_raw_json()
         serializer_config = ConfigSerializerDict(
             model=self.model,
             fields=self.fields,
+            extractor=ModelExtractor.from_fields(django_fields, relations),
+            relations=tuple(relations),
+            partial=partial,
+            raw_json=raw_json,
         )
         new_serializer = create_model(
             self.model.__name__ + "Serializer",
-            __base__=ModelSerializer,
+            __base__=DeferredModelSerializer if defer else ModelSerializer,
             config=serializer_config,
             **pydantic_fields,
         )
+        if self.registry is not None:
+            self.registry.register(new_serializer)
         return new_serializer
 
+    def _build_relation(
+        self, name: str, builder: "ModelSerializerBuilder", partial: bool, defer: bool
+    ) -> Tuple[Relation, Tuple[type, Any]]:
+        """
+        Builds the nested serializer of a relation and its Pydantic field.
+
+        Args:
+            name (str): The name of the relation.
+            builder (ModelSerializerBuilder): The builder of the nested serializer.
+            partial (bool): Whether to create partial serializers.
+            defer (bool): Whether to defer the schema compilation of the nested serializer.
+
+        Returns:
+            Tuple[Relation, Tuple[type, Any]]: The relation and the Pydantic type and field for it.
+
+        Raises:
+            ValueError: If the field is not a relation.
+        """
+        field: DjangoField | ForeignObjectRel = self.model._meta.get_field(name)
+        if not field.is_relation:
+            raise ValueError(f"Field {name} of {self.model} is not a relation")
+        nested_serializer = builder.build(partial=partial, defer=defer)
+        reverse = isinstance(field, ForeignObjectRel)
+        many = bool(field.many_to_many or field.one_to_many)
+        relation = Relation(
+            name=name,
+            accessor=field.get_accessor_name() if reverse else name,
+            many=many,
+            serializer=nested_serializer,
+            reverse=reverse,
+            # Prefetched reverse foreign keys are matched through their foreign key.
+            join_fields=(field.field.name,) if field.one_to_many else (),
+        )
+        if many:
+            return relation, (list[nested_serializer], Field(default_factory=list))
+        # Reverse one to one relations may not exist.
+        if reverse or field.null or partial:
+            return relation, (nested_serializer | None, Field(default=None))
+        return relation, (nested_serializer, Field())
+
     @classmethod
     def from_model(
         cls,
@@ -98,7 +265,7 @@ class ModelSerializerBuilder:
         /,
         *,
         fields_getter: _FieldGetter = default_get_fields,
-        field_mapper: _FieldMapper = FieldMapper(),
+        field_mapper: _FieldMapper = default_field_mapper,
     ) -> Self:
         """
         Create a new instance of the serializer builder from a Django model.
@@ -106,7 +273,7 @@ class ModelSerializerBuilder:
         Args:
             model (type[DjangoModel]): The Django model to create the serializer for.
             fields_getter (_FieldGetter, optional): A function that returns the fields to include in the serializer. Defaults to default_get_fields.
-            field_mapper (_FieldMapper, optional): A mapper that maps Django fields to Pydantic fields. Defaults to FieldMapper().
+            field_mapper (_FieldMapper, optional): A mapper that maps Django fields to Pydantic fields. Defaults to the shared default FieldMapper.
 
         Returns:
             Self: A new instance of the serializer builder.
@@ -0,0 +1,155 @@
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from dataclasses import field as DataclassField
+from typing import Any, Callable, Hashable
+
+from django.db.models import Model as DjangoModel
+
+logger = logging.getLogger(__name__)
+
+
+####################
+#    CONSTANTS     #
+####################
+
+DEFAULT_CACHE_SIZE = 256
+
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """
+    Statistics about a SerializerCache.
+
+    Attributes:
+        hits (int): The number of lookups that returned a cached serializer class.
+        misses (int): The number of lookups that had to build a new serializer class.
+        maxsize (int): The maximum number of cached serializer classes.
+        currsize (int): The number of serializer classes currently cached.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+@dataclass(eq=False)
+class SerializerCache:
+    """
+    A thread-safe, bounded LRU cache of built serializer classes.
+
+    Keys are tuples whose first item is the Django model the serializer was built for,
+    so that all the entries of a model can be invalidated at once.
+
+    Attributes:
+        maxsize (int): The maximum number of serializer classes to keep. Defaults to 256.
+    """
+
+    maxsize: int = DEFAULT_CACHE_SIZE
+    _entries: OrderedDict = DataclassField(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = DataclassField(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _hits: int = DataclassField(default=0, init=False)
+    _misses: int = DataclassField(default=0, init=False)
+
+    def get_or_build(
+        self, key: tuple[Hashable, ...], factory: Callable[[], Any]
+    ) -> Any:
+        """
+        Returns the cached value for the given key, building it with `factory` on a miss.
+
+        Args:
+            key (tuple): The cache key. Its first item must be the Django model.
+            factory (Callable[[], Any]): A function that builds the value.
+
+        Returns:
+            Any: The cached or newly built value.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return value
+            self._misses += 1
+
+        # Build outside of the lock: schema compilation is slow and may itself
+        # build other serializers.
+        value = factory()
+
+        with self._lock:
+            value = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, model: type[DjangoModel] | None = None) -> int:
+        """
+        Removes cached entries.
+
+        Args:
+            model (type[DjangoModel] | None, optional): Only remove the entries built for this model. Defaults to None (remove everything).
+
+        Returns:
+            int: The number of removed entries.
+        """
+        with self._lock:
+            if model is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            keys = [key for key in self._entries if key[0] is model]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Removes all the cached entries and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+
+    def info(self) -> CacheInfo:
+        """
+        Returns the cache statistics.
+
+        Returns:
+            CacheInfo: The current hits, misses and sizes of the cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self):
+        # Caches are process local: the shared cache unpickles as the shared cache of
+        # the receiving process, other caches as new empty ones.
+        if self is serializer_cache:
+            return "serializer_cache"
+        return (self.__class__, (self.maxsize,))
+
+
+####################
+#     INSTANCES    #
+####################
+
+serializer_cache = SerializerCache()
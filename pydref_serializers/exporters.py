@@ -0,0 +1,241 @@
+import logging
+import math
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field as DataclassField
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO
+
+from django.db import connections
+from django.db.models import Max, Min, QuerySet
+from django.db.models.sql import Query
+
+from .builders import ModelSerializerBuilder
+from .serializers import DEFAULT_CHUNK_SIZE, _iter_chunks
+
+logger = logging.getLogger(__name__)
+
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(frozen=True)
+class Partition:
+    """
+    A primary key range of a queryset.
+
+    Attributes:
+        index (int): The position of the partition in the export.
+        start (int): The first primary key of the partition (inclusive).
+        stop (int): The last primary key of the partition (exclusive).
+    """
+
+    index: int
+    start: int
+    stop: int
+
+
+@dataclass
+class ExportResult:
+    """
+    The outcome of an export.
+
+    Attributes:
+        rows (int): The number of exported rows.
+        paths (list[Path]): The per-partition files, when exporting to a directory.
+    """
+
+    rows: int = 0
+    paths: list[Path] = DataclassField(default_factory=list)
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def partition_by_pk(queryset: QuerySet, partitions: int) -> list[Partition]:
+    """
+    Splits a queryset into contiguous primary key ranges of (roughly) equal width.
+
+    Args:
+        queryset (QuerySet): The queryset to split. Its model must have an integer primary key.
+        partitions (int): The number of partitions.
+
+    Returns:
+        list[Partition]: The partitions, in primary key order. Empty if the queryset is empty.
+
+    Raises:
+        ValueError: If the number of partitions is not positive or the primary key is not an integer.
+    """
+    if partitions < 1:
+        raise ValueError("partitions must be a positive integer")
+    bounds = queryset.aggregate(start=Min("pk"), stop=Max("pk"))
+    start, last = bounds["start"], bounds["stop"]
+    if start is None:
+        return []
+    if not isinstance(start, int) or not isinstance(last, int):
+        raise ValueError("Only querysets with integer primary keys can be partitioned")
+    width = max(math.ceil((last - start + 1) / partitions), 1)
+    return [
+        Partition(index=index, start=lower, stop=min(lower + width, last + 1))
+        for index, lower in enumerate(range(start, last + 1, width))
+    ]
+
+
+def _init_worker() -> None:
+    # Spawned workers start with a fresh interpreter: set Django up from the
+    # DJANGO_SETTINGS_MODULE inherited from the parent process.
+    from django.apps import apps
+
+    if not apps.ready:
+        import django
+
+        django.setup()
+
+
+def _export_partition(
+    builder: ModelSerializerBuilder,
+    partial: bool,
+    query: Query,
+    partition: Partition,
+    chunk_size: int,
+    trusted: bool,
+    path: Path | None,
+) -> tuple[bytes | Path, int]:
+    """
+    Serializes one partition. Runs in a worker process, with its own DB connection.
+
+    Returns:
+        tuple[bytes | Path, int]: The written file, or the comma separated JSON items when
+        no path is given, and the number of rows.
+    """
+    serializer = builder.build(partial=partial)
+    dump_json = serializer.json_dumper(serializer.list_adapter().dump_json)
+    queryset = builder.model._default_manager.all()
+    queryset.query = query
+    queryset = queryset.filter(pk__gte=partition.start, pk__lt=partition.stop)
+
+    rows = 0
+    parts = []
+    try:
+        queryset = serializer.prepare_queryset(queryset.order_by("pk"))
+        for chunk in _iter_chunks(queryset, chunk_size):
+            instances = serializer.from_models(chunk, trusted=trusted)
+            parts.append(dump_json(instances)[1:-1])
+            rows += len(chunk)
+    finally:
+        connections.close_all()
+
+    data = b",".join(parts)
+    if path is None:
+        return data, rows
+    path.write_bytes(b"[" + data + b"]")
+    return path, rows
+
+
+def export_queryset(
+    builder: ModelSerializerBuilder,
+    queryset: QuerySet,
+    *,
+    output: BinaryIO | None = None,
+    output_dir: str | Path | None = None,
+    workers: int | None = None,
+    partitions: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    partial: bool = False,
+    trusted: bool = False,
+    executor: Executor | None = None,
+) -> ExportResult:
+    """
+    Serializes a (huge) queryset in parallel, split in primary key ranges.
+
+    Every partition is serialized in a worker process, which rebuilds the serializer
+    class from the (pickled) builder and opens its own database connection. The
+    builder must therefore be picklable: its fields getter and field mapper must be
+    importable, not lambdas.
+
+    Args:
+        builder (ModelSerializerBuilder): The builder of the serializer to use.
+        queryset (QuerySet): The rows to export. It must not be sliced.
+        output (BinaryIO | None): A binary file receiving a single JSON array, written in primary key order.
+        output_dir (str | Path | None): A directory receiving one JSON array file per partition.
+        workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+        partitions (int | None, optional): The number of primary key ranges. Defaults to 4 per worker, which bounds the data each worker sends back at once. At most 2 ranges per worker are submitted at once, which bounds the results held in memory.
+        chunk_size (int, optional): The number of rows serialized at once. Defaults to 2000.
+        partial (bool, optional): Whether to build a partial serializer. Defaults to False.
+        trusted (bool, optional): Whether to skip validation because the rows come from a trusted source. Defaults to False.
+        executor (Executor | None, optional): The executor running the partitions. Defaults to a new `ProcessPoolExecutor`.
+
+    Returns:
+        ExportResult: The number of exported rows and the written files.
+
+    Raises:
+        ValueError: If not exactly one of `output` and `output_dir` is given, or the queryset is sliced.
+    """
+    if (output is None) == (output_dir is None):
+        raise ValueError("Exactly one of output and output_dir must be specified")
+    if queryset.query.is_sliced:
+        raise ValueError("Sliced querysets cannot be partitioned")
+    workers = workers or multiprocessing.cpu_count()
+    ranges = partition_by_pk(queryset, partitions or workers * 4)
+    directory = Path(output_dir) if output_dir is not None else None
+    if directory is not None:
+        directory.mkdir(parents=True, exist_ok=True)
+
+    # Forked workers must not reuse the parent connections.
+    connections.close_all()
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker)
+
+    def submit(partition: Partition) -> Future:
+        return executor.submit(
+            _export_partition,
+            builder,
+            partial,
+            queryset.query,
+            partition,
+            chunk_size,
+            trusted,
+            directory / f"part-{partition.index:05d}.json" if directory else None,
+        )
+
+    result = ExportResult()
+    pending = iter(ranges)
+    futures: deque[Future] = deque()
+    try:
+        # Only a few partitions per worker are in flight at once: the finished ones
+        # wait in memory until the previous partitions are written.
+        futures.extend(submit(partition) for partition in islice(pending, workers * 2))
+        if output is not None:
+            output.write(b"[")
+        separator = b""
+        # Consume the results in submission order so the output stays sorted.
+        while futures:
+            data, rows = futures.popleft().result()
+            partition = next(pending, None)
+            if partition is not None:
+                futures.append(submit(partition))
+            result.rows += rows
+            if directory is not None:
+                result.paths.append(data)
+            elif rows:
+                output.write(separator + data)
+                separator = b","
+        if output is not None:
+            output.write(b"]")
+    finally:
+        # Partitions left after an error are not exported.
+        for future in futures:
+            future.cancel()
+        if own_executor:
+            executor.shutdown()
+
+    logger.debug(f"Exported {result.rows} rows in {len(ranges)} partitions")
+    return result
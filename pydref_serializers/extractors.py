@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from dataclasses import field as DataclassField
+from operator import attrgetter
+from typing import Any, Callable, Collection
+
+from django.db.models import Field as DjangoField
+from django.db.models import Model as DjangoModel
+
+from .relations import Relation
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(frozen=True)
+class ModelExtractor:
+    """
+    A precompiled replacement for `django.forms.models.model_to_dict`.
+
+    It reads exactly the fields declared by a serializer, using their `attname`
+    (so foreign keys are read from `<name>_id` without hitting the database), and
+    then the nested relations.
+
+    Attributes:
+        names (tuple[str, ...]): The serializer field names, in extraction order.
+        attnames (tuple[str, ...]): The model attributes holding the value of each field.
+        relations (tuple[Relation, ...]): The nested relations of the serializer.
+    """
+
+    names: tuple[str, ...]
+    attnames: tuple[str, ...]
+    relations: tuple[Relation, ...] = ()
+    _getter: Callable[[DjangoModel], Any] = DataclassField(
+        init=False, repr=False, compare=False
+    )
+    _attname_set: frozenset[str] = DataclassField(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if len(self.attnames) != len(self.names):
+            raise ValueError("names and attnames must have the same length")
+        if not self.attnames:
+            getter = _get_nothing
+        elif len(self.attnames) == 1:
+            # attrgetter returns a bare value (not a tuple) for a single attribute.
+            getter = _tuple_getter(self.attnames[0])
+        else:
+            getter = attrgetter(*self.attnames)
+        object.__setattr__(self, "_getter", getter)
+        object.__setattr__(self, "_attname_set", frozenset(self.attnames))
+
+    @classmethod
+    def from_fields(
+        cls, fields: Collection[DjangoField], relations: Collection[Relation] = ()
+    ) -> "ModelExtractor":
+        """
+        Creates an extractor for the given Django model fields.
+
+        Args:
+            fields (Collection[DjangoField]): The Django fields declared by the serializer.
+            relations (Collection[Relation], optional): The nested relations of the serializer. Defaults to none.
+
+        Returns:
+            ModelExtractor: The extractor reading those fields.
+        """
+        return cls(
+            names=tuple(field.name for field in fields),
+            attnames=tuple(field.get_attname() for field in fields),
+            relations=tuple(relations),
+        )
+
+    def __call__(self, obj: DjangoModel) -> dict[str, Any]:
+        """
+        Extracts the declared field values of a Django model instance.
+
+        Args:
+            obj (DjangoModel): The Django model instance.
+
+        Returns:
+            dict[str, Any]: A dictionary mapping the serializer field names to their values.
+        """
+        data = dict(zip(self.names, self._getter(obj)))
+        for relation in self.relations:
+            data[relation.name] = relation.extract(obj)
+        return data
+
+    def deferred_attnames(self, obj: DjangoModel) -> set[str]:
+        """
+        Returns the attributes read by the extractor that are deferred in a model instance.
+
+        Args:
+            obj (DjangoModel): The Django model instance.
+
+        Returns:
+            set[str]: The deferred attnames. Reading each of them costs a query.
+        """
+        # Django stores the loaded field values in the instance __dict__.
+        loaded = obj.__dict__
+        if loaded.keys() >= self._attname_set:
+            return set()
+        return {attname for attname in self.attnames if attname not in loaded}
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def _get_nothing(obj: DjangoModel) -> tuple:
+    return ()
+
+
+def _tuple_getter(attname: str) -> Callable[[DjangoModel], tuple]:
+    def getter(obj: DjangoModel) -> tuple:
+        return (getattr(obj, attname),)
+
+    return getter
@@ -0,0 +1,251 @@
+from dataclasses import dataclass
+from functools import partial
+from time import perf_counter
+from typing import TYPE_CHECKING, Annotated, Any, Iterable, Literal
+
+from django.db.models import Model as DjangoModel
+from django.db.models import QuerySet
+from pydantic import TypeAdapter, ValidationError
+from pydantic.fields import FieldInfo
+from typing_extensions import TypedDict
+
+from .extractors import ModelExtractor
+from .observers import SerializationEvent, get_observer
+from .relations import QueryPlan
+
+if TYPE_CHECKING:
+    from .serializers import ModelSerializer
+
+
+####################
+#    CONSTANTS     #
+####################
+
+# The number of compiled field sets kept per serializer class. Field sets usually
+# come from request parameters, so the cache must not grow without bound.
+MAX_FIELDSETS = 256
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def resolve_fieldset(
+    serializer: "type[ModelSerializer]",
+    include: Iterable[str] | None = None,
+    exclude: Iterable[str] | None = None,
+) -> tuple[str, ...]:
+    """
+    Returns the serializer fields selected by an include/exclude mask, in declaration order.
+
+    Args:
+        serializer (type[ModelSerializer]): The serializer class.
+        include (Iterable[str] | None, optional): The fields to keep. Defaults to None (all the fields).
+        exclude (Iterable[str] | None, optional): The fields to drop. Defaults to None.
+
+    Returns:
+        tuple[str, ...]: The selected field names.
+
+    Raises:
+        ValueError: If the serializer was not built by the builder, or a field is unknown.
+    """
+    config = getattr(serializer, "config", None) or {}
+    extractor = config.get("extractor")
+    if extractor is None:
+        raise ValueError(
+            f"{serializer.__name__} cannot select fields at runtime: "
+            "only built serializers can"
+        )
+    available = tuple(serializer.model_fields)
+    include = set(available if include is None else include)
+    exclude = set(exclude or ())
+    unknown = (include | exclude) - set(available)
+    if unknown:
+        raise ValueError(
+            f"Unknown fields of {serializer.__name__}: {', '.join(sorted(unknown))}"
+        )
+    return tuple(name for name in available if name in include and name not in exclude)
+
+
+def _annotation(field_info: FieldInfo) -> Any:
+    # The constraints of a serializer field live in its metadata (e.g. `MaxLen`).
+    if not field_info.metadata:
+        return field_info.annotation
+    return Annotated[(field_info.annotation, *field_info.metadata)]
+
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(frozen=True)
+class FieldSet:
+    """
+    A compiled projection of a serializer on a subset of its fields.
+
+    Returned by `ModelSerializer.fieldset`. Only the selected fields are loaded,
+    extracted, validated and dumped, with the same types and constraints as the
+    serializer, so one serializer class serves every projection (e.g. the
+    `?fields=a,b,c` parameter of an API).
+
+    Attributes:
+        serializer (type[ModelSerializer]): The projected serializer class.
+        names (tuple[str, ...]): The selected fields, in declaration order.
+        extractor (ModelExtractor): The extractor reading only the selected fields.
+        adapter (TypeAdapter): The adapter validating and dumping lists of projected rows.
+        query_plan (QueryPlan): The lookups loading only the selected fields (and relations).
+    """
+
+    serializer: "type[ModelSerializer]"
+    names: tuple[str, ...]
+    extractor: ModelExtractor
+    adapter: TypeAdapter
+    query_plan: QueryPlan
+
+    @classmethod
+    def compile(
+        cls, serializer: "type[ModelSerializer]", names: tuple[str, ...]
+    ) -> "FieldSet":
+        """
+        Compiles the projection of a serializer on the given fields.
+
+        Args:
+            serializer (type[ModelSerializer]): The built serializer class.
+            names (tuple[str, ...]): The selected fields (see `resolve_fieldset`).
+
+        Returns:
+            FieldSet: The compiled projection.
+        """
+        config = serializer.config
+        extractor = config["extractor"]
+        selected = set(names)
+        attnames = {
+            name: attname
+            for name, attname in zip(extractor.names, extractor.attnames)
+            if name in selected
+        }
+        relations = tuple(
+            relation for relation in extractor.relations if relation.name in selected
+        )
+        fields = serializer.model_fields
+        row_type = TypedDict(
+            f"{serializer.__name__}FieldSet",
+            {name: _annotation(fields[name]) for name in names},
+        )
+        return cls(
+            serializer=serializer,
+            names=names,
+            extractor=ModelExtractor(
+                names=tuple(attnames),
+                attnames=tuple(attnames.values()),
+                relations=relations,
+            ),
+            adapter=TypeAdapter(list[row_type]),
+            query_plan=QueryPlan.from_relations(
+                relations, only=(config["model"]._meta.pk.name, *attnames)
+            ),
+        )
+
+    def prepare_queryset(self, queryset: QuerySet) -> QuerySet:
+        """
+        Restricts a queryset to the selected fields and prefetches the selected relations.
+
+        Args:
+            queryset (QuerySet): The queryset to serialize.
+
+        Returns:
+            QuerySet: The prepared queryset.
+        """
+        return self.query_plan.apply(queryset)
+
+    def from_model(self, obj: DjangoModel) -> dict[str, Any]:
+        """
+        Extracts, validates and dumps the selected fields of a model instance.
+
+        Args:
+            obj (DjangoModel): The Django model instance.
+
+        Returns:
+            dict[str, Any]: The selected fields, as `model_dump` would dump them.
+        """
+        return self._convert([obj], "fieldset.from_model", "python")[0]
+
+    def from_models(
+        self,
+        objs: Iterable[DjangoModel],
+        *,
+        as_json: bool = False,
+        mode: Literal["python", "json"] = "python",
+    ) -> list[dict[str, Any]] | bytes:
+        """
+        Extracts, validates and dumps the selected fields of many model instances at once.
+
+        Args:
+            objs (Iterable[DjangoModel]): The Django model instances.
+            as_json (bool, optional): Whether to dump the rows to a JSON array. Defaults to False.
+            mode (str, optional): The mode of the dumped dictionaries, as in `model_dump`: with `"json"`, they only hold JSON compatible values (e.g. to be embedded in a larger document). Defaults to `"python"`.
+
+        Returns:
+            list[dict[str, Any]] | bytes: The dumped rows, in input order.
+        """
+        if as_json:
+            dump = "json"
+        else:
+            dump = "json-compatible" if mode == "json" else "python"
+        return self._convert(objs, "fieldset.from_models", dump)
+
+    def from_queryset(
+        self, queryset: QuerySet, *, as_json: bool = False
+    ) -> list[dict[str, Any]] | bytes:
+        """
+        Evaluates a queryset loading only the selected fields and converts its rows.
+
+        Args:
+            queryset (QuerySet): The queryset to evaluate.
+            as_json (bool, optional): Whether to dump the rows to a JSON array. Defaults to False.
+
+        Returns:
+            list[dict[str, Any]] | bytes: The dumped rows, in queryset order.
+        """
+        return self._convert(
+            self.prepare_queryset(queryset),
+            "fieldset.from_queryset",
+            "json" if as_json else "python",
+        )
+
+    def _convert(self, objs: Iterable[DjangoModel], operation: str, dump: str) -> Any:
+        observer = get_observer()
+        start = perf_counter() if observer is not None else 0.0
+        rows = list(map(self.extractor, objs))
+        extracted = perf_counter() if observer is not None else 0.0
+        try:
+            validated = self.adapter.validate_python(rows)
+        except ValidationError as error:
+            if observer is not None:
+                observer.on_validation_error(self.serializer, operation, error)
+            raise
+        if dump == "json":
+            dump_function = self.serializer.json_dumper(self.adapter.dump_json)
+        elif dump == "json-compatible":
+            # Python objects holding only JSON types, e.g. to be embedded in a document.
+            dump_function = partial(self.adapter.dump_python, mode="json")
+        else:
+            dump_function = self.adapter.dump_python
+        if observer is None:
+            return dump_function(validated)
+
+        validated_at = perf_counter()
+        dumped = dump_function(validated)
+        observer.on_serialize(
+            SerializationEvent(
+                self.serializer,
+                operation,
+                len(rows),
+                extract_seconds=extracted - start,
+                validate_seconds=validated_at - extracted,
+                dump_seconds=perf_counter() - validated_at,
+            )
+        )
+        return dumped
@@ -0,0 +1,201 @@
+import json
+from collections import defaultdict
+from dataclasses import dataclass
+from dataclasses import field as DataclassField
+from itertools import islice
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
+
+from django.db import transaction
+from django.db.models import Model as DjangoModel
+from pydantic import ValidationError
+
+from .observers import SerializationEvent, get_observer
+
+if TYPE_CHECKING:
+    from .serializers import ModelSerializer
+
+
+####################
+#    CONSTANTS     #
+####################
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def _iter_batches(
+    payloads: Iterable[Any], batch_size: int
+) -> Iterator[tuple[int, list[Any]]]:
+    """
+    Yields the batches of at most `batch_size` payloads, with the index of their first payload.
+    """
+    payloads = iter(payloads)
+    offset = 0
+    while batch := list(islice(payloads, batch_size)):
+        yield offset, batch
+        offset += len(batch)
+
+
+def _validate_batch(
+    serializer: "type[ModelSerializer]", rows: list[Any], offset: int
+) -> tuple[list["ModelSerializer"], list["RowError"]]:
+    """
+    Validates a batch of payloads, separating the valid rows from the invalid ones.
+
+    The batch is validated at once with the list adapter of the serializer. When some
+    rows are invalid, the errors are collected by row and the valid rows are
+    validated again, at once too.
+
+    Args:
+        serializer (type[ModelSerializer]): The serializer class.
+        rows (list[Any]): The payloads of the batch.
+        offset (int): The index of the first payload of the batch.
+
+    Returns:
+        tuple[list[ModelSerializer], list[RowError]]: The serializers of the valid rows, and the errors of the invalid ones.
+    """
+    observer = get_observer()
+    start = perf_counter() if observer is not None else 0.0
+    adapter = serializer.list_adapter()
+    row_errors = []
+    try:
+        instances = adapter.validate_python(rows)
+    except ValidationError as error:
+        if observer is not None:
+            observer.on_validation_error(serializer, "bulk_ingest", error)
+        errors_by_row = defaultdict(list)
+        for details in error.errors():
+            index, *loc = details["loc"]
+            errors_by_row[index].append({**details, "loc": tuple(loc)})
+        instances = adapter.validate_python(
+            [row for index, row in enumerate(rows) if index not in errors_by_row]
+        )
+        row_errors = [
+            RowError(offset + index, errors)
+            for index, errors in sorted(errors_by_row.items())
+        ]
+    if observer is not None:
+        observer.on_serialize(
+            SerializationEvent(
+                serializer,
+                "bulk_ingest",
+                len(instances),
+                validate_seconds=perf_counter() - start,
+            )
+        )
+    return instances, row_errors
+
+
+def bulk_ingest(
+    serializer: "type[ModelSerializer]",
+    payloads: Iterable[Any] | str | bytes,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    key: str | None = None,
+    using: str | None = None,
+) -> "IngestResult":
+    """
+    Validates payloads in batches and saves the valid ones with `bulk_create`/`bulk_update`.
+
+    See `ModelSerializer.bulk_ingest`.
+    """
+    if isinstance(payloads, (str, bytes, bytearray)):
+        payloads = json.loads(payloads)
+    config = serializer.config
+    model: type[DjangoModel] = config["model"]
+    if config.get("relations"):
+        raise ValueError(
+            f"{serializer.__name__} cannot ingest payloads: nested relations are not supported"
+        )
+    update_fields = [name for name in serializer.writable_attnames() if name != key]
+    extractor = config["extractor"]
+    attnames = dict(zip(extractor.names, extractor.attnames))
+    if key is not None and key not in attnames:
+        raise ValueError(f"Key {key} is not a field of {serializer.__name__}")
+
+    manager = model._default_manager.db_manager(using)
+    result = IngestResult()
+    with transaction.atomic(using=manager.db):
+        for offset, batch in _iter_batches(payloads, batch_size):
+            instances, errors = _validate_batch(serializer, batch, offset)
+            result.errors.extend(errors)
+            objs = [instance.to_model() for instance in instances]
+            to_create, to_update = objs, []
+            if key is not None and objs:
+                key_attname = attnames[key]
+                # The last payload of a key wins: creating both would violate its
+                # unique constraint.
+                by_key = {getattr(obj, key_attname): obj for obj in objs}
+                result.duplicates += len(objs) - len(by_key)
+                objs = list(by_key.values())
+                existing = dict(
+                    manager.filter(**{f"{key}__in": list(by_key)}).values_list(
+                        key, "pk"
+                    )
+                )
+                to_create = []
+                for obj in objs:
+                    pk = existing.get(getattr(obj, key_attname))
+                    if pk is None:
+                        to_create.append(obj)
+                        continue
+                    obj.pk = pk
+                    obj._state.adding = False
+                    obj._state.db = manager.db
+                    to_update.append(obj)
+            if to_create:
+                manager.bulk_create(to_create, batch_size=batch_size)
+                result.created += len(to_create)
+            if to_update and update_fields:
+                manager.bulk_update(to_update, update_fields, batch_size=batch_size)
+            result.updated += len(to_update)
+    return result
+
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(frozen=True)
+class RowError:
+    """
+    The validation errors of one ingested payload.
+
+    Attributes:
+        index (int): The position of the payload in the ingested payloads.
+        errors (list[dict[str, Any]]): The pydantic error details, located relative to the payload.
+    """
+
+    index: int
+    errors: list[dict[str, Any]]
+
+
+@dataclass
+class IngestResult:
+    """
+    The outcome of `ModelSerializer.bulk_ingest`.
+
+    Attributes:
+        created (int): The number of created rows.
+        updated (int): The number of updated rows (matched by key).
+        duplicates (int): The number of payloads skipped because a later payload of the same batch has the same key.
+        errors (list[RowError]): The payloads that failed validation and were skipped.
+    """
+
+    created: int = 0
+    updated: int = 0
+    duplicates: int = 0
+    errors: list[RowError] = DataclassField(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every payload was saved.
+        """
+        return not self.errors
@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from ...registry import (
+    DEFAULT_WARMUP_MODULES,
+    autodiscover_serializers,
+    serializer_registry,
+)
+
+
+class Command(BaseCommand):
+    """
+    Checks that the schema of every deferred serializer compiles, e.g. in CI.
+
+    The schemas are compiled in the process of the command, which exits right after:
+    it does not warm up the serving processes. Enable the `PYDREF_WARMUP` setting
+    for that.
+    """
+
+    help = (
+        "Imports the serializer modules of the installed apps and checks that the "
+        "schema of every serializer built with defer=True compiles. It does not warm "
+        "up the serving processes: use the PYDREF_WARMUP setting for that."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--module",
+            action="append",
+            dest="modules",
+            help="Module of each installed app to import (repeatable). Defaults to PYDREF_WARMUP_MODULES or 'serializers'.",
+        )
+
+    def handle(self, *args, modules=None, **options):
+        autodiscover_serializers(
+            modules
+            or getattr(settings, "PYDREF_WARMUP_MODULES", DEFAULT_WARMUP_MODULES)
+        )
+        result = serializer_registry.warmup()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Compiled {result.compiled} of {result.total} serializers "
+                f"in {result.seconds:.3f}s"
+            )
+        )
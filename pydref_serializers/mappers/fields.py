@@ -1,14 +1,18 @@
 import logging
+import threading
+from collections import OrderedDict, UserDict
+from copy import copy
 from dataclasses import dataclass
 from dataclasses import field as DataclassField
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Callable, Dict, Tuple
+from importlib import import_module
+from typing import Any, Callable, Dict, MutableMapping, Tuple
 from uuid import UUID
 
 from django.db.models import Field as DjangoField
-from pydantic import AnyUrl, EmailStr, Field, FilePath, IPvAnyAddress, Json, PositiveInt
+from pydantic import Field, FilePath, Json, PositiveInt
 
 logger = logging.getLogger(__name__)
 
@@ -20,48 +24,132 @@ logger = logging.getLogger(__name__)
 _FieldMapper = Callable[[DjangoField, bool], Tuple[type, Any]]
 
 
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(frozen=True)
+class LazyImport:
+    """
+    A reference to an object imported only when it is first needed.
+
+    Attributes:
+        module (str): The module defining the object.
+        name (str): The name of the object in the module.
+    """
+
+    module: str
+    name: str
+
+    def resolve(self) -> Any:
+        """
+        Imports and returns the referenced object.
+
+        Returns:
+            Any: The object.
+        """
+        return getattr(import_module(self.module), self.name)
+
+
+class LazyFieldMap(UserDict):
+    """
+    A field map whose `LazyImport` values are imported on first access.
+
+    Field types needing heavy or optional dependencies (e.g. the network types of
+    pydantic, which need `email_validator`) are only imported when a model field
+    mapped to them is. Copies keep the values that were not resolved yet lazy.
+    """
+
+    def __getitem__(self, key):
+        value = self.data[key]
+        if isinstance(value, LazyImport):
+            value = self.data[key] = value.resolve()
+        return value
+
+
 ####################
 #    CONSTANTS     #
 ####################
 
-DJANGO_FIELD_MAP = {
-    # Numerical related fields
-    "AutoField": int,
-    "BigAutoField": int,
-    "IntegerField": int,
-    "SmallIntegerField": int,
-    "BigIntegerField": int,
-    "PositiveIntegerField": PositiveInt,
-    "PositiveSmallIntegerField": PositiveInt,
-    "FloatField": float,
-    "DecimalField": Decimal,
-    # String related fields
-    "CharField": str,
-    "TextField": str,
-    "SlugField": str,
-    "EmailField": EmailStr,
-    "URLField": AnyUrl,
-    "FilePathField": FilePath,
-    "FileField": FilePath,
-    "ImageField": FilePath,
-    # Other built-in fields
-    "BooleanField": bool,
-    "BinaryField": bytes,
-    "DateField": date,
-    "DateTimeField": datetime,
-    "DurationField": timedelta,
-    "TimeField": time,
-    "UUIDField": UUID,
-    "GenericIPAddressField": IPvAnyAddress,
-    "JSONField": Json,
-}
+DJANGO_FIELD_MAP = LazyFieldMap(
+    {
+        # Numerical related fields
+        "AutoField": int,
+        "BigAutoField": int,
+        "IntegerField": int,
+        "SmallIntegerField": int,
+        "BigIntegerField": int,
+        "PositiveIntegerField": PositiveInt,
+        "PositiveSmallIntegerField": PositiveInt,
+        "FloatField": float,
+        "DecimalField": Decimal,
+        # String related fields
+        "CharField": str,
+        "TextField": str,
+        "SlugField": str,
+        "EmailField": LazyImport("pydantic", "EmailStr"),
+        "URLField": LazyImport("pydantic", "AnyUrl"),
+        "FilePathField": FilePath,
+        "FileField": FilePath,
+        "ImageField": FilePath,
+        # Other built-in fields
+        "BooleanField": bool,
+        "BinaryField": bytes,
+        "DateField": date,
+        "DateTimeField": datetime,
+        "DurationField": timedelta,
+        "TimeField": time,
+        "UUIDField": UUID,
+        "GenericIPAddressField": LazyImport("pydantic", "IPvAnyAddress"),
+        "JSONField": Json,
+    }
+)
+
+
+# The number of distinct field definitions whose mapping is memoized per mapper.
+MAX_MAPPED_FIELDS = 1024
+
+# Enums generated for fields with choices, interned by (name, choices).
+_CHOICES_ENUMS: Dict[Tuple[str, Tuple], type[Enum]] = {}
+_CHOICES_ENUMS_LOCK = threading.Lock()
 
 
 ####################
-#      CLASSES     #
+#    FUNCTIONS     #
 ####################
 
 
+def get_choices_enum(name: str, choices) -> type[Enum]:
+    """
+    Returns the Enum for the given choices, creating it only the first time.
+
+    Enums are interned by name and choices, so fields sharing a choice set (e.g. the
+    `status` field of many models) share one Enum class, however many serializers
+    are built.
+
+    Args:
+        name (str): The name of the Enum.
+        choices: The Django field choices, as (value, label) pairs.
+
+    Returns:
+        type[Enum]: The Enum whose members are named after the labels and hold the values.
+    """
+    members = [(choice[1], choice[0]) for choice in choices]
+    try:
+        key = (name, tuple(members))
+        hash(key)
+    except TypeError:
+        return Enum(name, members)
+    enum_type = _CHOICES_ENUMS.get(key)
+    if enum_type is None:
+        with _CHOICES_ENUMS_LOCK:
+            enum_type = _CHOICES_ENUMS.get(key)
+            if enum_type is None:
+                enum_type = _CHOICES_ENUMS[key] = Enum(name, members)
+    return enum_type
+
+
 class NOT_PROVIDED:
     pass
 
@@ -93,20 +181,89 @@ class FieldDescriptor:
     validators: list[Callable] | None = None
 
 
-@dataclass
+@dataclass(eq=False)
 class FieldMapper:
     """
     A class that maps Django model fields to Pydantic fields.
 
     Attributes:
     -----------
-    fields_map : Dict[str, Any]
-        A dictionary that maps Django field types to Pydantic field types.
+    fields_map : MutableMapping[str | type, Any]
+        A mapping that maps Django field types (by class or by class name) to Pydantic field types.
+
+    Field classes are resolved to the mapping of their closest mapped ancestor in the
+    MRO (e.g. a custom `MoneyField(DecimalField)` maps like `DecimalField`), and the
+    resolution is cached per class. The mapping of each distinct field definition is
+    memoized too (the `MAX_MAPPED_FIELDS` most recently used ones), so repeated builds
+    of the same models do not map (nor create choice Enums for) their fields again.
     """
 
-    fields_map: Dict[str, Any] = DataclassField(
+    fields_map: MutableMapping[str | type, Any] = DataclassField(
         default_factory=lambda: DJANGO_FIELD_MAP
     )
+    _resolved_types: Dict[type, Any] = DataclassField(
+        default_factory=dict, init=False, repr=False
+    )
+    _cache: "OrderedDict[Tuple, Tuple[type, Dict[str, Any]]]" = DataclassField(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = DataclassField(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _version: int = DataclassField(default=0, init=False, repr=False)
+
+    @property
+    def version(self) -> int:
+        """
+        The number of times the mapping was changed with `register`.
+        """
+        return self._version
+
+    def register(self, django_field_type: str | type[DjangoField], pydantic_type: Any):
+        """
+        Maps a Django field type (and, unless mapped themselves, its subclasses) to a Pydantic type.
+
+        The fields map is copied before being changed, so other mappers sharing it
+        (e.g. through the default `DJANGO_FIELD_MAP`) are not affected.
+
+        Args:
+            django_field_type (str | type[DjangoField]): The Django field class, or its class name.
+            pydantic_type (Any): The Pydantic type (or annotation) to map it to.
+        """
+        fields_map = copy(self.fields_map)
+        fields_map[django_field_type] = pydantic_type
+        self.fields_map = fields_map
+        self._resolved_types = {}
+        self._cache = OrderedDict()
+        self._version += 1
+
+    def _resolve_type(self, django_field_type: type) -> Any:
+        """
+        Returns the Pydantic type mapped to a Django field class or its closest mapped ancestor.
+
+        Args:
+            django_field_type (type): The Django field class.
+
+        Returns:
+            Any: The Pydantic type, or `Any` if no class in the MRO is mapped.
+        """
+        pydantic_type = self._resolved_types.get(django_field_type)
+        if pydantic_type is None:
+            pydantic_type = next(
+                (
+                    mapped
+                    for klass in getattr(django_field_type, "__mro__", ())
+                    if (mapped := self.fields_map.get(klass))
+                    or (mapped := self.fields_map.get(klass.__name__))
+                ),
+                None,
+            )
+            if not pydantic_type:
+                # Logged once per class, since the resolution is cached.
+                logger.warning(f"Field {django_field_type} is not supported")
+                pydantic_type = Any
+            self._resolved_types[django_field_type] = pydantic_type
+        return pydantic_type
 
     def _get_field_descriptor(
         self, field: DjangoField, *, partial=False
@@ -158,11 +315,7 @@ class FieldMapper:
         type
             The Pydantic field type for the given FieldDescriptor.
         """
-        pydantic_type = self.fields_map.get(fd.django_field_type.__name__)
-        if not pydantic_type:
-            logger.warning(f"Field {fd.django_field_type} is not supported")
-            pydantic_type = Any
-        return pydantic_type
+        return self._resolve_type(fd.django_field_type)
 
     def _get_pydantic_field(
         self, fd: FieldDescriptor, base_type: type
@@ -177,12 +330,25 @@ class FieldMapper:
         Returns:
             Tuple[type, Field]: A tuple containing the Pydantic type and field configuration for the field.
         """
+        pydantic_type, field_config = self._get_pydantic_type_and_config(fd, base_type)
+        return pydantic_type, Field(**field_config)
+
+    def _get_pydantic_type_and_config(
+        self, fd: FieldDescriptor, base_type: type
+    ) -> Tuple[type, Dict[str, Any]]:
+        """
+        Returns the Pydantic type and the keyword arguments of `Field` for a given field descriptor and base type.
+
+        Args:
+            fd (FieldDescriptor): The field descriptor for the field.
+            base_type (type): The base type of the field.
+
+        Returns:
+            Tuple[type, Dict[str, Any]]: A tuple containing the Pydantic type and the `Field` arguments for the field.
+        """
         pydantic_type = base_type
         if fd.choices:
-            pydantic_type = Enum(
-                f"{fd.name.title()}Enum",
-                [(choice[1], choice[0]) for choice in fd.choices],
-            )
+            pydantic_type = get_choices_enum(f"{fd.name.title()}Enum", fd.choices)
 
         field_config = {}
         if fd.allows_null:
@@ -194,11 +360,43 @@ class FieldMapper:
                 field_config["default_factory"] = fd.default
             else:
                 field_config["default"] = fd.default
-        if issubclass(base_type, str):
+        if (
+            not fd.choices
+            and isinstance(base_type, type)
+            and issubclass(base_type, str)
+        ):
             field_config["min_length"] = 0 if fd.allows_blank else 1
             if fd.max_length:
                 field_config["max_length"] = fd.max_length
-        return pydantic_type, Field(**field_config)
+        return pydantic_type, field_config
+
+    def _get_cache_key(self, field: DjangoField, partial: bool) -> Tuple | None:
+        """
+        Returns the key memoizing the mapping of a Django field.
+
+        Args:
+            field (DjangoField): The Django model field.
+            partial (bool): Whether the Pydantic field allows partial updates.
+
+        Returns:
+            Tuple | None: The key, or None if the field definition is not hashable.
+        """
+        choices = field.choices
+        key = (
+            field.__class__,
+            field.name,
+            tuple(map(tuple, choices)) if choices else None,
+            field.null,
+            field.blank,
+            field.max_length,
+            field.default,
+            partial,
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
 
     def __call__(self, field: DjangoField, *, partial=False) -> Tuple[type, Field]:
         """
@@ -211,6 +409,52 @@ class FieldMapper:
         Returns:
             A tuple containing the Pydantic type and field that correspond to the Django field.
         """
-        fd = self._get_field_descriptor(field, partial=partial)
-        pydantic_type = self._get_base_type(fd)
-        return self._get_pydantic_field(fd, pydantic_type)
+        key = self._get_cache_key(field, partial)
+        mapped = self._get_cached(key) if key is not None else None
+        if mapped is None:
+            fd = self._get_field_descriptor(field, partial=partial)
+            pydantic_type = self._get_base_type(fd)
+            mapped = self._get_pydantic_type_and_config(fd, pydantic_type)
+            if key is not None:
+                self._set_cached(key, mapped)
+        pydantic_type, field_config = mapped
+        # pydantic mutates the FieldInfo it receives, so a new one is built every time.
+        return pydantic_type, Field(**field_config)
+
+    def _get_cached(self, key: Tuple) -> Tuple[type, Dict[str, Any]] | None:
+        with self._lock:
+            mapped = self._cache.get(key)
+            if mapped is not None:
+                self._cache.move_to_end(key)
+            return mapped
+
+    def _set_cached(self, key: Tuple, mapped: Tuple[type, Dict[str, Any]]) -> None:
+        with self._lock:
+            self._cache[key] = mapped
+            self._cache.move_to_end(key)
+            if len(self._cache) > MAX_MAPPED_FIELDS:
+                self._cache.popitem(last=False)
+
+    def __getstate__(self):
+        # The memoized mappings hold generated Enums, which cannot be pickled.
+        state = self.__dict__.copy()
+        state["_cache"] = OrderedDict()
+        state["_resolved_types"] = {}
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state, _lock=threading.Lock())
+
+    def __reduce__(self):
+        # Keep the shared default mapper shared across processes.
+        if self is default_field_mapper:
+            return "default_field_mapper"
+        return super().__reduce__()
+
+
+####################
+#     INSTANCES    #
+####################
+
+default_field_mapper = FieldMapper()
@@ -0,0 +1,245 @@
+import base64
+import binascii
+import json
+import re
+import secrets
+from contextvars import ContextVar
+from typing import Any, Callable, TypeVar, get_args
+
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic_core import PydanticCustomError, core_schema
+
+from .fields import DJANGO_FIELD_MAP, FieldMapper, LazyFieldMap
+
+####################
+#      TYPES       #
+####################
+
+_Dumped = TypeVar("_Dumped", str, bytes)
+
+
+####################
+#      CLASSES     #
+####################
+
+
+class RawJSON:
+    """
+    A JSON document kept as text, e.g. the value of a `JSONField` read from the database.
+
+    In the passthrough mapping (see `passthrough_field_mapper`), `JSONField`s map
+    to RawJSON. `ModelSerializer.from_values` reads them as text straight from the
+    database, and the JSON dumps of the serializers splice the text verbatim into
+    their output, so the documents are neither decoded nor encoded again. Other values
+    (e.g. the decoded values of model instances, or request payloads) are encoded once
+    when validated. Python dumps keep the RawJSON values; `loads` decodes them.
+
+    Attributes:
+        data (str | bytes): The JSON text.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: str | bytes | bytearray | memoryview):
+        if isinstance(data, (bytearray, memoryview)):
+            data = bytes(data)
+        self.data = data
+
+    @classmethod
+    def from_value(cls, value: Any) -> "RawJSON":
+        """
+        Encodes a Python value.
+
+        Args:
+            value (Any): A JSON serializable value.
+
+        Returns:
+            RawJSON: The encoded value.
+        """
+        return cls(json.dumps(value, separators=(",", ":")))
+
+    def loads(self) -> Any:
+        """
+        Decodes the JSON text.
+
+        Returns:
+            Any: The decoded value.
+        """
+        return json.loads(self.data)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RawJSON):
+            return NotImplemented
+        return self.data == other.data
+
+    def __hash__(self) -> int:
+        return hash(self.data)
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.data!r})"
+
+    @classmethod
+    def _validate(cls, value: Any) -> "RawJSON":
+        if isinstance(value, RawJSON):
+            return value
+        try:
+            return cls.from_value(value)
+        except (TypeError, ValueError) as error:
+            raise PydanticCustomError(
+                "raw_json", "Value is not JSON serializable: {error}", {"error": error}
+            )
+
+    @staticmethod
+    def _serialize(value: Any, info: core_schema.SerializationInfo) -> Any:
+        if not isinstance(value, RawJSON) or not info.mode_is_json():
+            return value
+        fragments = _FRAGMENTS.get()
+        if fragments is None:
+            return value.loads()
+        fragments.append(value.data)
+        return f"{_PLACEHOLDER}{len(fragments) - 1}"
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize, info_arg=True
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> dict[str, Any]:
+        # Any JSON document.
+        return {}
+
+
+class Base64Binary:
+    """
+    The annotation of binary values dumped to JSON as base64 strings.
+
+    In the passthrough mapping, `BinaryField`s map to it. Validated values are kept
+    as they are (`memoryview`s are not copied to `bytes`), base64 strings (e.g. from
+    JSON payloads) are decoded, and JSON dumps encode the values to base64 straight
+    from their buffer.
+    """
+
+    @staticmethod
+    def _validate(value: Any) -> bytes | bytearray | memoryview:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return value
+        if isinstance(value, str):
+            try:
+                return base64.b64decode(value, validate=True)
+            except binascii.Error as error:
+                raise PydanticCustomError(
+                    "base64_decode", "Base64 decoding error: {error}", {"error": error}
+                )
+        raise PydanticCustomError("bytes_type", "Input should be a valid bytes")
+
+    @staticmethod
+    def _serialize(value: Any, info: core_schema.SerializationInfo) -> Any:
+        if info.mode_is_json() and isinstance(value, (bytes, bytearray, memoryview)):
+            return base64.b64encode(value).decode("ascii")
+        return value
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                cls._serialize, info_arg=True
+            ),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> dict[str, Any]:
+        return {"type": "string", "contentEncoding": "base64"}
+
+
+####################
+#    CONSTANTS     #
+####################
+
+# The fragments of the RawJSON values dumped by the current `splice_raw_json` call.
+_FRAGMENTS: ContextVar[list | None] = ContextVar("raw_json_fragments", default=None)
+
+# RawJSON values are dumped as `"<placeholder><index>"` strings, replaced afterwards.
+# The random part keeps the placeholders from matching any real string value.
+_PLACEHOLDER = f"raw-json-{secrets.token_hex(16)}-"
+_PLACEHOLDER_PATTERNS = {
+    str: re.compile(f'"{_PLACEHOLDER}(\\d+)"'),
+    bytes: re.compile(f'"{_PLACEHOLDER}(\\d+)"'.encode()),
+}
+
+PASSTHROUGH_FIELD_MAP = LazyFieldMap(
+    {**DJANGO_FIELD_MAP.data, "JSONField": RawJSON, "BinaryField": Base64Binary}
+)
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def splice_raw_json(dump: Callable[..., _Dumped], *args: Any, **kwargs: Any) -> _Dumped:
+    """
+    Calls a JSON dump function, splicing the RawJSON values verbatim into its output.
+
+    pydantic-core cannot write raw JSON, so during the call RawJSON values are dumped
+    as placeholder strings, which are then replaced by their fragments in a single
+    pass over the output. Outside of this function, RawJSON values are decoded to be
+    dumped.
+
+    Args:
+        dump (Callable[..., str | bytes]): The dump function (e.g. `TypeAdapter.dump_json`).
+        *args: The positional arguments of the dump function.
+        **kwargs: The keyword arguments of the dump function.
+
+    Returns:
+        str | bytes: The JSON output.
+    """
+    fragments = []
+    token = _FRAGMENTS.set(fragments)
+    try:
+        dumped = dump(*args, **kwargs)
+    finally:
+        _FRAGMENTS.reset(token)
+    if not fragments:
+        return dumped
+    if isinstance(dumped, str):
+        fragments = [f if isinstance(f, str) else f.decode() for f in fragments]
+    else:
+        fragments = [f.encode() if isinstance(f, str) else f for f in fragments]
+    pattern = _PLACEHOLDER_PATTERNS[type(dumped)]
+    return pattern.sub(lambda match: fragments[int(match.group(1))], dumped)
+
+
+def uses_raw_json(annotation: Any) -> bool:
+    """
+    Whether an annotation (e.g. `RawJSON | None`) holds RawJSON values.
+
+    Args:
+        annotation (Any): The field annotation.
+
+    Returns:
+        bool: True if RawJSON is part of the annotation.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, RawJSON):
+        return True
+    return any(uses_raw_json(arg) for arg in get_args(annotation))
+
+
+####################
+#     INSTANCES    #
+####################
+
+passthrough_field_mapper = FieldMapper(fields_map=PASSTHROUGH_FIELD_MAP)
@@ -0,0 +1,155 @@
+from dataclasses import dataclass
+from dataclasses import field as DataclassField
+from typing import TYPE_CHECKING, Any, Iterable, Literal
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Model as DjangoModel
+from django.db.models import QuerySet
+from pydantic_core import to_json
+
+from .relations import Relation
+
+if TYPE_CHECKING:
+    from .serializers import ModelSerializer
+
+
+####################
+#      TYPES       #
+####################
+
+# The included rows, by model label and primary key.
+_Included = dict[str, dict[Any, dict[str, Any]]]
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def _references(
+    relation: Relation, objs: list[DjangoModel]
+) -> tuple[list[Any], list[DjangoModel]]:
+    """
+    Reads the related object(s) of model instances.
+
+    Args:
+        relation (Relation): The nested relation.
+        objs (list[DjangoModel]): The model instances.
+
+    Returns:
+        tuple[list[Any], list[DjangoModel]]: The primary key(s) referenced by each instance (a list of them for many relations, None when there is no related object), and every related object.
+    """
+    references, related = [], []
+    for obj in objs:
+        if relation.many:
+            items = list(getattr(obj, relation.accessor).all())
+            references.append([item.pk for item in items])
+            related.extend(items)
+            continue
+        try:
+            item = getattr(obj, relation.accessor)
+        except ObjectDoesNotExist:
+            # Missing reverse one to one relations raise instead of returning None.
+            item = None
+        if item is None:
+            references.append(None)
+        else:
+            references.append(item.pk)
+            related.append(item)
+    return references, related
+
+
+def normalize(
+    serializer: "type[ModelSerializer]",
+    items: QuerySet | Iterable[DjangoModel],
+    *,
+    as_json: bool = False,
+) -> dict[str, Any] | bytes:
+    """
+    Serializes model instances with their related objects deduplicated.
+
+    See `ModelSerializer.normalize`.
+    """
+    config = getattr(serializer, "config", None) or {}
+    if config.get("extractor") is None:
+        raise ValueError(
+            f"{serializer.__name__} cannot normalize its output: "
+            "only built serializers can"
+        )
+    if isinstance(items, QuerySet):
+        items = serializer.prepare_queryset(items)
+    objs = list(items)
+    if not as_json:
+        return _Normalizer("python").run(serializer, objs)
+    normalizer = _Normalizer("json")
+    # RawJSON values are converted to placeholders until the whole document is encoded.
+    dump_json = serializer.json_dumper(
+        lambda: to_json(normalizer.run(serializer, objs))
+    )
+    return dump_json()
+
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(eq=False)
+class _Normalizer:
+    """
+    A single normalization pass, converting each distinct related object once.
+
+    Attributes:
+        mode (str): The dump mode of the rows, `"python"` or `"json"` (JSON compatible values).
+        included (_Included): The related rows converted so far.
+    """
+
+    mode: Literal["python", "json"]
+    included: _Included = DataclassField(default_factory=dict)
+    # The primary keys already converted by each serializer.
+    _seen: dict[type, set] = DataclassField(default_factory=dict)
+
+    def run(
+        self, serializer: "type[ModelSerializer]", objs: list[DjangoModel]
+    ) -> dict[str, Any]:
+        return {"data": self.convert(serializer, objs), "included": self.included}
+
+    def convert(
+        self, serializer: "type[ModelSerializer]", objs: list[DjangoModel]
+    ) -> list[dict[str, Any]]:
+        """
+        Converts model instances, with their relations replaced by primary keys.
+
+        The fields of the serializer are converted in a single batch by its projection
+        without relations (see `ModelSerializer.fieldset_without_relations`), and the
+        related objects are converted level by level, in a single batch per relation.
+        """
+        fieldset = serializer.fieldset_without_relations()
+        rows = fieldset.from_models(objs, mode=self.mode)
+        for relation in serializer.config["relations"]:
+            references, related = _references(relation, objs)
+            for row, reference in zip(rows, references):
+                row[relation.name] = reference
+            self.include(relation.serializer, related)
+        return rows
+
+    def include(
+        self, serializer: "type[ModelSerializer]", objs: list[DjangoModel]
+    ) -> None:
+        """
+        Converts the related objects that were not converted yet, and adds them to `included`.
+        """
+        seen = self._seen.setdefault(serializer, set())
+        distinct: dict[Any, DjangoModel] = {}
+        for obj in objs:
+            if obj.pk not in seen:
+                distinct.setdefault(obj.pk, obj)
+        if not distinct:
+            return
+        seen.update(distinct)
+        label = serializer.config["model"]._meta.label
+        included = self.included.setdefault(label, {})
+        rows = self.convert(serializer, list(distinct.values()))
+        for pk, row in zip(distinct, rows):
+            # Serializers of the same model with different fields share the rows.
+            included.setdefault(pk, {}).update(row)
@@ -0,0 +1,366 @@
+import logging
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field as DataclassField
+from typing import TYPE_CHECKING, Any, Iterator
+from weakref import WeakKeyDictionary
+
+from django.db.models import Model as DjangoModel
+from pydantic import ValidationError
+
+if TYPE_CHECKING:
+    from .serializers import ModelSerializer
+
+logger = logging.getLogger(__name__)
+
+
+####################
+#    CONSTANTS     #
+####################
+
+# The process-wide observer, see `set_observer`. None to skip all the measurements.
+_observer: "SerializerObserver | None" = None
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def _error_field(loc: tuple) -> str:
+    # Batch validation errors start with the index of the row.
+    field = ".".join(str(part) for part in loc if not isinstance(part, int))
+    return field or "__root__"
+
+
+def _serializer_key(serializer: type) -> str:
+    # e.g. "library.Book.BookSerializer": plain strings can be exported as they are.
+    model = (getattr(serializer, "config", None) or {}).get("model")
+    if model is None:
+        return serializer.__name__
+    return f"{model._meta.label}.{serializer.__name__}"
+
+
+def get_observer() -> "SerializerObserver | None":
+    """
+    Returns the observer notified of builds and serializations.
+
+    Returns:
+        SerializerObserver | None: The current observer, or None when nothing is observed.
+    """
+    return _observer
+
+
+def set_observer(observer: "SerializerObserver | None") -> None:
+    """
+    Sets the process-wide observer notified of builds and serializations.
+
+    Without an observer (the default), builds and serializations are not timed.
+
+    Args:
+        observer (SerializerObserver | None): The observer, or None to stop observing.
+    """
+    global _observer
+    _observer = observer
+
+
+@contextmanager
+def observe(observer: "SerializerObserver") -> Iterator["SerializerObserver"]:
+    """
+    Sets the observer for the duration of a `with` block, restoring the previous one after.
+
+    Args:
+        observer (SerializerObserver): The observer.
+
+    Yields:
+        SerializerObserver: The observer.
+    """
+    previous = get_observer()
+    set_observer(observer)
+    try:
+        yield observer
+    finally:
+        set_observer(previous)
+
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(frozen=True)
+class BuildEvent:
+    """
+    Reported when `ModelSerializerBuilder.build` returns a serializer class.
+
+    Attributes:
+        serializer (type[ModelSerializer]): The built (or cached) serializer class.
+        model (type[DjangoModel]): The Django model of the serializer.
+        seconds (float): The time spent in `build`.
+        cached (bool): Whether the class came from the builder cache.
+        partial (bool): Whether a partial serializer was requested.
+        deferred (bool): Whether the schema compilation was deferred.
+    """
+
+    serializer: "type[ModelSerializer]"
+    model: type[DjangoModel]
+    seconds: float
+    cached: bool
+    partial: bool = False
+    deferred: bool = False
+
+
+@dataclass(frozen=True)
+class SerializationEvent:
+    """
+    Reported when a serializer converted rows.
+
+    Attributes:
+        serializer (type[ModelSerializer]): The serializer class.
+        operation (str): The method that converted the rows (e.g. `from_model`, `from_queryset`).
+        rows (int): The number of converted rows.
+        extract_seconds (float): The time spent reading the rows into dictionaries.
+        validate_seconds (float): The time spent validating (or constructing, in trusted mode) the instances.
+        dump_seconds (float): The time spent dumping the instances to dictionaries or JSON.
+    """
+
+    serializer: "type[ModelSerializer]"
+    operation: str
+    rows: int
+    extract_seconds: float = 0.0
+    validate_seconds: float = 0.0
+    dump_seconds: float = 0.0
+
+
+class SerializerObserver:
+    """
+    The interface of the objects notified of builds and serializations.
+
+    Every method does nothing by default, so observers only override what they
+    need. Observers may be called from several threads at once.
+    """
+
+    def on_build(self, event: BuildEvent) -> None:
+        """
+        Called when a serializer class was built or taken from the cache.
+
+        Args:
+            event (BuildEvent): The build details.
+        """
+
+    def on_serialize(self, event: SerializationEvent) -> None:
+        """
+        Called when rows were converted by a serializer.
+
+        Args:
+            event (SerializationEvent): The serialization details.
+        """
+
+    def on_validation_error(
+        self,
+        serializer: "type[ModelSerializer]",
+        operation: str,
+        error: ValidationError,
+    ) -> None:
+        """
+        Called when rows failed validation, before the error is raised.
+
+        Args:
+            serializer (type[ModelSerializer]): The serializer class.
+            operation (str): The method that validated the rows.
+            error (ValidationError): The validation error.
+        """
+
+
+@dataclass
+class SerializerStats:
+    """
+    The metrics aggregated by an InMemoryObserver for one serializer class.
+
+    Attributes:
+        builds (int): The number of `build` calls that returned the serializer.
+        cache_hits (int): How many of them came from the builder cache.
+        build_seconds (float): The total time spent building it.
+        calls (Counter[str]): The number of conversions, by operation.
+        rows (Counter[str]): The number of converted rows, by operation.
+        extract_seconds (float): The total time spent reading rows.
+        validate_seconds (float): The total time spent validating rows.
+        dump_seconds (float): The total time spent dumping rows.
+        validation_errors (Counter[str]): The number of validation errors, by field (dotted path, `__root__` for model level errors).
+    """
+
+    builds: int = 0
+    cache_hits: int = 0
+    build_seconds: float = 0.0
+    calls: Counter = DataclassField(default_factory=Counter)
+    rows: Counter = DataclassField(default_factory=Counter)
+    extract_seconds: float = 0.0
+    validate_seconds: float = 0.0
+    dump_seconds: float = 0.0
+    validation_errors: Counter = DataclassField(default_factory=Counter)
+
+    def merge(self, other: "SerializerStats") -> None:
+        """
+        Adds the metrics of another serializer to these ones.
+
+        Args:
+            other (SerializerStats): The metrics to add.
+        """
+        self.builds += other.builds
+        self.cache_hits += other.cache_hits
+        self.build_seconds += other.build_seconds
+        self.calls.update(other.calls)
+        self.rows.update(other.rows)
+        self.extract_seconds += other.extract_seconds
+        self.validate_seconds += other.validate_seconds
+        self.dump_seconds += other.dump_seconds
+        self.validation_errors.update(other.validation_errors)
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns the metrics as plain (JSON serializable) values.
+
+        Returns:
+            dict[str, Any]: The metrics.
+        """
+        return {
+            "builds": self.builds,
+            "cache_hits": self.cache_hits,
+            "build_seconds": self.build_seconds,
+            "calls": dict(self.calls),
+            "rows": dict(self.rows),
+            "extract_seconds": self.extract_seconds,
+            "validate_seconds": self.validate_seconds,
+            "dump_seconds": self.dump_seconds,
+            "validation_errors": dict(self.validation_errors),
+        }
+
+
+@dataclass(eq=False)
+class InMemoryObserver(SerializerObserver):
+    """
+    A thread-safe observer aggregating the metrics of each serializer class in memory.
+
+    Read them with `snapshot()`, e.g. from a periodic task pushing them to a
+    monitoring system. Metrics are aggregated by class and kept weakly: the metrics
+    of a class are dropped when it is garbage collected.
+    """
+
+    _stats: "WeakKeyDictionary[type, SerializerStats]" = DataclassField(
+        default_factory=WeakKeyDictionary, init=False, repr=False
+    )
+    _lock: threading.Lock = DataclassField(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def on_build(self, event: BuildEvent) -> None:
+        with self._lock:
+            stats = self._stats_of(event.serializer)
+            stats.builds += 1
+            stats.cache_hits += event.cached
+            stats.build_seconds += event.seconds
+
+    def on_serialize(self, event: SerializationEvent) -> None:
+        with self._lock:
+            stats = self._stats_of(event.serializer)
+            stats.calls[event.operation] += 1
+            stats.rows[event.operation] += event.rows
+            stats.extract_seconds += event.extract_seconds
+            stats.validate_seconds += event.validate_seconds
+            stats.dump_seconds += event.dump_seconds
+
+    def on_validation_error(
+        self,
+        serializer: "type[ModelSerializer]",
+        operation: str,
+        error: ValidationError,
+    ) -> None:
+        fields = [_error_field(details["loc"]) for details in error.errors()]
+        with self._lock:
+            self._stats_of(serializer).validation_errors.update(fields)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """
+        Returns the aggregated metrics, keyed by the model label and the serializer name.
+
+        The serializers built for the same model with different fields share their
+        name, so their metrics are added together.
+
+        Returns:
+            dict[str, dict[str, Any]]: The metrics of each serializer, e.g. by `"library.Book.BookSerializer"`.
+        """
+        merged: dict[str, SerializerStats] = {}
+        with self._lock:
+            for cls, stats in self._stats.items():
+                merged.setdefault(_serializer_key(cls), SerializerStats()).merge(stats)
+        return {key: stats.as_dict() for key, stats in merged.items()}
+
+    def reset(self) -> None:
+        """
+        Discards the aggregated metrics.
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def _stats_of(self, serializer: type) -> SerializerStats:
+        # Called with the lock held.
+        stats = self._stats.get(serializer)
+        if stats is None:
+            stats = self._stats[serializer] = SerializerStats()
+        return stats
+
+
+@dataclass(eq=False)
+class LoggingObserver(SerializerObserver):
+    """
+    An observer logging every event, e.g. to be shipped by a log based metrics pipeline.
+
+    Attributes:
+        logger (logging.Logger): The logger to log to. Defaults to the logger of this module.
+        level (int): The level of the build and serialization records. Validation errors are logged as warnings. Defaults to `logging.DEBUG`.
+    """
+
+    logger: logging.Logger = logger
+    level: int = logging.DEBUG
+
+    def on_build(self, event: BuildEvent) -> None:
+        self.logger.log(
+            self.level,
+            "Built %s in %.3fms (cached=%s, partial=%s, deferred=%s)",
+            event.serializer.__name__,
+            event.seconds * 1e3,
+            event.cached,
+            event.partial,
+            event.deferred,
+        )
+
+    def on_serialize(self, event: SerializationEvent) -> None:
+        self.logger.log(
+            self.level,
+            "%s.%s: %d rows, extract %.3fms, validate %.3fms, dump %.3fms",
+            event.serializer.__name__,
+            event.operation,
+            event.rows,
+            event.extract_seconds * 1e3,
+            event.validate_seconds * 1e3,
+            event.dump_seconds * 1e3,
+        )
+
+    def on_validation_error(
+        self,
+        serializer: "type[ModelSerializer]",
+        operation: str,
+        error: ValidationError,
+    ) -> None:
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        fields = sorted({_error_field(details["loc"]) for details in error.errors()})
+        self.logger.warning(
+            "%s.%s: %d validation errors in %s",
+            serializer.__name__,
+            operation,
+            error.error_count(),
+            ", ".join(fields),
+        )
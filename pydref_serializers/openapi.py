@@ -0,0 +1,213 @@
+import copy
+import hashlib
+import json
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Iterable
+from weakref import WeakKeyDictionary
+
+if TYPE_CHECKING:
+    from .serializers import ModelSerializer
+
+
+####################
+#    CONSTANTS     #
+####################
+
+# Where the OpenAPI components are referenced from in an OpenAPI document.
+REF_PREFIX = "#/components/schemas/"
+
+# Where pydantic references the definitions of a JSON schema.
+_DEFS_PREFIX = "#/$defs/"
+
+# Bumped when the layout of the persisted components changes.
+_FILE_FORMAT = 1
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def _rewrite_refs(schema: Any, rename: Callable[[str], str]) -> Any:
+    """
+    Returns a copy of a JSON schema whose `$defs` references point to renamed components.
+    """
+    if isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if isinstance(ref, str) and ref.startswith(_DEFS_PREFIX):
+            return {
+                **schema,
+                "$ref": REF_PREFIX + rename(ref[len(_DEFS_PREFIX) :]),
+            }
+        return {key: _rewrite_refs(value, rename) for key, value in schema.items()}
+    if isinstance(schema, list):
+        return [_rewrite_refs(value, rename) for value in schema]
+    return schema
+
+
+def _add_component(schemas: dict[str, Any], name: str, schema: Any) -> str:
+    """
+    Adds a component, reusing an identical one and suffixing the name of a different one.
+
+    Returns:
+        str: The name of the component.
+    """
+    candidate, index = name, 1
+    while candidate in schemas and schemas[candidate] != schema:
+        index += 1
+        candidate = f"{name}{index}"
+    schemas.setdefault(candidate, schema)
+    return candidate
+
+
+def _merge_schema(schemas: dict[str, Any], schema: dict[str, Any]) -> str:
+    """
+    Adds the JSON schema of a serializer and its definitions to the components.
+
+    Definitions are added before the schemas referencing them, so that identical
+    definitions (e.g. the Enums shared by many serializers) are only added once, and
+    different definitions with the same name get distinct names.
+
+    Returns:
+        str: The name of the serializer component.
+    """
+    definitions = schema.pop("$defs", {})
+    names: dict[str, str] = {}
+
+    def resolve(name: str) -> str:
+        if name not in names:
+            definition = _rewrite_refs(definitions[name], resolve)
+            names[name] = _add_component(schemas, name, definition)
+        return names[name]
+
+    root = _rewrite_refs(schema, resolve)
+    return _add_component(schemas, root.get("title", "Serializer"), root)
+
+
+def _fingerprint(schemas: list[str], mode: str) -> str:
+    data = json.dumps([_FILE_FORMAT, mode, schemas])
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _load(path: str | os.PathLike, fingerprint: str) -> dict[str, Any] | None:
+    """
+    Returns the components persisted to a file, if they have the given fingerprint.
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path) as file:
+        saved = json.load(file)
+    return saved if saved.get("fingerprint") == fingerprint else None
+
+
+def build_components(
+    serializers: "Iterable[type[ModelSerializer]]",
+    mode: str = "serialization",
+    path: str | os.PathLike | None = None,
+) -> "OpenAPIComponents":
+    """
+    Computes the OpenAPI components of serializers, or loads them from a file.
+
+    See `SerializerRegistry.build_openapi_components`.
+
+    Args:
+        serializers (Iterable[type[ModelSerializer]]): The serializer classes.
+        mode (str, optional): The JSON schema mode, `"serialization"` or `"validation"`. Defaults to `"serialization"`.
+        path (str | os.PathLike | None, optional): A file the components are loaded from when they are up to date, and saved to otherwise. Defaults to None.
+
+    Returns:
+        OpenAPIComponents: The components.
+    """
+    generated = sorted(
+        (
+            (json.dumps(schema, sort_keys=True), serializer, schema)
+            for serializer in serializers
+            for schema in [serializer.model_json_schema(mode=mode)]
+        ),
+        key=lambda item: (item[1].__name__, item[0]),
+    )
+    # The digest of the generated schemas, so a stale file is never loaded.
+    fingerprint = _fingerprint([text for text, _, _ in generated], mode)
+    ordered = [serializer for _, serializer, _ in generated]
+
+    saved = _load(path, fingerprint) if path is not None else None
+    if saved is not None:
+        return OpenAPIComponents.from_names(
+            fingerprint, saved["schemas"], ordered, saved["names"]
+        )
+
+    schemas: dict[str, Any] = {}
+    names = [_merge_schema(schemas, schema) for _, _, schema in generated]
+    components = OpenAPIComponents.from_names(fingerprint, schemas, ordered, names)
+    if path is not None:
+        components.save(path)
+    return components
+
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(frozen=True)
+class OpenAPIComponents:
+    """
+    The JSON schemas of serializers, as OpenAPI components.
+
+    Attributes:
+        fingerprint (str): A digest of the generated schemas.
+        schemas (dict[str, Any]): The schemas, by component name. Schemas reference each other with `#/components/schemas/<name>`.
+        names (WeakKeyDictionary[type[ModelSerializer], str]): The component name of each serializer.
+        order (tuple[str, ...]): The component names of the serializers, in the order they are persisted in.
+    """
+
+    fingerprint: str
+    schemas: dict[str, Any]
+    names: "WeakKeyDictionary[type[ModelSerializer], str]"
+    order: tuple[str, ...] = ()
+
+    @classmethod
+    def from_names(
+        cls,
+        fingerprint: str,
+        schemas: dict[str, Any],
+        serializers: "list[type[ModelSerializer]]",
+        names: list[str],
+    ) -> "OpenAPIComponents":
+        return cls(
+            fingerprint,
+            schemas,
+            WeakKeyDictionary(zip(serializers, names)),
+            tuple(names),
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Returns the `components` object of an OpenAPI document.
+
+        Returns:
+            dict[str, Any]: A copy of the components, e.g. `{"schemas": {...}}`, that callers may modify.
+        """
+        return {"schemas": copy.deepcopy(self.schemas)}
+
+    def save(self, path: str | os.PathLike) -> None:
+        """
+        Persists the components to a file, unless it already holds them.
+
+        Args:
+            path (str | os.PathLike): The JSON file.
+        """
+        if _load(path, self.fingerprint) is not None:
+            return
+        temporary = f"{path}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(
+                {
+                    "fingerprint": self.fingerprint,
+                    "names": list(self.order),
+                    "schemas": self.schemas,
+                },
+                file,
+            )
+        os.replace(temporary, path)
@@ -0,0 +1,310 @@
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from dataclasses import field as DataclassField
+from typing import TYPE_CHECKING, Any, Iterable
+
+from django.db.models import Model as DjangoModel
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save
+
+
+if TYPE_CHECKING:
+    from .serializers import ModelSerializer
+
+
+####################
+#    CONSTANTS     #
+####################
+
+DEFAULT_OUTPUT_CACHE_SIZE = 10_000
+
+# Rows changed without a signal (e.g. by `QuerySet.update()` or another process)
+# are served stale at most this long, in seconds, without a version field.
+DEFAULT_OUTPUT_CACHE_TIMEOUT = 300
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def _default_namespace(serializer: "type[ModelSerializer]") -> str:
+    """
+    Returns a cache key prefix identifying the output of a serializer in every process.
+
+    Serializers of the same model can share a class name with different fields, so
+    the prefix includes a digest of the JSON schema of the serializer.
+    """
+    schema = json.dumps(serializer.model_json_schema(), sort_keys=True)
+    digest = hashlib.blake2b(schema.encode(), digest_size=8).hexdigest()
+    label = serializer.config["model"]._meta.label
+    return f"pydref:{label}:{serializer.__name__}:{digest}"
+
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(eq=False)
+class LocalOutputCache:
+    """
+    A thread-safe, bounded LRU cache in process memory, the default OutputCache backend.
+
+    It implements the `get_many`/`set_many`/`delete_many` methods of Django cache
+    backends used by OutputCache.
+
+    Attributes:
+        maxsize (int): The maximum number of cached rows. Defaults to 10000.
+        timeout (float | None): The expiration of the entries in seconds, when `set_many` is given none. Defaults to 300. None to never expire them.
+    """
+
+    maxsize: int = DEFAULT_OUTPUT_CACHE_SIZE
+    timeout: float | None = DEFAULT_OUTPUT_CACHE_TIMEOUT
+    _entries: OrderedDict = DataclassField(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _lock: threading.Lock = DataclassField(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            found = {}
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                expires, value = entry
+                if expires is not None and expires <= now:
+                    del self._entries[key]
+                    continue
+                self._entries.move_to_end(key)
+                found[key] = value
+            return found
+
+    def set_many(self, data: dict[str, Any], timeout: float | None = None) -> None:
+        if timeout is None:
+            timeout = self.timeout
+        expires = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            for key, value in data.items():
+                self._entries[key] = (expires, value)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def delete_many(self, keys: Iterable[str]) -> None:
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass(eq=False)
+class OutputCache:
+    """
+    A cache of the JSON dumped by a serializer for each row, see `ModelSerializer.use_output_cache`.
+
+    Rows are cached by serializer and primary key, along with the value of the
+    version field (e.g. `updated_at`) they were dumped from: a cached row is only used
+    while the version of the row is the same. Entries are also invalidated by the
+    `post_save` and `post_delete` signals of the serializer model.
+
+    Signals are only sent by `save()` and `delete()` in this process: rows changed by
+    `QuerySet.update()`, `bulk_update()`, `bulk_create()`, raw SQL, migrations or
+    another process are only detected through the version field. Without one, they
+    are served stale until their entry expires (after `timeout`, or 5 minutes with
+    the default LocalOutputCache). Changes to nested related objects are not tracked
+    either: serializers with nested relations should use a version field updated
+    along with their relations.
+
+    Rows dumped while an invalidation happens are returned but not cached, so an
+    older dump never replaces an invalidation.
+
+    Attributes:
+        serializer (type[ModelSerializer]): The built serializer class whose output is cached.
+        backend (Any): A LocalOutputCache or any Django cache backend (e.g. `caches["default"]`). Defaults to a new LocalOutputCache.
+        version_field (str | None): The model field holding the version of each row. Defaults to None (rows are only invalidated by signals).
+        timeout (float | None): The expiration of the entries in seconds, passed to the backend. Defaults to None (the backend default).
+        namespace (str | None): The prefix of the cache keys. Defaults to one derived from the model, serializer name and schema.
+    """
+
+    serializer: "type[ModelSerializer]"
+    backend: Any = None
+    version_field: str | None = None
+    timeout: float | None = None
+    namespace: str | None = None
+    model: type[DjangoModel] = DataclassField(init=False, repr=False)
+    # Bumped by every invalidation, so that dumps started before are not cached.
+    _generation: int = DataclassField(default=0, init=False, repr=False)
+    _lock: threading.Lock = DataclassField(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        config = getattr(self.serializer, "config", None) or {}
+        if config.get("extractor") is None:
+            raise ValueError(
+                f"The output of {self.serializer.__name__} cannot be cached: "
+                "only built serializers can"
+            )
+        if self.backend is None:
+            self.backend = LocalOutputCache()
+        if self.namespace is None:
+            self.namespace = _default_namespace(self.serializer)
+        self.model = config["model"]
+        post_save.connect(self._on_change, sender=self.model)
+        post_delete.connect(self._on_change, sender=self.model)
+
+    def key(self, pk: Any) -> str:
+        """
+        Returns the cache key of the row with the given primary key.
+
+        Args:
+            pk (Any): The primary key.
+
+        Returns:
+            str: The cache key.
+        """
+        return f"{self.namespace}:{pk}"
+
+    def version(self, obj: DjangoModel) -> Any:
+        """
+        Returns the version of a model instance.
+
+        Args:
+            obj (DjangoModel): The model instance.
+
+        Returns:
+            Any: The value of the version field, or None without a version field.
+        """
+        if self.version_field is None:
+            return None
+        return getattr(obj, self.version_field)
+
+    def dump_json(self, obj: DjangoModel) -> bytes:
+        """
+        Returns the JSON of a model instance, dumping it only if it is not cached.
+
+        Args:
+            obj (DjangoModel): The model instance.
+
+        Returns:
+            bytes: The JSON object, as `model_dump_json` would dump it.
+        """
+        return self._dump_rows([obj])[0]
+
+    def dump_many_json(self, objs: QuerySet | Iterable[DjangoModel]) -> bytes:
+        """
+        Returns the JSON array of many rows, assembled from cached and freshly dumped rows.
+
+        The rows missing from the cache (or cached with another version) are converted
+        together in a single batch and cached. For querysets, only the primary keys
+        (and versions) are loaded first, and the rows are only loaded when they are
+        missing from the cache.
+
+        Args:
+            objs (QuerySet | Iterable[DjangoModel]): The model instances or queryset.
+
+        Returns:
+            bytes: The JSON array, in input order.
+        """
+        if isinstance(objs, QuerySet):
+            rows = self._dump_queryset(objs)
+        else:
+            rows = self._dump_rows(list(objs))
+        return b"[" + b",".join(rows) + b"]"
+
+    def invalidate(self, *pks: Any) -> None:
+        """
+        Removes the cached rows with the given primary keys.
+
+        Args:
+            *pks (Any): The primary keys.
+        """
+        with self._lock:
+            self._generation += 1
+        self.backend.delete_many([self.key(pk) for pk in pks])
+
+    def disconnect(self) -> None:
+        """
+        Stops invalidating the cached rows on `post_save` and `post_delete`.
+        """
+        post_save.disconnect(self._on_change, sender=self.model)
+        post_delete.disconnect(self._on_change, sender=self.model)
+
+    def _on_change(self, sender: type[DjangoModel], instance: DjangoModel, **kwargs):
+        self.invalidate(instance.pk)
+
+    def _cached(self, versions: dict[Any, Any]) -> dict[Any, bytes]:
+        """
+        Returns the cached JSON of the rows whose version matches, by primary key.
+        """
+        entries = self.backend.get_many([self.key(pk) for pk in versions])
+        found = {}
+        for pk, version in versions.items():
+            entry = entries.get(self.key(pk))
+            if entry is not None and entry[0] == version:
+                found[pk] = entry[1]
+        return found
+
+    def _store(
+        self, objs: list[DjangoModel], versions: dict[Any, Any], generation: int
+    ) -> dict[Any, bytes]:
+        """
+        Converts model instances in a single batch, caches and returns their JSON by primary key.
+
+        The rows are not cached if an invalidation happened since `generation`, as
+        they may have been read before it.
+        """
+        if not objs:
+            return {}
+        to_json = self.serializer.json_dumper(
+            self.serializer.__pydantic_serializer__.to_json
+        )
+        dumped = {
+            obj.pk: to_json(instance)
+            for obj, instance in zip(objs, self.serializer.from_models(objs))
+        }
+        entries = {self.key(pk): (versions[pk], row) for pk, row in dumped.items()}
+        options = {} if self.timeout is None else {"timeout": self.timeout}
+        with self._lock:
+            if self._generation == generation:
+                self.backend.set_many(entries, **options)
+        return dumped
+
+    def _dump_rows(self, objs: list[DjangoModel]) -> list[bytes]:
+        generation = self._generation
+        versions = {obj.pk: self.version(obj) for obj in objs}
+        found = self._cached(versions)
+        missing = [obj for obj in objs if obj.pk not in found]
+        found.update(self._store(missing, versions, generation))
+        return [found[obj.pk] for obj in objs]
+
+    def _dump_queryset(self, queryset: QuerySet) -> list[bytes]:
+        generation = self._generation
+        if self.version_field is None:
+            versions = dict.fromkeys(queryset.values_list("pk", flat=True))
+        else:
+            versions = dict(queryset.values_list("pk", self.version_field))
+        found = self._cached(versions)
+        missing = [pk for pk in versions if pk not in found]
+        if missing:
+            objs = self.serializer.prepare_queryset(
+                self.model._default_manager.using(queryset.db).filter(pk__in=missing)
+            )
+            found.update(self._store(list(objs), versions, generation))
+        # Rows deleted in between are skipped.
+        return [found[pk] for pk in versions if pk in found]
@@ -0,0 +1,215 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+from typing import TYPE_CHECKING, Any, Iterable
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model as DjangoModel
+from django.db.models import Q, QuerySet
+
+if TYPE_CHECKING:
+    from .serializers import ModelSerializer
+
+
+####################
+#      TYPES       #
+####################
+
+# The name, attname and direction (True when descending) of an ordering field.
+_Key = tuple[str, str, bool]
+
+
+####################
+#    CONSTANTS     #
+####################
+
+DEFAULT_PAGE_SIZE = 50
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def _ordering_keys(model: type[DjangoModel], order_by: Iterable[str]) -> list[_Key]:
+    """
+    Resolves the ordering of a page, ending with the primary key so that it is total.
+
+    Args:
+        model (type[DjangoModel]): The model of the paginated queryset.
+        order_by (Iterable[str]): The ordering fields, prefixed with `-` when descending.
+
+    Returns:
+        list[_Key]: The ordering keys.
+
+    Raises:
+        ValueError: If an ordering field is not a non-nullable concrete field of the model.
+    """
+    pk = model._meta.pk
+    keys = []
+    for lookup in order_by:
+        name = lookup.lstrip("-")
+        try:
+            field = pk if name == "pk" else model._meta.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or not field.concrete or field.null:
+            raise ValueError(
+                f"Cannot paginate {model.__name__} on {name}: keyset pagination "
+                "needs non-nullable fields of the model"
+            )
+        keys.append((field.name, field.get_attname(), lookup.startswith("-")))
+    if pk.name not in {name for name, _, _ in keys}:
+        keys.append((pk.name, pk.get_attname(), False))
+    return keys
+
+
+def _keyset_filter(keys: list[_Key], values: list[Any], forward: bool) -> Q:
+    """
+    Returns the predicate selecting the rows after (or before) the given ordering values.
+
+    For `(a, -b)` and values `(x, y)`, the rows after are `a >= x AND (a > x OR
+    (a = x AND b < y))`. The leading `a >= x` term lets the database range scan an
+    index on the ordering.
+    """
+    clauses = []
+    for index, (_, attname, descending) in enumerate(keys):
+        lookup = "lt" if descending == forward else "gt"
+        equals = {keys[i][1]: values[i] for i in range(index)}
+        clauses.append(Q(**equals, **{f"{attname}__{lookup}": values[index]}))
+    _, attname, descending = keys[0]
+    lookup = "lte" if descending == forward else "gte"
+    return Q(**{f"{attname}__{lookup}": values[0]}) & reduce(or_, clauses)
+
+
+def _json_value(value: Any) -> Any:
+    # Dates and times keep their microseconds, unlike with DjangoJSONEncoder.
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(keys: list[_Key], values: list[Any], forward: bool) -> str:
+    """
+    Returns an opaque cursor pointing after (or before) the given ordering values.
+
+    Args:
+        keys (list[_Key]): The ordering keys.
+        values (list[Any]): The ordering values of the boundary row.
+        forward (bool): Whether the cursor selects the rows after the boundary row.
+
+    Returns:
+        str: The URL safe cursor.
+    """
+    payload = {
+        "o": [f"{'-' if descending else ''}{name}" for name, _, descending in keys],
+        "v": values,
+        "f": forward,
+    }
+    data = json.dumps(payload, default=_json_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, keys: list[_Key]) -> tuple[list[Any], bool]:
+    """
+    Decodes a cursor returned by `encode_cursor` for the same ordering.
+
+    Args:
+        cursor (str): The cursor.
+        keys (list[_Key]): The ordering keys.
+
+    Returns:
+        tuple[list[Any], bool]: The ordering values of the boundary row, and whether the cursor selects the rows after it.
+
+    Raises:
+        ValueError: If the cursor is malformed or was created for another ordering.
+    """
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(data)
+        ordering, values, forward = payload["o"], payload["v"], payload["f"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as error:
+        raise ValueError("Invalid cursor") from error
+    expected = [f"{'-' if descending else ''}{name}" for name, _, descending in keys]
+    if ordering != expected or len(values) != len(keys):
+        raise ValueError("Invalid cursor: it was created for another ordering")
+    return values, bool(forward)
+
+
+def paginate(
+    serializer: "type[ModelSerializer]",
+    queryset: QuerySet,
+    cursor: str | None = None,
+    *,
+    limit: int = DEFAULT_PAGE_SIZE,
+    order_by: Iterable[str] = ("pk",),
+    as_dicts: bool = False,
+    trusted: bool = False,
+) -> "Page":
+    """
+    Serializes a page of a queryset, selected with a keyset predicate.
+
+    See `ModelSerializer.paginate`.
+    """
+    if limit < 1:
+        raise ValueError("The page size must be at least 1")
+    keys = _ordering_keys(queryset.model, order_by)
+    forward = True
+    if cursor is not None:
+        values, forward = decode_cursor(cursor, keys)
+        queryset = queryset.filter(_keyset_filter(keys, values, forward))
+    # Backward pages are read in reverse order from their boundary. Rows are ordered
+    # by the compared columns: ordering a foreign key by name would follow the
+    # ordering of the related model instead.
+    ordering = [
+        f"{'-' if descending == forward else ''}{attname}"
+        for _, attname, descending in keys
+    ]
+    queryset = (
+        serializer.query_plan()
+        .with_only(*(name for name, _, _ in keys))
+        .apply(queryset.order_by(*ordering))
+    )
+    objs = list(queryset[: limit + 1])
+    has_more = len(objs) > limit
+    del objs[limit:]
+    if not forward:
+        objs.reverse()
+
+    next_cursor = previous_cursor = None
+    if objs:
+        has_next, has_previous = (
+            (has_more, cursor is not None) if forward else (True, has_more)
+        )
+        if has_next:
+            values = [getattr(objs[-1], attname) for _, attname, _ in keys]
+            next_cursor = encode_cursor(keys, values, True)
+        if has_previous:
+            values = [getattr(objs[0], attname) for _, attname, _ in keys]
+            previous_cursor = encode_cursor(keys, values, False)
+    items = serializer.from_models(objs, as_dicts=as_dicts, trusted=trusted)
+    return Page(items, next_cursor, previous_cursor)
+
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(frozen=True)
+class Page:
+    """
+    A page of serialized rows, returned by `ModelSerializer.paginate`.
+
+    Attributes:
+        items (list[Any]): The serializer instances (or their dumped dictionaries) of the page, in order.
+        next_cursor (str | None): The cursor of the next page, or None on the last page.
+        previous_cursor (str | None): The cursor of the previous page, or None on the first page.
+    """
+
+    items: list[Any]
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
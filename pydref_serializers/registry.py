@@ -0,0 +1,232 @@
+import logging
+import os
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from dataclasses import field as DataclassField
+from typing import TYPE_CHECKING, Iterable, Iterator
+
+from django.utils.module_loading import autodiscover_modules
+
+from .openapi import REF_PREFIX, OpenAPIComponents, build_components
+
+if TYPE_CHECKING:
+    from .serializers import ModelSerializer
+
+logger = logging.getLogger(__name__)
+
+
+####################
+#    CONSTANTS     #
+####################
+
+# The modules of the installed apps imported to find serializers to warm up.
+DEFAULT_WARMUP_MODULES = ("serializers",)
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def autodiscover_serializers(modules: Iterable[str] = DEFAULT_WARMUP_MODULES) -> None:
+    """
+    Imports the given modules of every installed app, registering the serializers they build.
+
+    Args:
+        modules (Iterable[str], optional): The module names to look for in each app. Defaults to `("serializers",)`.
+    """
+    autodiscover_modules(*modules)
+
+
+def _compile_schema(serializer: "type[ModelSerializer]") -> int:
+    # Nested serializers may have been compiled through their parent already.
+    if serializer.is_schema_compiled():
+        return 0
+    serializer.compile_schema()
+    return 1
+
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(frozen=True)
+class WarmupResult:
+    """
+    The outcome of a SerializerRegistry warm-up.
+
+    Attributes:
+        compiled (int): The number of serializers whose schema was compiled.
+        total (int): The number of registered serializers.
+        seconds (float): The time spent compiling.
+    """
+
+    compiled: int
+    total: int
+    seconds: float
+
+
+@dataclass(eq=False)
+class SerializerRegistry:
+    """
+    A thread-safe registry of the serializer classes built in this process.
+
+    The builder registers every class it builds, so serializers built with
+    `defer=True` (e.g. at import time) can be compiled all at once later, before
+    serving requests. It also generates the OpenAPI components of all of them (see
+    `build_openapi_components`). Classes are held weakly and disappear with their last
+    reference.
+    """
+
+    _serializers: "weakref.WeakSet[type[ModelSerializer]]" = DataclassField(
+        default_factory=weakref.WeakSet, init=False, repr=False
+    )
+    _lock: threading.Lock = DataclassField(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _generation: int = DataclassField(default=0, init=False, repr=False)
+    _components: dict[str, OpenAPIComponents] = DataclassField(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def register(self, serializer: "type[ModelSerializer]") -> None:
+        """
+        Adds a serializer class to the registry.
+
+        Args:
+            serializer (type[ModelSerializer]): The serializer class.
+        """
+        with self._lock:
+            self._serializers.add(serializer)
+            # A new (or rebuilt) serializer changes the components.
+            self._generation += 1
+            self._components.clear()
+
+    def pending(self) -> "list[type[ModelSerializer]]":
+        """
+        Returns the registered serializers whose schema is not compiled yet.
+
+        Returns:
+            list[type[ModelSerializer]]: The deferred serializers.
+        """
+        return [
+            serializer for serializer in self if not serializer.is_schema_compiled()
+        ]
+
+    def warmup(self) -> WarmupResult:
+        """
+        Compiles the schema of every deferred serializer, in the calling thread.
+
+        Schemas are compiled in the process that calls it, so call it in the serving
+        process once the application modules are imported, e.g. from `AppConfig.ready`
+        (see the `PYDREF_WARMUP` setting) or a server `post_fork` hook. Compiling holds
+        the GIL, so it would not be faster in several threads.
+
+        Returns:
+            WarmupResult: The number of compiled serializers and the time spent.
+        """
+        pending = self.pending()
+        start = time.perf_counter()
+        compiled = sum(map(_compile_schema, pending))
+        result = WarmupResult(compiled, len(self), time.perf_counter() - start)
+        logger.debug(
+            f"Compiled {result.compiled} of {result.total} serializers "
+            f"in {result.seconds:.3f}s"
+        )
+        return result
+
+    def build_openapi_components(
+        self,
+        *,
+        mode: str = "serialization",
+        path: str | os.PathLike | None = None,
+    ) -> dict:
+        """
+        Returns the OpenAPI components of all the registered serializers.
+
+        The JSON schemas are generated once and cached until a serializer is built (or
+        rebuilt). The definitions they share, like the Enums generated for the fields
+        with choices or the nested serializers, are only included once, while different
+        definitions with the same name get a numeric suffix. Use `schema_ref` to
+        reference the schema of a serializer.
+
+        Args:
+            mode (str, optional): The JSON schema mode, `"serialization"` (the output of the serializers) or `"validation"` (their input). Defaults to `"serialization"`.
+            path (str | os.PathLike | None, optional): A JSON file to persist the components to, also when they were already generated. When it holds the components of the same schemas (compared by a digest of the generated JSON schemas), they are loaded from it instead of being merged again. Defaults to None.
+
+        Returns:
+            dict: A copy of the `components` object of an OpenAPI document, e.g. `{"schemas": {...}}`.
+        """
+        return self._get_components(mode, path).as_dict()
+
+    def schema_ref(
+        self, serializer: "type[ModelSerializer]", *, mode: str = "serialization"
+    ) -> str:
+        """
+        Returns the reference to the schema of a serializer in the OpenAPI components.
+
+        Args:
+            serializer (type[ModelSerializer]): A registered serializer class.
+            mode (str, optional): The JSON schema mode. Defaults to `"serialization"`.
+
+        Returns:
+            str: The reference, e.g. `#/components/schemas/BookSerializer`.
+
+        Raises:
+            KeyError: If the serializer is not registered.
+        """
+        return REF_PREFIX + self._get_components(mode).names[serializer]
+
+    def _get_components(
+        self, mode: str, path: str | os.PathLike | None = None
+    ) -> OpenAPIComponents:
+        with self._lock:
+            components = self._components.get(mode)
+            generation = self._generation
+        if components is not None:
+            if path is not None:
+                # The components may have been generated before a path was given.
+                components.save(path)
+            return components
+        # Generated outside of the lock: compiling schemas may register serializers.
+        components = build_components(self, mode, path)
+        with self._lock:
+            if self._generation == generation:
+                self._components[mode] = components
+        return components
+
+    def clear(self) -> None:
+        """
+        Removes all the registered serializers.
+        """
+        with self._lock:
+            self._serializers.clear()
+            self._generation += 1
+            self._components.clear()
+
+    def __iter__(self) -> "Iterator[type[ModelSerializer]]":
+        with self._lock:
+            serializers = list(self._serializers)
+        return iter(serializers)
+
+    def __len__(self) -> int:
+        return len(self._serializers)
+
+    def __contains__(self, serializer: object) -> bool:
+        return serializer in self._serializers
+
+    def __reduce__(self):
+        # Like the serializer cache, the registry is process local.
+        if self is serializer_registry:
+            return "serializer_registry"
+        return (self.__class__, ())
+
+
+####################
+#     INSTANCES    #
+####################
+
+serializer_registry = SerializerRegistry()
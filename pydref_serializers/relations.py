@@ -0,0 +1,265 @@
+from dataclasses import dataclass, replace
+from dataclasses import field as DataclassField
+from typing import TYPE_CHECKING, Any, Callable
+
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
+from django.db.models import Model as DjangoModel
+from django.db.models import Prefetch, QuerySet
+from django.db.models.constants import LOOKUP_SEP
+
+if TYPE_CHECKING:
+    from .serializers import ModelSerializer
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def _prefetch_path(lookup: str | Prefetch) -> str:
+    return lookup.prefetch_to if isinstance(lookup, Prefetch) else lookup
+
+
+def _prefetched_paths(queryset: QuerySet) -> set[str]:
+    """
+    Returns the relation paths a queryset already prefetches, including the intermediate ones.
+
+    Args:
+        queryset (QuerySet): The queryset.
+
+    Returns:
+        set[str]: The paths, e.g. `{"author", "author__books"}` for `prefetch_related("author__books")`.
+    """
+    paths = set()
+    for lookup in getattr(queryset, "_prefetch_related_lookups", ()):
+        parts = _prefetch_path(lookup).split(LOOKUP_SEP)
+        paths.update(LOOKUP_SEP.join(parts[:end]) for end in range(1, len(parts) + 1))
+    return paths
+
+
+def _selected_relations(queryset: QuerySet) -> list[str] | None:
+    """
+    Returns the forward relations a queryset follows with `select_related`.
+
+    They must be loaded by an `only` projection too: Django refuses to defer a
+    relation and traverse it at the same time.
+
+    Args:
+        queryset (QuerySet): The queryset.
+
+    Returns:
+        list[str] | None: The relation paths, e.g. `["author", "author__publisher"]`, or None when `select_related()` follows every non-null foreign key.
+    """
+    selected = queryset.query.select_related
+    if selected is True:
+        return None
+    paths = []
+
+    def walk(model: type[DjangoModel], tree: dict, prefix: str) -> None:
+        for name, subtree in tree.items():
+            try:
+                field = model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue
+            # Reverse relations are not columns of the model, so they are never deferred.
+            if not (field.is_relation and field.concrete):
+                continue
+            paths.append(prefix + name)
+            walk(field.related_model, subtree, f"{prefix}{name}{LOOKUP_SEP}")
+
+    if isinstance(selected, dict):
+        walk(queryset.model, selected, "")
+    return paths
+
+
+####################
+#      CLASSES     #
+####################
+
+
+@dataclass(frozen=True)
+class Relation:
+    """
+    A nested serializer for a relation of a Django model.
+
+    Attributes:
+        name (str): The name of the serializer field.
+        accessor (str): The attribute of the model instances giving access to the related object(s).
+        many (bool): Whether the relation holds many objects (reverse foreign keys and many to many).
+        serializer (type[ModelSerializer]): The serializer of the related objects.
+        reverse (bool): Whether the relation is defined on the related model (e.g. reverse foreign keys).
+        join_fields (tuple[str, ...]): The fields of the related model needed to match them back to their instances when prefetched.
+    """
+
+    name: str
+    accessor: str
+    many: bool
+    serializer: type["ModelSerializer"]
+    reverse: bool = False
+    join_fields: tuple[str, ...] = ()
+    _extract: Callable[[DjangoModel], dict[str, Any]] = DataclassField(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        object.__setattr__(self, "_extract", self.serializer.get_model_to_dict())
+
+    @property
+    def model(self) -> type[DjangoModel]:
+        """
+        The Django model of the related objects.
+        """
+        return self.serializer.config["model"]
+
+    def extract(self, obj: DjangoModel) -> dict[str, Any] | list[dict[str, Any]] | None:
+        """
+        Extracts the related object(s) of a model instance.
+
+        Many relations are read with `.all()`, so they use the prefetched objects when
+        the queryset was prepared with the serializer query plan.
+
+        Args:
+            obj (DjangoModel): The Django model instance.
+
+        Returns:
+            dict | list[dict] | None: The related object dictionary, a list of them for many relations, or None.
+        """
+        if self.many:
+            return [self._extract(item) for item in getattr(obj, self.accessor).all()]
+        try:
+            related = getattr(obj, self.accessor)
+        except ObjectDoesNotExist:
+            # Missing reverse one to one relations raise instead of returning None.
+            return None
+        return None if related is None else self._extract(related)
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    """
+    The `select_related` and `prefetch_related` lookups needed to serialize a queryset.
+
+    Single relations are joined with `select_related`, while many relations are
+    prefetched with a queryset that applies the plan of the nested serializer. Nested
+    trees are therefore loaded with a constant number of queries. The columns are
+    restricted with `only` to the ones the serializers read.
+
+    Attributes:
+        select_related (tuple[str, ...]): The `select_related` lookups.
+        prefetch_related (tuple[Prefetch, ...]): The `prefetch_related` lookups.
+        only (tuple[str, ...]): The `only` lookups. Empty to load every column.
+    """
+
+    select_related: tuple[str, ...] = ()
+    prefetch_related: tuple[Prefetch, ...] = ()
+    only: tuple[str, ...] = ()
+
+    @classmethod
+    def from_relations(
+        cls, relations: tuple[Relation, ...], only: tuple[str, ...] = ()
+    ) -> "QueryPlan":
+        """
+        Computes the plan of a serializer from its (nested) relations.
+
+        Args:
+            relations (tuple[Relation, ...]): The relations of the serializer.
+            only (tuple[str, ...], optional): The fields read by the serializer itself. Defaults to none (no projection).
+
+        Returns:
+            QueryPlan: The query plan.
+        """
+        select_related, prefetch_related = [], []
+        only_fields = list(only)
+        for relation in relations:
+            nested_plan = relation.serializer.query_plan()
+            if relation.many:
+                nested_plan = nested_plan.with_only(*relation.join_fields)
+                queryset = nested_plan.apply(relation.model._default_manager.all())
+                prefetch_related.append(Prefetch(relation.accessor, queryset=queryset))
+                continue
+            if not relation.reverse:
+                # Forward relations cannot be deferred and traversed at the same time.
+                only_fields.append(relation.accessor)
+            nested_plan = nested_plan.prefixed(relation.accessor)
+            select_related.append(relation.accessor)
+            select_related.extend(nested_plan.select_related)
+            prefetch_related.extend(nested_plan.prefetch_related)
+            only_fields.extend(nested_plan.only)
+        # Without a projection of its own, the nested ones would defer this model fields.
+        only = tuple(dict.fromkeys(only_fields)) if only else ()
+        return cls(tuple(select_related), tuple(prefetch_related), only)
+
+    def with_only(self, *fields: str) -> "QueryPlan":
+        """
+        Returns the plan loading the given fields too, if it restricts the loaded columns.
+
+        Args:
+            *fields: The names of the fields to load.
+
+        Returns:
+            QueryPlan: The extended plan.
+        """
+        if not self.only or not fields:
+            return self
+        return replace(self, only=tuple(dict.fromkeys(self.only + fields)))
+
+    def prefixed(self, prefix: str) -> "QueryPlan":
+        """
+        Returns the plan with all of its lookups starting from the given relation.
+
+        Args:
+            prefix (str): The relation to follow first.
+
+        Returns:
+            QueryPlan: The prefixed plan.
+        """
+        return QueryPlan(
+            tuple(f"{prefix}__{lookup}" for lookup in self.select_related),
+            tuple(
+                Prefetch(f"{prefix}__{lookup.prefetch_through}", lookup.queryset)
+                for lookup in self.prefetch_related
+            ),
+            tuple(f"{prefix}__{lookup}" for lookup in self.only),
+        )
+
+    def apply(
+        self, queryset: QuerySet, *, prefetch: bool = True, project: bool = True
+    ) -> QuerySet:
+        """
+        Applies the plan to a queryset.
+
+        The plan can be applied to a queryset more than once: the relations that the
+        queryset already prefetches are not prefetched again. The relations it already
+        selects are added to the projection, which is skipped when it selects every
+        foreign key. Querysets of `values()`/`values_list()` rows are returned unchanged.
+
+        Args:
+            queryset (QuerySet): The queryset to serialize.
+            prefetch (bool, optional): Whether to add the `prefetch_related` lookups. Defaults to True.
+            project (bool, optional): Whether to restrict the loaded columns with `only`. Defaults to True.
+
+        Returns:
+            QuerySet: The queryset with the lookups applied.
+        """
+        if getattr(queryset, "_fields", None) is not None:
+            # Rows of values() querysets are not model instances.
+            return queryset
+        # An empty select_related() would follow every foreign key.
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if prefetch and self.prefetch_related:
+            # Django rejects a Prefetch on a path that is already prefetched (e.g. by
+            # a previous `apply`, or by the caller), whose lookups are kept instead.
+            seen = _prefetched_paths(queryset)
+            lookups = [
+                lookup
+                for lookup in self.prefetch_related
+                if _prefetch_path(lookup) not in seen
+            ]
+            if lookups:
+                queryset = queryset.prefetch_related(*lookups)
+        if project and self.only:
+            selected = _selected_relations(queryset)
+            if selected is not None:
+                queryset = queryset.only(*dict.fromkeys(self.only + tuple(selected)))
+        return queryset
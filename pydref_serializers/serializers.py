@@ -1,14 +1,363 @@
+import json
 import logging
-from typing import ClassVar, TypedDict
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache, partial
+from ipaddress import IPv4Address, IPv6Address, ip_address
+from itertools import islice
+from pathlib import Path, PurePath
+from time import perf_counter
+from types import NoneType, UnionType
+from typing import (
+    TYPE_CHECKING,
+    Annotated,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    TypedDict,
+    Union,
+    get_args,
+    get_origin,
+)
+from uuid import UUID
+from weakref import WeakKeyDictionary
 
 from django.db.models import Model as DjangoModel
-from django.forms.models import model_to_dict as django_model_to_dict
-from pydantic import BaseModel
-from typing_extensions import Self
+from django.db.models import QuerySet, TextField, prefetch_related_objects
+from django.db.models.functions import Cast
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    IPvAnyAddress,
+    Json,
+    TypeAdapter,
+    ValidationError,
+)
+from pydantic_core import Url
+from typing_extensions import NotRequired, Self
+
+from .extractors import ModelExtractor
+from .fieldsets import MAX_FIELDSETS, FieldSet, resolve_fieldset
+from .ingest import DEFAULT_BATCH_SIZE, IngestResult, bulk_ingest
+from .mappers.passthrough import RawJSON, splice_raw_json, uses_raw_json
+from .normalization import normalize
+from .observers import SerializationEvent, get_observer
+from .output_cache import OutputCache
+from .pagination import DEFAULT_PAGE_SIZE, Page, paginate
+from .relations import QueryPlan, Relation
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
 
 logger = logging.getLogger(__name__)
 
 
+####################
+#      TYPES       #
+####################
+
+_ModelToDict = Callable[[DjangoModel], dict[str, Any]]
+
+
+####################
+#    CONSTANTS     #
+####################
+
+DEFAULT_CHUNK_SIZE = 2000
+
+_EMPTY = object()
+
+# Per-class caches (list adapters, compiled helpers, ...). Keyed weakly so that
+# dynamically built serializer classes can still be garbage collected.
+_CLASS_CACHES: "WeakKeyDictionary[type, dict[str, Any]]" = WeakKeyDictionary()
+
+# The annotations whose trusted values (as read from the database) are already the
+# values validation would produce.
+_TRUSTED_TYPES = frozenset(
+    {
+        Any,
+        int,
+        float,
+        str,
+        bool,
+        Decimal,
+        date,
+        datetime,
+        time,
+        timedelta,
+        UUID,
+        EmailStr,
+    }
+)
+
+
+####################
+#    FUNCTIONS     #
+####################
+
+
+def _class_cache(cls: type) -> dict[str, Any]:
+    """
+    Returns the private cache dictionary attached to the given serializer class.
+
+    Args:
+        cls (type): The serializer class.
+
+    Returns:
+        dict[str, Any]: A dictionary owned by `cls` (and not by its subclasses).
+    """
+    cache = _CLASS_CACHES.get(cls)
+    if cache is None:
+        cache = _CLASS_CACHES.setdefault(cls, {})
+    return cache
+
+
+def _iter_chunks(
+    objs: Iterable[DjangoModel], chunk_size: int
+) -> Iterator[list[DjangoModel]]:
+    """
+    Yields lists of at most `chunk_size` objects.
+
+    Querysets are consumed with `.iterator(chunk_size)`, so their results are neither
+    cached nor loaded in memory all at once.
+
+    Args:
+        objs (Iterable[DjangoModel]): A queryset or any iterable of model instances.
+        chunk_size (int): The maximum number of objects per chunk.
+
+    Yields:
+        list[DjangoModel]: The next chunk of objects.
+    """
+    if isinstance(objs, QuerySet):
+        objs = objs.iterator(chunk_size=chunk_size)
+    iterator = iter(objs)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+async def _aiter_chunks(
+    objs: AsyncIterable[DjangoModel], chunk_size: int
+) -> AsyncIterator[list[DjangoModel]]:
+    """
+    Asynchronously yields lists of at most `chunk_size` objects.
+
+    Querysets are consumed with `.aiterator(chunk_size)`.
+
+    Args:
+        objs (AsyncIterable[DjangoModel]): A queryset or any async iterable of model instances.
+        chunk_size (int): The maximum number of objects per chunk.
+
+    Yields:
+        list[DjangoModel]: The next chunk of objects.
+    """
+    if isinstance(objs, QuerySet):
+        objs = objs.aiterator(chunk_size=chunk_size)
+    chunk = []
+    async for obj in objs:
+        chunk.append(obj)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _find_subclass(annotation: Any, base: type) -> type | None:
+    """
+    Returns the subclass of `base` used by an annotation (e.g. `StatusEnum | None`), if any.
+
+    Args:
+        annotation (Any): The field annotation.
+        base (type): The base class to look for.
+
+    Returns:
+        type | None: The subclass, or None if the annotation does not use one.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, base):
+        return annotation
+    for arg in get_args(annotation):
+        subclass = _find_subclass(arg, base)
+        if subclass is not None:
+            return subclass
+    return None
+
+
+def _enum_coercer(enum_type: type[Enum]) -> Callable[[Any], Any]:
+    """
+    Returns a function converting raw choice values to members of the given Enum.
+
+    Args:
+        enum_type (type[Enum]): The Enum generated for a field with choices.
+
+    Returns:
+        Callable[[Any], Any]: The coercion function. None values are kept as they are.
+    """
+    members = {member.value: member for member in enum_type}
+    members.update({member: member for member in enum_type})
+
+    def coerce(value: Any) -> Any:
+        member = members.get(value)
+        if member is None and value is not None:
+            member = enum_type(value)
+        return member
+
+    return coerce
+
+
+def _nested_coercer(
+    serializer: type["ModelSerializer"], many: bool
+) -> Callable[[Any], Any]:
+    """
+    Returns a function building nested serializers from trusted dictionaries.
+
+    Args:
+        serializer (type[ModelSerializer]): The nested serializer.
+        many (bool): Whether the field holds a list of nested serializers.
+
+    Returns:
+        Callable[[Any], Any]: The coercion function. None values are kept as they are.
+    """
+    construct = serializer.trusted_constructor()
+
+    if many:
+        return lambda values: [construct(value) for value in values]
+    return lambda value: None if value is None else construct(value)
+
+
+def _value_coercer(
+    accepts: type | tuple[type, ...], convert: Callable[[Any], Any]
+) -> Callable[[Any], Any]:
+    """
+    Returns a function converting the values of the given types, and keeping the others.
+
+    Args:
+        accepts (type | tuple[type, ...]): The types of the values to convert.
+        convert (Callable[[Any], Any]): The conversion.
+
+    Returns:
+        Callable[[Any], Any]: The coercion function.
+    """
+    return lambda value: convert(value) if isinstance(value, accepts) else value
+
+
+def _is_trusted_type(annotation: Any) -> bool:
+    """
+    Whether the trusted values of an annotation (e.g. `int | None`) need no conversion.
+    """
+    origin = get_origin(annotation)
+    if origin in (Union, UnionType):
+        return all(
+            arg is NoneType or _is_trusted_type(arg) for arg in get_args(annotation)
+        )
+    if origin is Annotated:
+        # The constraints (e.g. of `PositiveInt`) were enforced by the database.
+        return _is_trusted_type(get_args(annotation)[0])
+    return annotation in _TRUSTED_TYPES
+
+
+def _trusted_coercer(annotation: Any) -> Callable[[Any], Any] | None:
+    """
+    Returns the conversion applied to the trusted values of a field, if any is needed.
+
+    Values of types validation converts (e.g. the strings of URLs, file paths and IP
+    addresses) are converted the same way, so that trusted instances dump exactly
+    like validated ones. Constrained types (e.g. `PositiveInt`) and emails are kept
+    as they are. Only the types without a dedicated conversion are validated.
+
+    Args:
+        annotation (Any): The field annotation.
+
+    Returns:
+        Callable[[Any], Any] | None: The coercion function, or None.
+    """
+    if (enum_type := _find_subclass(annotation, Enum)) is not None:
+        return _enum_coercer(enum_type)
+    if (serializer := _find_subclass(annotation, ModelSerializer)) is not None:
+        return _nested_coercer(serializer, many=get_origin(annotation) is list)
+    if _is_trusted_type(annotation):
+        return None
+    if _find_subclass(annotation, Url) is not None:
+        return _value_coercer(str, Url)
+    if _find_subclass(annotation, IPvAnyAddress) is not None:
+        return _value_coercer(str, ip_address)
+    if _find_subclass(annotation, Path) is not None:
+        # Validating would check that the file exists.
+        return _value_coercer(str, Path)
+    if _find_subclass(annotation, Json) is not None:
+        return _value_coercer((str, bytes, bytearray), json.loads)
+    if _find_subclass(annotation, bytes) is not None:
+        # e.g. the `memoryview`s of binary columns on PostgreSQL.
+        return _value_coercer((bytearray, memoryview), bytes)
+    validate = TypeAdapter(annotation).validate_python
+    return lambda value: None if value is None else validate(value)
+
+
+def _trusted_constructor(cls: type[BaseModel]) -> Callable[[dict[str, Any]], Any]:
+    """
+    Compiles a function building instances of a pydantic model without validation.
+
+    Args:
+        cls (type[BaseModel]): The pydantic model class.
+
+    Returns:
+        Callable[[dict[str, Any]], Any]: The constructor (see `ModelSerializer.trusted_constructor`).
+    """
+    coercers = [
+        (name, coerce)
+        for name, field_info in cls.model_fields.items()
+        if (coerce := _trusted_coercer(field_info.annotation)) is not None
+    ]
+    field_names = cls.model_fields.keys()
+    set_attr = object.__setattr__
+    new = cls.__new__
+    needs_post_init = bool(cls.__pydantic_post_init__)
+
+    def construct(data: dict[str, Any]) -> Any:
+        for name, coerce in coercers:
+            if name in data:
+                data[name] = coerce(data[name])
+        if needs_post_init or not field_names <= data.keys():
+            return cls.model_construct(**data)
+        obj = new(cls)
+        set_attr(obj, "__dict__", data)
+        set_attr(obj, "__pydantic_fields_set__", set(data))
+        set_attr(obj, "__pydantic_extra__", None)
+        set_attr(obj, "__pydantic_private__", None)
+        return obj
+
+    return construct
+
+
+def _to_model_value(value: Any) -> Any:
+    """
+    Converts a validated serializer value to the value stored by the Django field.
+
+    Args:
+        value (Any): The serializer field value.
+
+    Returns:
+        Any: The value to set on the model instance (e.g. the value of a choice Enum, or the string of a URL).
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, RawJSON):
+        return value.loads()
+    if isinstance(value, (Url, IPv4Address, IPv6Address, PurePath)):
+        return str(value)
+    return value
+
+
+####################
+#      CLASSES     #
+####################
+
+
 class BaseSerializer(BaseModel):
     """
     Base serializer class that all other serializers should inherit from.
@@ -27,10 +376,22 @@ class ConfigSerializerDict(TypedDict):
         The Django model to be serialized.
     fields : list[str] | None
         The list of fields to be included in the serialized output. If None, all fields will be included.
+    extractor : ModelExtractor
+        The precompiled function reading the serializer fields from a model instance.
+    relations : tuple[Relation, ...]
+        The nested serializers of the model relations.
+    partial : bool
+        Whether the serializer was built with `partial=True` (every field optional).
+    raw_json : bool
+        Whether the serializer, or one of its nested serializers, has RawJSON fields.
     """
 
     model: type[DjangoModel]
     fields: list[str] | None
+    extractor: NotRequired[ModelExtractor]
+    relations: NotRequired[tuple[Relation, ...]]
+    partial: NotRequired[bool]
+    raw_json: NotRequired[bool]
 
 
 class ModelSerializer(BaseSerializer):
@@ -46,19 +407,1090 @@ class ModelSerializer(BaseSerializer):
 
     config: ClassVar[ConfigSerializerDict]
 
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """
+        Dumps the serializer to JSON, with the RawJSON values spliced in verbatim.
+
+        Args:
+            **kwargs: The options of `BaseModel.model_dump_json`.
+
+        Returns:
+            str: The JSON document.
+        """
+        return self.json_dumper(super().model_dump_json)(**kwargs)
+
+    @classmethod
+    def is_schema_compiled(cls) -> bool:
+        """
+        Whether the pydantic-core schema of this serializer was compiled.
+
+        Returns:
+            bool: False if the serializer was built with `defer=True` and not used nor warmed up yet.
+        """
+        return cls.__pydantic_complete__
+
+    @classmethod
+    def compile_schema(cls) -> bool:
+        """
+        Compiles the deferred schema of this serializer and of its nested serializers.
+
+        Returns:
+            bool: Whether a schema was compiled, False if all of them were compiled already.
+        """
+        config = getattr(cls, "config", None) or {}
+        compiled = False
+        for relation in config.get("relations", ()):
+            compiled |= relation.serializer.compile_schema()
+        if not cls.__pydantic_complete__:
+            cls.model_rebuild(force=True)
+            compiled = True
+        return compiled
+
+    @classmethod
+    def list_adapter(cls) -> TypeAdapter:
+        """
+        Returns a cached `TypeAdapter` for a list of instances of this serializer.
+
+        The adapter is created once per serializer class, so validating or dumping
+        a whole result set only costs a single pydantic-core call.
+
+        Returns:
+            TypeAdapter: The `TypeAdapter(list[cls])` for this serializer class.
+        """
+        cache = _class_cache(cls)
+        adapter = cache.get("list_adapter")
+        if adapter is None:
+            adapter = cache["list_adapter"] = TypeAdapter(list[cls])
+        return adapter
+
+    @classmethod
+    def fieldset(
+        cls,
+        include: Iterable[str] | None = None,
+        exclude: Iterable[str] | None = None,
+    ) -> FieldSet:
+        """
+        Returns the cached projection of this serializer on a subset of its fields.
+
+        The projection is compiled once per distinct set of fields (the most recently
+        used ones are kept, see `MAX_FIELDSETS`), instead of building a serializer class
+        per combination with `with_fields`. It only loads, extracts, validates and dumps
+        the selected fields:
+
+            BookSerializer.fieldset(include=request.GET["fields"].split(",")).from_queryset(books)
+
+        Args:
+            include (Iterable[str] | None, optional): The fields to keep. Defaults to None (all the fields).
+            exclude (Iterable[str] | None, optional): The fields to drop. Defaults to None.
+
+        Returns:
+            FieldSet: The compiled projection.
+
+        Raises:
+            ValueError: If the serializer was not built by the builder, or a field is unknown.
+        """
+        names = resolve_fieldset(cls, include, exclude)
+        cache = _class_cache(cls)
+        compile_fieldset = cache.get("fieldset")
+        if compile_fieldset is None:
+            compile_fieldset = cache["fieldset"] = lru_cache(maxsize=MAX_FIELDSETS)(
+                partial(FieldSet.compile, cls)
+            )
+        return compile_fieldset(names)
+
+    @classmethod
+    def fieldset_without_relations(cls) -> FieldSet:
+        """
+        Returns the cached projection of this serializer without its relations.
+
+        It is compiled once per class and kept apart from the field sets of `fieldset`,
+        so serializing the related objects separately (e.g. with `normalize`) does not
+        evict the projections requested at runtime.
+
+        Returns:
+            FieldSet: The compiled projection.
+
+        Raises:
+            ValueError: If the serializer was not built by the builder.
+        """
+        cache = _class_cache(cls)
+        fieldset = cache.get("fieldset_without_relations")
+        if fieldset is None:
+            config = getattr(cls, "config", None) or {}
+            relations = config.get("relations", ())
+            names = resolve_fieldset(cls, exclude=[r.name for r in relations])
+            fieldset = cache["fieldset_without_relations"] = FieldSet.compile(
+                cls, names
+            )
+        return fieldset
+
+    @classmethod
+    def use_output_cache(
+        cls,
+        backend: Any = None,
+        *,
+        version_field: str | None = None,
+        timeout: float | None = None,
+        namespace: str | None = None,
+    ) -> OutputCache:
+        """
+        Caches the JSON dumped for each row by this serializer (see `OutputCache`).
+
+        Once enabled, `dump_many_json` assembles the lists of model instances and
+        querysets from cached rows, and only converts the rows missing from the cache.
+        Calling it again replaces the previous cache of the class.
+
+        Args:
+            backend (Any, optional): A LocalOutputCache or any Django cache backend (e.g. `caches["default"]`). Defaults to a LocalOutputCache.
+            version_field (str | None, optional): The model field holding the version of each row (e.g. `updated_at`). Defaults to None (rows are only invalidated by the `post_save`/`post_delete` signals of this process, and by expiration).
+            timeout (float | None, optional): The expiration of the entries in seconds. Defaults to None (the backend default, 5 minutes for a LocalOutputCache).
+            namespace (str | None, optional): The prefix of the cache keys. Defaults to one derived from the serializer.
+
+        Returns:
+            OutputCache: The output cache of the serializer.
+
+        Raises:
+            ValueError: If the serializer was not built by the builder.
+        """
+        cls.disable_output_cache()
+        output_cache = OutputCache(
+            cls,
+            backend,
+            version_field=version_field,
+            timeout=timeout,
+            namespace=namespace,
+        )
+        _class_cache(cls)["output_cache"] = output_cache
+        return output_cache
+
+    @classmethod
+    def get_output_cache(cls) -> OutputCache | None:
+        """
+        Returns the output cache enabled with `use_output_cache`.
+
+        Returns:
+            OutputCache | None: The output cache, or None if the output is not cached.
+        """
+        return _class_cache(cls).get("output_cache")
+
+    @classmethod
+    def disable_output_cache(cls) -> None:
+        """
+        Stops caching the output of this serializer.
+        """
+        output_cache = _class_cache(cls).pop("output_cache", None)
+        if output_cache is not None:
+            output_cache.disconnect()
+
+    @classmethod
+    def query_plan(cls) -> QueryPlan:
+        """
+        Returns the lookups needed to load exactly what this serializer reads.
+
+        The plan holds the `select_related`/`prefetch_related` lookups of the nested
+        relations, and the `only` projection of the declared fields (plus the primary
+        key and the foreign keys the relations need). Serializers that were not built
+        with the builder do not restrict the loaded columns. The plan is computed once
+        per class: Django copies the lookups of the `Prefetch` querysets when it
+        evaluates them, so they can be shared by every prepared queryset.
+
+        Returns:
+            QueryPlan: The query plan of this serializer.
+        """
+        cache = _class_cache(cls)
+        plan = cache.get("query_plan")
+        if plan is None:
+            config = getattr(cls, "config", None) or {}
+            extractor = config.get("extractor")
+            only = ()
+            if extractor is not None:
+                only = (config["model"]._meta.pk.name, *extractor.names)
+            plan = cache["query_plan"] = QueryPlan.from_relations(
+                config.get("relations", ()), only=only
+            )
+        return plan
+
+    @classmethod
+    def prepare_queryset(
+        cls, queryset: QuerySet, *, prefetch: bool = True, project: bool = True
+    ) -> QuerySet:
+        """
+        Prepares a queryset to be serialized with this serializer.
+
+        The query plan is applied, so nested relations are loaded with a constant
+        number of queries instead of one query per row, and the columns the serializer
+        does not read are not loaded at all.
+
+        Args:
+            queryset (QuerySet): The queryset to serialize.
+            prefetch (bool, optional): Whether to add the `prefetch_related` lookups. Defaults to True.
+            project (bool, optional): Whether to restrict the loaded columns with `only`. Defaults to True.
+
+        Returns:
+            QuerySet: The prepared queryset.
+        """
+        return cls.query_plan().apply(queryset, prefetch=prefetch, project=project)
+
+    @classmethod
+    def warn_deferred_fields(cls, obj: DjangoModel) -> None:
+        """
+        Logs a warning if reading a model instance would load deferred fields.
+
+        Every deferred field read by the serializer costs one extra query per
+        instance, which usually means the queryset was not prepared with
+        `prepare_queryset`. The warning is logged once per serializer class and set
+        of deferred fields.
+
+        Args:
+            obj (DjangoModel): The Django model instance to check.
+        """
+        config = getattr(cls, "config", None) or {}
+        extractor = config.get("extractor")
+        if extractor is None or not isinstance(obj, DjangoModel):
+            return
+        deferred = extractor.deferred_attnames(obj)
+        if not deferred:
+            return
+        warned = _class_cache(cls).setdefault("warned_deferred", set())
+        key = frozenset(deferred)
+        if key in warned:
+            return
+        warned.add(key)
+        logger.warning(
+            "%s reads deferred fields of %s, causing one extra query per instance: %s",
+            cls.__name__,
+            obj.__class__.__name__,
+            ", ".join(sorted(deferred)),
+        )
+
+    @classmethod
+    def get_model_to_dict(cls) -> _ModelToDict:
+        """
+        Returns the function used by default to convert model instances to dictionaries.
+
+        Built serializers use their precompiled `ModelExtractor`, which only reads the
+        declared fields. Other serializers fall back to Django's `model_to_dict`.
+
+        Returns:
+            Callable: A function that converts a Django model instance to a dictionary.
+        """
+        config = getattr(cls, "config", None) or {}
+        extractor = config.get("extractor")
+        if extractor is not None:
+            return extractor
+        # Imported on demand: django.forms loads the whole template engine.
+        from django.forms.models import model_to_dict
+
+        return model_to_dict
+
+    @classmethod
+    def trusted_constructor(cls) -> Callable[[dict[str, Any]], Self]:
+        """
+        Returns the cached function building instances of this class without validation.
+
+        Trusted rows skip validation entirely, so only the conversions needed to produce
+        the same output as validated rows are applied: raw choice values are converted to
+        the generated Enum types, nested dictionaries to nested serializers, and missing
+        fields get their defaults. Rows holding
+        every field skip `model_construct` and are set up directly, which is several times
+        cheaper.
+
+        Returns:
+            Callable[[dict[str, Any]], Self]: The constructor. It takes ownership of the given dictionary.
+        """
+        cache = _class_cache(cls)
+        constructor = cache.get("trusted_constructor")
+        if constructor is None:
+            constructor = cache["trusted_constructor"] = _trusted_constructor(cls)
+        return constructor
+
+    @classmethod
+    def has_raw_json(cls) -> bool:
+        """
+        Whether the serializer, or one of its nested serializers, has RawJSON fields.
+
+        Built serializers decide it when built (see `ConfigSerializerDict.raw_json`);
+        other serializers are assumed to have some.
+
+        Returns:
+            bool: True if the JSON dumps of the serializer need `splice_raw_json`.
+        """
+        config = getattr(cls, "config", None) or {}
+        return config.get("raw_json", True)
+
+    @classmethod
+    def json_dumper(
+        cls, dump: Callable[..., str | bytes]
+    ) -> Callable[..., str | bytes]:
+        """
+        Returns a JSON dump function of the serializer, splicing its RawJSON values.
+
+        Serializers without RawJSON fields (see `has_raw_json`) get the dump function
+        itself, skipping the `splice_raw_json` wrapper and its pass over the output.
+
+        Args:
+            dump (Callable[..., str | bytes]): The dump function (e.g. `TypeAdapter.dump_json`).
+
+        Returns:
+            Callable[..., str | bytes]: The dump function, wrapped if needed.
+        """
+        if not cls.has_raw_json():
+            return dump
+        return partial(splice_raw_json, dump)
+
+    @classmethod
+    def _raw_json_fields(cls) -> frozenset[str]:
+        """
+        Returns the fields annotated with RawJSON, e.g. by the passthrough field mapper.
+        """
+        cache = _class_cache(cls)
+        fields = cache.get("raw_json_fields")
+        if fields is None:
+            fields = cache["raw_json_fields"] = frozenset(
+                name
+                for name, field_info in cls.model_fields.items()
+                if uses_raw_json(field_info.annotation)
+            )
+        return fields
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> Self:
+        """
+        Create a serializer instance from already valid data, without validating it.
+
+        Use it only for data coming from a trusted source (e.g. rows just loaded from
+        the database). See `trusted_constructor`.
+
+        Args:
+            data (dict[str, Any]): The field values.
+
+        Returns:
+            Self: An instance of the serializer class.
+        """
+        return cls.trusted_constructor()(data)
+
     @classmethod
     def from_model(
-        cls: type[BaseModel], obj: DjangoModel, *, model_to_dict=django_model_to_dict
+        cls,
+        obj: DjangoModel,
+        *,
+        model_to_dict: _ModelToDict | None = None,
+        trusted: bool = False,
     ) -> Self:
         """
         Convert a Django model instance to a Pydantic model instance.
 
         Args:
             obj (DjangoModel): The Django model instance to convert.
-            model_to_dict (Callable): A function that converts a Django model instance to a dictionary.
+            model_to_dict (Callable | None): A function that converts a Django model instance to a dictionary. Defaults to `get_model_to_dict()`.
+            trusted (bool, optional): Whether to skip validation because the instance comes from a trusted source (see `from_trusted_dict`). Defaults to False.
 
         Returns:
             Self: An instance of the Pydantic model class with the values from the Django model instance.
         """
+        if model_to_dict is None:
+            model_to_dict = cls.get_model_to_dict()
+            cls.warn_deferred_fields(obj)
+        observer = get_observer()
+        if observer is None:
+            model_dict = model_to_dict(obj)
+            if trusted:
+                return cls.from_trusted_dict(model_dict)
+            return cls(**model_dict)
+
+        start = perf_counter()
         model_dict = model_to_dict(obj)
-        return cls(**model_dict)
+        extracted = perf_counter()
+        try:
+            instance = (
+                cls.from_trusted_dict(model_dict) if trusted else cls(**model_dict)
+            )
+        except ValidationError as error:
+            observer.on_validation_error(cls, "from_model", error)
+            raise
+        observer.on_serialize(
+            SerializationEvent(
+                cls,
+                "from_model",
+                1,
+                extract_seconds=extracted - start,
+                validate_seconds=perf_counter() - extracted,
+            )
+        )
+        return instance
+
+    @classmethod
+    def from_models(
+        cls,
+        objs: Iterable[DjangoModel],
+        *,
+        model_to_dict: _ModelToDict | None = None,
+        as_dicts: bool = False,
+        trusted: bool = False,
+    ) -> list[Self] | list[dict[str, Any]]:
+        """
+        Convert many Django model instances at once.
+
+        The rows are converted to dictionaries in a single loop and then validated
+        together with the cached list adapter (see `list_adapter`).
+
+        Args:
+            objs (Iterable[DjangoModel]): The Django model instances to convert.
+            model_to_dict (Callable | None): A function that converts a Django model instance to a dictionary. Defaults to `get_model_to_dict()`.
+            as_dicts (bool, optional): Whether to return plain dictionaries instead of serializer instances. Defaults to False.
+            trusted (bool, optional): Whether to skip validation because the instances come from a trusted source (see `from_trusted_dict`). Defaults to False.
+
+        Returns:
+            list[Self] | list[dict[str, Any]]: The serializer instances (or their dumped dictionaries), in input order.
+        """
+        return cls._from_models(
+            objs, model_to_dict, trusted, "from_models", "python" if as_dicts else None
+        )
+
+    @classmethod
+    def _from_models(
+        cls,
+        objs: Iterable[DjangoModel],
+        model_to_dict: _ModelToDict | None,
+        trusted: bool,
+        operation: str,
+        dump: str | None = None,
+    ) -> Any:
+        start = perf_counter() if get_observer() is not None else None
+        rows = []
+        objs = iter(objs)
+        if (first := next(objs, _EMPTY)) is not _EMPTY:
+            if model_to_dict is None:
+                model_to_dict = cls.get_model_to_dict()
+                # Rows of the same queryset share their deferred fields.
+                cls.warn_deferred_fields(first)
+            rows.append(model_to_dict(first))
+            rows.extend(map(model_to_dict, objs))
+        return cls._from_dicts(rows, trusted, operation, dump, start)
+
+    @classmethod
+    def from_dicts(
+        cls,
+        rows: list[dict[str, Any]],
+        *,
+        as_dicts: bool = False,
+        trusted: bool = False,
+    ) -> list[Self] | list[dict[str, Any]]:
+        """
+        Convert many rows, already extracted to dictionaries, at once.
+
+        Args:
+            rows (list[dict[str, Any]]): The field values of each row.
+            as_dicts (bool, optional): Whether to return plain dictionaries instead of serializer instances. Defaults to False.
+            trusted (bool, optional): Whether to skip validation because the rows come from a trusted source (see `from_trusted_dict`). Defaults to False.
+
+        Returns:
+            list[Self] | list[dict[str, Any]]: The serializer instances (or their dumped dictionaries), in input order.
+        """
+        return cls._from_dicts(
+            rows, trusted, "from_dicts", "python" if as_dicts else None
+        )
+
+    @classmethod
+    def _from_dicts(
+        cls,
+        rows: list[dict[str, Any]],
+        trusted: bool,
+        operation: str,
+        dump: str | None = None,
+        start: float | None = None,
+    ) -> Any:
+        """
+        Validates (or constructs) and optionally dumps rows, reporting it to the observer.
+
+        Args:
+            rows (list[dict[str, Any]]): The field values of each row.
+            trusted (bool): Whether to skip validation.
+            operation (str): The public method converting the rows, for the observer.
+            dump (str | None, optional): Dump the instances with the list adapter, in `"python"` or `"json"` mode. Defaults to None (return the instances).
+            start (float | None, optional): When the rows started to be extracted, as given by `perf_counter`. Defaults to None (not extracted).
+
+        Returns:
+            Any: The serializer instances, or their dump.
+        """
+        observer = get_observer()
+        if observer is not None:
+            extracted = perf_counter()
+        adapter = cls.list_adapter()
+        if trusted:
+            construct = cls.trusted_constructor()
+            instances = [construct(row) for row in rows]
+        else:
+            try:
+                instances = adapter.validate_python(rows)
+            except ValidationError as error:
+                if observer is not None:
+                    observer.on_validation_error(cls, operation, error)
+                raise
+        dump_function = None
+        if dump is not None:
+            if dump == "json":
+                dump_function = cls.json_dumper(adapter.dump_json)
+            else:
+                dump_function = adapter.dump_python
+        if observer is None:
+            return dump_function(instances) if dump_function else instances
+
+        validated = perf_counter()
+        if dump_function is not None:
+            instances = dump_function(instances)
+        observer.on_serialize(
+            SerializationEvent(
+                cls,
+                operation,
+                len(rows),
+                extract_seconds=extracted - start if start is not None else 0.0,
+                validate_seconds=validated - extracted,
+                dump_seconds=perf_counter() - validated,
+            )
+        )
+        return instances
+
+    @classmethod
+    def from_queryset(
+        cls,
+        queryset: QuerySet,
+        *,
+        model_to_dict: _ModelToDict | None = None,
+        as_dicts: bool = False,
+        trusted: bool = False,
+    ) -> list[Self] | list[dict[str, Any]]:
+        """
+        Evaluate a queryset and convert all of its rows at once.
+
+        The queryset is prepared with `prepare_queryset` first, so nested relations are
+        loaded with a constant number of queries.
+
+        Args:
+            queryset (QuerySet): The queryset to evaluate.
+            model_to_dict (Callable | None): A function that converts a Django model instance to a dictionary. Defaults to `get_model_to_dict()`.
+            as_dicts (bool, optional): Whether to return plain dictionaries instead of serializer instances. Defaults to False.
+            trusted (bool, optional): Whether to skip validation because the rows come from a trusted source (see `from_trusted_dict`). Defaults to False.
+
+        Returns:
+            list[Self] | list[dict[str, Any]]: The serializer instances (or their dumped dictionaries), in queryset order.
+        """
+        return cls._from_models(
+            cls.prepare_queryset(queryset),
+            model_to_dict,
+            trusted,
+            "from_queryset",
+            "python" if as_dicts else None,
+        )
+
+    @classmethod
+    def from_values(
+        cls,
+        queryset: QuerySet,
+        *,
+        as_dicts: bool = False,
+        trusted: bool = False,
+    ) -> list[Self] | list[dict[str, Any]]:
+        """
+        Convert the rows of a queryset without instantiating Django models.
+
+        The rows are fetched as tuples with `values_list` of the declared fields, mapped
+        positionally onto the serializer fields and validated in a single batch. Model
+        construction (`Model.from_db`, signals, `__init__`) and the per-instance
+        extraction are skipped entirely.
+
+        Args:
+            queryset (QuerySet): The queryset to evaluate.
+            as_dicts (bool, optional): Whether to return plain dictionaries instead of serializer instances. Defaults to False.
+            trusted (bool, optional): Whether to skip validation because the rows come from a trusted source (see `from_trusted_dict`). Defaults to False.
+
+        Returns:
+            list[Self] | list[dict[str, Any]]: The serializer instances (or their dumped dictionaries), in queryset order.
+
+        Raises:
+            ValueError: If the serializer was not built by the builder or has nested relations.
+        """
+        config = getattr(cls, "config", None) or {}
+        extractor = config.get("extractor")
+        if extractor is None or extractor.relations:
+            raise ValueError(
+                f"{cls.__name__} cannot be populated from values: "
+                "only built serializers without nested relations can"
+            )
+        start = perf_counter() if get_observer() is not None else None
+        names = extractor.names
+        raw_json = cls._raw_json_fields()
+        if not raw_json:
+            rows = [
+                dict(zip(names, values))
+                for values in queryset.values_list(*extractor.attnames)
+            ]
+        else:
+            # JSON documents are read as text and kept undecoded (see RawJSON).
+            columns = [
+                Cast(attname, output_field=TextField()) if name in raw_json else attname
+                for name, attname in zip(names, extractor.attnames)
+            ]
+            rows = []
+            for values in queryset.values_list(*columns):
+                row = dict(zip(names, values))
+                for name in raw_json:
+                    if row[name] is not None:
+                        row[name] = RawJSON(row[name])
+                rows.append(row)
+        return cls._from_dicts(
+            rows, trusted, "from_values", "python" if as_dicts else None, start
+        )
+
+    @classmethod
+    def dump_many_json(
+        cls,
+        items: QuerySet | Iterable[Self] | Iterable[DjangoModel],
+        *,
+        include: "set[str] | dict[str, Any] | None" = None,
+        exclude: "set[str] | dict[str, Any] | None" = None,
+        **dump_options: Any,
+    ) -> bytes:
+        """
+        Dumps many serializers to a JSON array in a single pydantic-core call.
+
+        The whole list is encoded by the cached list adapter (see `list_adapter`),
+        instead of joining the `model_dump_json` of each item or going through
+        `json.dumps`. Querysets and model instances are converted with `from_queryset`
+        and `from_models` first, or assembled by the output cache of the serializer
+        when there is one (see `use_output_cache`) and no dump option is given.
+
+        Args:
+            items (QuerySet | Iterable[Self] | Iterable[DjangoModel]): The serializers, model instances or queryset to dump.
+            include (set[str] | dict[str, Any] | None, optional): The fields to include in each item, as for `model_dump_json`. Defaults to None (all the fields).
+            exclude (set[str] | dict[str, Any] | None, optional): The fields to exclude from each item, as for `model_dump_json`. Defaults to None.
+            **dump_options: The other options of `model_dump_json` (e.g. `by_alias`, `exclude_none`, `indent`).
+
+        Returns:
+            bytes: The JSON array.
+        """
+        # Cached rows are dumped with the default options only.
+        output_cache = None
+        if not (include or exclude or dump_options):
+            output_cache = cls.get_output_cache()
+        if isinstance(items, QuerySet):
+            if output_cache is not None:
+                return output_cache.dump_many_json(items)
+            items = cls.from_queryset(items)
+        else:
+            items = list(items)
+            if items and isinstance(items[0], DjangoModel):
+                if output_cache is not None:
+                    return output_cache.dump_many_json(items)
+                items = cls.from_models(items)
+        # Masks of list items apply to every item through the `__all__` key.
+        if include is not None:
+            dump_options["include"] = {"__all__": include}
+        if exclude is not None:
+            dump_options["exclude"] = {"__all__": exclude}
+        dump_json = cls.json_dumper(cls.list_adapter().dump_json)
+        observer = get_observer()
+        if observer is None:
+            return dump_json(items, **dump_options)
+
+        start = perf_counter()
+        dumped = dump_json(items, **dump_options)
+        observer.on_serialize(
+            SerializationEvent(
+                cls, "dump_many_json", len(items), dump_seconds=perf_counter() - start
+            )
+        )
+        return dumped
+
+    @classmethod
+    def paginate(
+        cls,
+        queryset: QuerySet,
+        cursor: str | None = None,
+        *,
+        limit: int = DEFAULT_PAGE_SIZE,
+        order_by: Iterable[str] = ("pk",),
+        as_dicts: bool = False,
+        trusted: bool = False,
+    ) -> Page:
+        """
+        Serializes a page of a queryset with keyset (cursor) pagination.
+
+        Instead of an OFFSET, which makes the database read and skip every previous
+        row, the page is selected with a predicate on the ordering values of the row
+        the cursor points to (e.g. `created_at < x OR (created_at = x AND id < y)`), so
+        the cost of a page does not depend on its depth when the ordering is indexed.
+        The primary key is added to the ordering to make it total. The page is
+        serialized through the batch path (see `from_models`).
+
+        Args:
+            queryset (QuerySet): The queryset to paginate. Its own ordering is replaced.
+            cursor (str | None, optional): The `next_cursor` or `previous_cursor` of a previous page. Defaults to None (the first page).
+            limit (int, optional): The maximum number of rows of the page. Defaults to 50.
+            order_by (Iterable[str], optional): The ordering fields, prefixed with `-` when descending. They must be non-nullable fields of the model, ideally indexed together. Defaults to `("pk",)`.
+            as_dicts (bool, optional): Whether to return plain dictionaries instead of serializer instances. Defaults to False.
+            trusted (bool, optional): Whether to skip validation because the rows come from a trusted source (see `from_trusted_dict`). Defaults to False.
+
+        Returns:
+            Page: The serialized rows, with the cursors of the next and previous pages.
+
+        Raises:
+            ValueError: If the cursor is invalid or was created for another ordering, or an ordering field cannot be used.
+        """
+        return paginate(
+            cls,
+            queryset,
+            cursor,
+            limit=limit,
+            order_by=order_by,
+            as_dicts=as_dicts,
+            trusted=trusted,
+        )
+
+    @classmethod
+    def normalize(
+        cls,
+        items: QuerySet | Iterable[DjangoModel],
+        *,
+        as_json: bool = False,
+    ) -> dict[str, Any] | bytes:
+        """
+        Serializes many model instances with their related objects deduplicated.
+
+        Instead of nesting a copy of each related object in every row referencing it,
+        the rows reference their related objects by primary key (a list of them for
+        many relations), and each distinct related object is converted once, into the
+        `included` section, keyed by model label and primary key. Nested relations of
+        the related objects are normalized too. Within the pass, the rows of each
+        serializer are memoized by primary key, and converted in a single batch per
+        relation.
+
+        Args:
+            items (QuerySet | Iterable[DjangoModel]): The model instances, or a queryset prepared with `prepare_queryset` first.
+            as_json (bool, optional): Whether to dump the document to JSON. Defaults to False.
+
+        Returns:
+            dict[str, Any] | bytes: The document, e.g. `{"data": [{"id": 1, "author": 3}], "included": {"app.Author": {3: {"id": 3, "name": "..."}}}}`.
+
+        Raises:
+            ValueError: If the serializer was not built by the builder.
+        """
+        return normalize(cls, items, as_json=as_json)
+
+    @classmethod
+    def stream_json(
+        cls,
+        queryset: QuerySet | Iterable[DjangoModel],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        model_to_dict: _ModelToDict | None = None,
+        trusted: bool = False,
+    ) -> Iterator[bytes]:
+        """
+        Serialize a queryset to a JSON array, one chunk at a time.
+
+        Querysets are prepared with `prepare_queryset`. Only one chunk of model
+        instances and serializers is alive at any time, so the
+        memory used stays constant regardless of the number of rows. The generator can
+        be passed straight to a `StreamingHttpResponse`.
+
+        Args:
+            queryset (QuerySet | Iterable[DjangoModel]): The rows to serialize. Querysets are consumed with `.iterator(chunk_size)`.
+            chunk_size (int, optional): The number of rows serialized at once. Defaults to 2000.
+            model_to_dict (Callable | None): A function that converts a Django model instance to a dictionary. Defaults to `get_model_to_dict()`.
+            trusted (bool, optional): Whether to skip validation because the rows come from a trusted source (see `from_trusted_dict`). Defaults to False.
+
+        Yields:
+            bytes: Consecutive parts of a JSON array.
+        """
+        if isinstance(queryset, QuerySet):
+            queryset = cls.prepare_queryset(queryset)
+        separator = b"["
+        for chunk in _iter_chunks(queryset, chunk_size):
+            dumped = cls._from_models(
+                chunk, model_to_dict, trusted, "stream_json", "json"
+            )
+            # Strip the brackets of each dumped chunk to splice it into one array.
+            yield separator + dumped[1:-1]
+            separator = b","
+        yield b"[]" if separator == b"[" else b"]"
+
+    @classmethod
+    async def astream(
+        cls,
+        queryset: QuerySet | AsyncIterable[DjangoModel],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        model_to_dict: _ModelToDict | None = None,
+        as_dicts: bool = False,
+        trusted: bool = False,
+        offload: bool = False,
+        executor: "Executor | None" = None,
+    ) -> AsyncIterator[list[Self] | list[dict[str, Any]]]:
+        """
+        Asynchronously serialize a queryset, one chunk at a time.
+
+        Rows are fetched with `QuerySet.aiterator()` (with the related objects of each
+        chunk prefetched following `query_plan`) and each chunk is serialized as soon
+        as it arrives, without a `sync_to_async` thread hop per row. The validation of a
+        chunk is CPU bound: set `offload` (or pass an `executor`) to run it outside of the
+        event loop, so the loop keeps serving other requests during big serializations.
+
+        Args:
+            queryset (QuerySet | AsyncIterable[DjangoModel]): The rows to serialize. Querysets are consumed with `.aiterator(chunk_size)`.
+            chunk_size (int, optional): The number of rows serialized at once. Defaults to 2000.
+            model_to_dict (Callable | None): A function that converts a Django model instance to a dictionary. Defaults to `get_model_to_dict()`.
+            as_dicts (bool, optional): Whether to yield plain dictionaries instead of serializer instances. Defaults to False.
+            trusted (bool, optional): Whether to skip validation because the rows come from a trusted source (see `from_trusted_dict`). Defaults to False.
+            offload (bool, optional): Whether to serialize the chunks in the event loop default executor. Defaults to False.
+            executor (Executor | None, optional): The executor serializing the chunks. Implies `offload`. Defaults to None.
+
+        Yields:
+            list[Self] | list[dict[str, Any]]: The serialized chunks, in queryset order.
+        """
+        # Imported on demand, so that sync only code does not load asyncio nor asgiref.
+        import asyncio
+
+        from asgiref.sync import sync_to_async
+
+        serialize = partial(
+            cls.from_models,
+            model_to_dict=model_to_dict,
+            as_dicts=as_dicts,
+            trusted=trusted,
+        )
+        offload = offload or executor is not None
+        loop = asyncio.get_running_loop()
+        prefetch_lookups = ()
+        if isinstance(queryset, QuerySet):
+            # aiterator() does not support prefetch_related: prefetch chunk by chunk.
+            queryset = cls.prepare_queryset(queryset, prefetch=False)
+            prefetch_lookups = cls.query_plan().prefetch_related
+        async for chunk in _aiter_chunks(queryset, chunk_size):
+            if prefetch_lookups:
+                await sync_to_async(prefetch_related_objects)(chunk, *prefetch_lookups)
+            if offload:
+                yield await loop.run_in_executor(executor, serialize, chunk)
+            else:
+                yield serialize(chunk)
+
+    @classmethod
+    async def afrom_queryset(
+        cls,
+        queryset: QuerySet | AsyncIterable[DjangoModel],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        model_to_dict: _ModelToDict | None = None,
+        as_dicts: bool = False,
+        trusted: bool = False,
+        offload: bool = False,
+        executor: "Executor | None" = None,
+    ) -> list[Self] | list[dict[str, Any]]:
+        """
+        Asynchronously evaluate a queryset and convert all of its rows.
+
+        See `astream` for the meaning of the arguments.
+
+        Returns:
+            list[Self] | list[dict[str, Any]]: The serializer instances (or their dumped dictionaries), in queryset order.
+        """
+        results = []
+        async for chunk in cls.astream(
+            queryset,
+            chunk_size,
+            model_to_dict=model_to_dict,
+            as_dicts=as_dicts,
+            trusted=trusted,
+            offload=offload,
+            executor=executor,
+        ):
+            results.extend(chunk)
+        return results
+
+    @classmethod
+    def writable_attnames(cls) -> dict[str, str]:
+        """
+        Returns the model attribute written by `apply_to` for each serializer field.
+
+        Nested relations and the primary key are never written.
+
+        Returns:
+            dict[str, str]: The model attnames (e.g. `author_id` for a foreign key), by serializer field name.
+
+        Raises:
+            ValueError: If the serializer was not built by the builder.
+        """
+        cache = _class_cache(cls)
+        attnames = cache.get("writable_attnames")
+        if attnames is None:
+            config = getattr(cls, "config", None) or {}
+            extractor = config.get("extractor")
+            if extractor is None:
+                raise ValueError(
+                    f"{cls.__name__} cannot be applied to model instances: "
+                    "only built serializers can"
+                )
+            pk_name = config["model"]._meta.pk.name
+            attnames = cache["writable_attnames"] = {
+                name: attname
+                for name, attname in zip(extractor.names, extractor.attnames)
+                if name != pk_name
+            }
+        return attnames
+
+    def to_model(self) -> DjangoModel:
+        """
+        Returns a new, unsaved model instance holding the serializer values.
+
+        Returns:
+            DjangoModel: The model instance. Nested relations are not set.
+
+        Raises:
+            ValueError: If the serializer was not built by the builder.
+        """
+        config = getattr(self, "config", None) or {}
+        extractor = config.get("extractor")
+        if extractor is None:
+            raise ValueError(
+                f"{self.__class__.__name__} cannot create model instances: "
+                "only built serializers can"
+            )
+        values = self.__dict__
+        return config["model"](
+            **{
+                attname: _to_model_value(values[name])
+                for name, attname in zip(extractor.names, extractor.attnames)
+            }
+        )
+
+    @classmethod
+    def bulk_ingest(
+        cls,
+        payloads: Iterable[Any] | str | bytes,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        key: str | None = None,
+        using: str | None = None,
+    ) -> IngestResult:
+        """
+        Validates payloads in batches and saves the valid ones with `bulk_create`/`bulk_update`.
+
+        Each batch is validated at once with the cached list adapter. Invalid payloads
+        are collected in the result instead of failing their batch, and the valid ones
+        are converted to unsaved model instances (see `to_model`). Without a key, all of
+        them are created. With a key, the rows whose key already exists are updated
+        instead, and when several payloads of a batch have the same key, the last one
+        wins. All the writes happen in a single transaction.
+
+        Args:
+            payloads (Iterable[Any] | str | bytes): The payloads (e.g. dictionaries), or a JSON array of them.
+            batch_size (int, optional): The number of payloads validated and written at once. Defaults to 1000.
+            key (str | None, optional): A unique field matching payloads to existing rows, which are updated. Defaults to None (create every row).
+            using (str | None, optional): The database to write to. Defaults to the model default database.
+
+        Returns:
+            IngestResult: The number of created and updated rows, and the errors of the invalid payloads.
+
+        Raises:
+            ValueError: If the serializer was not built by the builder, has nested relations, or does not have the key field.
+        """
+        return bulk_ingest(cls, payloads, batch_size=batch_size, key=key, using=using)
+
+    def apply_to(
+        self,
+        instance: DjangoModel,
+        *,
+        partial: bool | None = None,
+        save: bool = True,
+        using: str | None = None,
+    ) -> list[str]:
+        """
+        Writes the serializer values to a model instance, saving only the changed columns.
+
+        The values are compared with the ones of the instance, only the different ones
+        are set, and the instance is saved with `save(update_fields=...)` restricted to
+        them. Nothing is written when no value changed. Deferred fields of the instance
+        are not loaded to be compared, they are always written. Instances not saved yet
+        are saved with all of their fields.
+
+        Args:
+            instance (DjangoModel): The model instance to update.
+            partial (bool | None, optional): Whether to only apply the fields that were explicitly set on the serializer (`model_fields_set`), e.g. the fields of a PATCH payload. Defaults to None (True for serializers built with `build(partial=True)`, False otherwise).
+            save (bool, optional): Whether to save the changed fields. Defaults to True.
+            using (str | None, optional): The database to save to. Defaults to the instance database.
+
+        Returns:
+            list[str]: The names of the changed model fields.
+
+        Raises:
+            ValueError: If the serializer was not built by the builder, or was built partial and `partial` is False.
+        """
+        attnames = self.writable_attnames()
+        built_partial = self.config.get("partial", False)
+        if partial is None:
+            partial = built_partial
+        elif built_partial and not partial:
+            # The fields missing from the payload would be written as None.
+            raise ValueError(
+                f"{self.__class__.__name__} was built with partial=True: "
+                "it can only be applied partially"
+            )
+        if partial:
+            fields_set = self.model_fields_set
+            names = [name for name in attnames if name in fields_set]
+        else:
+            names = attnames
+        loaded = instance.__dict__
+        values = self.__dict__
+        changed = []
+        for name in names:
+            attname = attnames[name]
+            value = _to_model_value(values[name])
+            if attname in loaded and loaded[attname] == value:
+                continue
+            setattr(instance, attname, value)
+            changed.append(name)
+        if save and instance._state.adding:
+            instance.save(using=using)
+        elif save and changed:
+            instance.save(using=using, update_fields=changed)
+        return changed
+
+
+class DeferredModelSerializer(ModelSerializer):
+    """
+    A ModelSerializer whose pydantic-core schema is compiled on first use.
+
+    Built by `ModelSerializerBuilder.build(defer=True)`. Creating the class only
+    collects its fields; the schema is compiled the first time the class validates,
+    dumps or generates its JSON schema, or when it is warmed up with `compile_schema`.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        if not cls.__pydantic_complete__:
+            # pydantic only mocks the validator, the serializer would be the inherited one.
+            cls.__pydantic_serializer__ = _DeferredSchemaSerializer(cls)
+
+    @classmethod
+    def model_json_schema(cls, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        cls.compile_schema()
+        return super().model_json_schema(*args, **kwargs)
+
+
+class _DeferredSchemaSerializer:
+    """
+    Stands for the `SchemaSerializer` of a deferred serializer, compiling it on first access.
+    """
+
+    __slots__ = ("_cls",)
+
+    def __init__(self, cls: type[DeferredModelSerializer]):
+        self._cls = cls
+
+    def __getattr__(self, item: str) -> Any:
+        self._cls.compile_schema()
+        return getattr(self._cls.__pydantic_serializer__, item)
@@ -1 +1,7 @@
-from .fixtures import empty_model, mocked_model, model_with_fields
+from .fixtures import (
+    clear_serializer_cache,
+    empty_model,
+    mocked_model,
+    model_with_choices,
+    model_with_fields,
+)
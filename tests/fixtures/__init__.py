@@ -1 +1,2 @@
-from .models import empty_model, mocked_model, model_with_fields
+from .cache import clear_serializer_cache
+from .models import empty_model, mocked_model, model_with_choices, model_with_fields
@@ -0,0 +1,11 @@
+from pytest import fixture
+
+from pydref_serializers.cache import serializer_cache
+
+
+@fixture(autouse=True)
+def clear_serializer_cache():
+    # The mocked models share the same class, so builds must not leak between tests.
+    serializer_cache.clear()
+    yield
+    serializer_cache.clear()
@@ -6,7 +6,7 @@ from pytest import fixture
 def mocked_model(mocker) -> type:
     mocked_model = mocker.MagicMock(spec=models.Model, name="MockedModel")
     mocked_model = mocked_model.__class__
-    mocked_model._meta = mocker.MagicMock()
+    mocked_model._meta = mocker.MagicMock(label="tests.MockedModel")
     return mocked_model
 
 
@@ -24,3 +24,15 @@ def model_with_fields(mocked_model) -> type:
         models.BooleanField(name="bool_field"),
     ]
     return mocked_model
+
+
+@fixture
+def model_with_choices(mocked_model) -> type:
+    mocked_model._meta.fields = [
+        models.CharField(
+            max_length=1, name="char_field", choices=(("a", "A"), ("b", "B"))
+        ),
+        models.IntegerField(name="int_field"),
+        models.BooleanField(name="bool_field"),
+    ]
+    return mocked_model
@@ -0,0 +1,46 @@
+from pydref_serializers.cache import SerializerCache
+
+
+class TestSerializerCacheGetOrBuild:
+    def test_get_or_build__should_build_once_per_key(self, mocker):
+        cache = SerializerCache()
+        factory = mocker.Mock(return_value=object())
+        first = cache.get_or_build(("model", 1), factory)
+        second = cache.get_or_build(("model", 1), factory)
+        assert first is second
+        factory.assert_called_once()
+
+    def test_get_or_build__should_count_hits_and_misses(self):
+        cache = SerializerCache()
+        cache.get_or_build(("model", 1), object)
+        cache.get_or_build(("model", 1), object)
+        cache.get_or_build(("model", 2), object)
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+    def test_get_or_build__should_evict_least_recently_used_entry(self):
+        cache = SerializerCache(maxsize=2)
+        first = cache.get_or_build(("model", 1), object)
+        cache.get_or_build(("model", 2), object)
+        cache.get_or_build(("model", 1), object)
+        cache.get_or_build(("model", 3), object)
+        assert len(cache) == 2
+        assert cache.get_or_build(("model", 1), object) is first
+        assert cache.info().misses == 3
+
+
+class TestSerializerCacheInvalidate:
+    def test_invalidate__should_only_remove_entries_of_given_model(self):
+        cache = SerializerCache()
+        cache.get_or_build(("model", 1), object)
+        cache.get_or_build(("model", 2), object)
+        cache.get_or_build(("other", 1), object)
+        assert cache.invalidate("model") == 2
+        assert len(cache) == 1
+
+    def test_clear__should_remove_entries_and_reset_stats(self):
+        cache = SerializerCache()
+        cache.get_or_build(("model", 1), object)
+        cache.clear()
+        info = cache.info()
+        assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
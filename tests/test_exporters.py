@@ -0,0 +1,150 @@
+import io
+import json
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from functools import partial
+
+import pytest
+from django.db.models import QuerySet
+
+from pydref_serializers.builders import ModelSerializerBuilder
+from pydref_serializers.exporters import Partition, export_queryset, partition_by_pk
+
+
+def mocked_queryset(mocker, start, stop):
+    queryset = mocker.MagicMock(spec=QuerySet)
+    queryset.aggregate.return_value = {"start": start, "stop": stop}
+    queryset.query.is_sliced = False
+    return queryset
+
+
+class InlineFuture(Future):
+    def __init__(self, executor, call):
+        super().__init__()
+        self.executor = executor
+        self.call = call
+
+    def result(self, timeout=None):
+        if not self.done():
+            self.executor.in_flight -= 1
+            self.set_result(self.call())
+        return super().result(timeout)
+
+
+class InlineExecutor(Executor):
+    """Runs the submitted calls when their result is requested."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        return InlineFuture(self, partial(fn, *args, **kwargs))
+
+
+class TestPartitionByPk:
+    def test_partition_by_pk__should_cover_whole_pk_range(self, mocker):
+        queryset = mocked_queryset(mocker, 1, 10)
+        assert partition_by_pk(queryset, 3) == [
+            Partition(index=0, start=1, stop=5),
+            Partition(index=1, start=5, stop=9),
+            Partition(index=2, start=9, stop=11),
+        ]
+
+    def test_partition_by_pk__should_return_fewer_partitions_for_small_ranges(
+        self, mocker
+    ):
+        queryset = mocked_queryset(mocker, 1, 2)
+        assert len(partition_by_pk(queryset, 4)) == 2
+
+    def test_partition_by_pk__should_return_empty_list_when_queryset_is_empty(
+        self, mocker
+    ):
+        queryset = mocked_queryset(mocker, None, None)
+        assert partition_by_pk(queryset, 4) == []
+
+    def test_partition_by_pk__should_raise_value_error_when_pk_is_not_int(self, mocker):
+        queryset = mocked_queryset(mocker, "a", "z")
+        with pytest.raises(ValueError):
+            partition_by_pk(queryset, 4)
+
+
+class TestExportQueryset:
+    @pytest.fixture
+    def export_partition(self, mocker):
+        def export(builder, partial, query, partition, *args):
+            return f'{{"index":{partition.index}}}'.encode(), 1
+
+        mocker.patch("pydref_serializers.exporters.connections")
+        return mocker.patch(
+            "pydref_serializers.exporters._export_partition", side_effect=export
+        )
+
+    def test_export_queryset__should_write_partitions_in_order(
+        self, mocker, empty_model, export_partition
+    ):
+        output = io.BytesIO()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            result = export_queryset(
+                ModelSerializerBuilder(empty_model),
+                mocked_queryset(mocker, 1, 100),
+                output=output,
+                partitions=10,
+                executor=executor,
+            )
+        assert result.rows == 10
+        assert json.loads(output.getvalue()) == [{"index": i} for i in range(10)]
+
+    def test_export_queryset__should_raise_value_error_without_single_output(
+        self, mocker, empty_model
+    ):
+        with pytest.raises(ValueError):
+            export_queryset(
+                ModelSerializerBuilder(empty_model), mocked_queryset(mocker, 1, 2)
+            )
+
+    def test_export_queryset__should_bound_partitions_in_flight(
+        self, mocker, empty_model, export_partition
+    ):
+        executor = InlineExecutor()
+        output = io.BytesIO()
+        result = export_queryset(
+            ModelSerializerBuilder(empty_model),
+            mocked_queryset(mocker, 1, 100),
+            output=output,
+            workers=2,
+            partitions=10,
+            executor=executor,
+        )
+        assert result.rows == 10
+        assert json.loads(output.getvalue()) == [{"index": i} for i in range(10)]
+        assert executor.max_in_flight == 4
+
+    def test_export_queryset__should_serialize_partitions_inline(
+        self, mocker, model_with_fields
+    ):
+        mocker.patch("pydref_serializers.exporters.connections")
+        rows = [
+            mocker.Mock(pk=pk, char_field=f"row {pk}", int_field=pk, bool_field=True)
+            for pk in range(1, 6)
+        ]
+        queryset = mocked_queryset(mocker, 1, 5)
+        for method in ("filter", "order_by", "only", "prefetch_related"):
+            getattr(queryset, method).return_value = queryset
+        queryset.iterator.side_effect = lambda chunk_size: iter(rows)
+        model_with_fields._meta.default_manager.all.return_value = queryset
+
+        output = io.BytesIO()
+        result = export_queryset(
+            ModelSerializerBuilder(model_with_fields),
+            queryset,
+            output=output,
+            partitions=1,
+            executor=InlineExecutor(),
+        )
+        assert result.rows == 5
+        assert json.loads(output.getvalue()) == [
+            {"char_field": f"row {pk}", "int_field": pk, "bool_field": True}
+            for pk in range(1, 6)
+        ]
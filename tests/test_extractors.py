@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+import pytest
+from django.db import models
+
+from pydref_serializers.extractors import ModelExtractor
+
+
+class TestModelExtractorFromFields:
+    def test_from_fields__should_use_field_names_and_attnames(self):
+        fields = [
+            models.CharField(name="char_field"),
+            models.ForeignKey("app.Model", on_delete=models.CASCADE, name="fk_field"),
+        ]
+        extractor = ModelExtractor.from_fields(fields)
+        assert extractor.names == ("char_field", "fk_field")
+        assert extractor.attnames == ("char_field", "fk_field_id")
+
+
+class TestModelExtractorCall:
+    @pytest.mark.parametrize(
+        "names",
+        [(), ("a",), ("a", "b")],
+        ids=lambda x: f"Testing {len(x)} fields",
+    )
+    def test_call__should_return_dict_with_declared_fields(self, names):
+        obj = SimpleNamespace(a=1, b=2, c=3)
+        extractor = ModelExtractor(names=names, attnames=names)
+        assert extractor(obj) == {name: getattr(obj, name) for name in names}
+
+    def test_call__should_read_values_from_attnames(self):
+        obj = SimpleNamespace(fk_field_id=1)
+        extractor = ModelExtractor(names=("fk_field",), attnames=("fk_field_id",))
+        assert extractor(obj) == {"fk_field": 1}
+
+    def test_init__should_raise_value_error_when_lengths_differ(self):
+        with pytest.raises(ValueError):
+            ModelExtractor(names=("a",), attnames=())
+
+
+class TestModelExtractorDeferredAttnames:
+    def test_deferred_attnames__should_return_attnames_not_loaded(self):
+        obj = SimpleNamespace(a=1)
+        extractor = ModelExtractor(names=("a", "b"), attnames=("a", "b_id"))
+        assert extractor.deferred_attnames(obj) == {"b_id"}
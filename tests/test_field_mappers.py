@@ -1,15 +1,22 @@
+import pickle
+from copy import copy
+from decimal import Decimal
 from enum import Enum
 from typing import Any
 
 import pytest
 from annotated_types import MaxLen, MinLen
 from django.db import models
+from pydantic import EmailStr
 from pydantic.fields import FieldInfo
 
 from pydref_serializers.mappers.fields import (
     DJANGO_FIELD_MAP,
     FieldDescriptor,
     FieldMapper,
+    LazyFieldMap,
+    LazyImport,
+    get_choices_enum,
 )
 
 
@@ -157,3 +164,117 @@ class TestFieldMapperGetPydanticField:
         )
         field_info = FieldMapper()._get_pydantic_field(fd, str)[1]
         assert_field_annotation(field_info, MaxLen(max_length))
+
+
+class TestGetChoicesEnum:
+    def test_get_choices_enum__should_return_same_enum_for_same_choices(self):
+        choices = (("a", "A"), ("b", "B"))
+        assert get_choices_enum("FieldEnum", choices) is get_choices_enum(
+            "FieldEnum", list(choices)
+        )
+
+    def test_get_choices_enum__should_return_different_enums_for_different_choices(
+        self,
+    ):
+        assert get_choices_enum("FieldEnum", (("a", "A"),)) is not get_choices_enum(
+            "FieldEnum", (("b", "B"),)
+        )
+
+
+class TestFieldMapperCall:
+    def test_call__should_memoize_mapping_of_identical_fields(self, mocker):
+        mapper = FieldMapper()
+        spy = mocker.spy(mapper, "_get_pydantic_type_and_config")
+        mapper(models.CharField(name="field", max_length=10))
+        mapper(models.CharField(name="field", max_length=10))
+        spy.assert_called_once()
+
+    def test_call__should_return_new_field_info_for_memoized_mappings(self):
+        mapper = FieldMapper()
+        field = models.CharField(name="field", max_length=10)
+        assert mapper(field)[1] is not mapper(field)[1]
+
+    def test_call__should_map_fields_again_when_definition_differs(self, mocker):
+        mapper = FieldMapper()
+        spy = mocker.spy(mapper, "_get_pydantic_type_and_config")
+        mapper(models.CharField(name="field", max_length=10))
+        mapper(models.CharField(name="field", max_length=10), partial=True)
+        mapper(models.CharField(name="field", max_length=20))
+        assert spy.call_count == 3
+
+    def test_call__should_evict_least_recently_used_mappings(self, mocker):
+        mocker.patch("pydref_serializers.mappers.fields.MAX_MAPPED_FIELDS", 2)
+        mapper = FieldMapper()
+        spy = mocker.spy(mapper, "_get_pydantic_type_and_config")
+        first, second, third = (
+            models.CharField(name="field", max_length=length) for length in (1, 2, 3)
+        )
+        for field in (first, second, first, third, first, second):
+            mapper(field)
+        assert spy.call_count == 4
+        assert len(mapper._cache) == 2
+
+    def test_pickle__should_drop_memoized_mappings(self):
+        mapper = FieldMapper()
+        mapper(models.CharField(name="field", max_length=10))
+        restored = pickle.loads(pickle.dumps(mapper))
+        assert len(restored._cache) == 0
+        assert restored(models.CharField(name="field", max_length=10))[0] == str
+
+
+class MoneyField(models.DecimalField):
+    pass
+
+
+class TestFieldMapperResolveType:
+    def test_resolve_type__should_use_closest_mapped_ancestor(self):
+        fd = FieldDescriptor(django_field_type=MoneyField, name="field")
+        assert FieldMapper()._get_base_type(fd) == DJANGO_FIELD_MAP["DecimalField"]
+
+    def test_resolve_type__should_prefer_class_keys_registered_for_subclasses(self):
+        mapper = FieldMapper()
+        mapper.register(MoneyField, int)
+        fd = FieldDescriptor(django_field_type=MoneyField, name="field")
+        assert mapper._get_base_type(fd) == int
+
+    def test_resolve_type__should_cache_resolution_per_class(self, mocker):
+        mapper = FieldMapper()
+        warning = mocker.patch("pydref_serializers.mappers.fields.logger.warning")
+        fd = FieldDescriptor(django_field_type=object, name="field")
+        mapper._get_base_type(fd)
+        mapper._get_base_type(fd)
+        warning.assert_called_once()
+
+
+class TestFieldMapperRegister:
+    def test_register__should_not_change_shared_fields_map(self):
+        FieldMapper().register("CharField", int)
+        assert DJANGO_FIELD_MAP["CharField"] == str
+
+    def test_register__should_invalidate_memoized_mappings(self):
+        mapper = FieldMapper()
+        field = models.DecimalField(name="field")
+        mapper(field)
+        mapper.register(models.DecimalField, int)
+        assert mapper(field)[0] == int
+        assert mapper.version == 1
+
+
+class TestLazyFieldMap:
+    def test_getitem__should_resolve_lazy_imports_on_first_access(self):
+        fields_map = LazyFieldMap({"DecimalField": LazyImport("decimal", "Decimal")})
+        assert fields_map["DecimalField"] is Decimal
+        assert fields_map.data["DecimalField"] is Decimal
+
+    def test_copy__should_keep_unresolved_values_lazy(self):
+        fields_map = LazyFieldMap({"DecimalField": LazyImport("decimal", "Decimal")})
+        copied = copy(fields_map)
+        copied["IntegerField"] = float
+        assert isinstance(copied.data["DecimalField"], LazyImport)
+        assert "IntegerField" not in fields_map
+
+    def test_field_mapper__should_map_fields_to_lazy_types(self):
+        mapper = FieldMapper(
+            fields_map=LazyFieldMap({"EmailField": LazyImport("pydantic", "EmailStr")})
+        )
+        assert mapper._resolve_type(models.EmailField) is EmailStr
@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def imported_modules(statement: str) -> list[str]:
+    """
+    Returns the modules imported by a statement in a fresh interpreter, in import order.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return [
+        line.rsplit("|", 1)[1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    ][1:]
+
+
+@pytest.fixture(scope="module")
+def package_modules() -> list[str]:
+    return imported_modules("import pydref_serializers")
+
+
+class TestPackageImport:
+    def test_import__should_only_add_own_modules_to_django_and_pydantic(
+        self, package_modules
+    ):
+        baseline = set(imported_modules("import django.db.models, pydantic"))
+        extra = {
+            module
+            for module in set(package_modules) - baseline
+            if not module.startswith(("pydref_serializers", "pydantic._internal"))
+        }
+        assert extra == set()
+
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "email_validator",
+            "multiprocessing",
+            "pydref_serializers.exporters",
+            "pydref_serializers.apps",
+        ],
+    )
+    def test_import__should_not_load_optional_modules(self, package_modules, module):
+        assert module not in package_modules
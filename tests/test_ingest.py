@@ -0,0 +1,94 @@
+import pytest
+
+from pydref_serializers.builders import ModelSerializerBuilder
+from pydref_serializers.ingest import _validate_batch
+
+ROWS = [
+    {"char_field": "a", "int_field": 1, "bool_field": True},
+    {"char_field": "b", "int_field": "two", "bool_field": False},
+    {"char_field": "c", "int_field": 3, "bool_field": True},
+]
+
+
+@pytest.fixture
+def serializer(mocker, model_with_fields):
+    mocker.patch("pydref_serializers.ingest.transaction")
+    model_with_fields._meta.pk.name = "id"
+    TestModelSerializer = ModelSerializerBuilder.from_model(model_with_fields).build()
+    mocker.patch.object(
+        TestModelSerializer,
+        "to_model",
+        lambda self: mocker.Mock(**self.model_dump()),
+    )
+    return TestModelSerializer
+
+
+@pytest.fixture
+def manager(mocker, model_with_fields):
+    manager = mocker.Mock()
+    model_with_fields._default_manager.db_manager.return_value = manager
+    return manager
+
+
+class TestValidateBatch:
+    def test_validate_batch__should_collect_errors_by_row(self, serializer):
+        instances, errors = _validate_batch(serializer, ROWS, offset=10)
+
+        assert [instance.char_field for instance in instances] == ["a", "c"]
+        assert [error.index for error in errors] == [11]
+        assert errors[0].errors[0]["loc"] == ("int_field",)
+
+
+class TestBulkIngest:
+    def test_bulk_ingest__should_create_valid_rows_in_batches(
+        self, serializer, manager
+    ):
+        result = serializer.bulk_ingest(ROWS, batch_size=2)
+
+        assert (result.created, result.updated) == (2, 0)
+        assert [error.index for error in result.errors] == [1]
+        assert not result.ok
+        created = [
+            obj.char_field
+            for call in manager.bulk_create.call_args_list
+            for obj in call.args[0]
+        ]
+        assert created == ["a", "c"]
+        assert manager.bulk_create.call_count == 2
+
+    def test_bulk_ingest__should_parse_json_payloads(self, serializer, manager):
+        result = serializer.bulk_ingest(
+            b'[{"char_field": "a", "int_field": 1, "bool_field": true}]'
+        )
+        assert result.created == 1 and result.ok
+
+    def test_bulk_ingest__should_update_rows_matching_key(self, serializer, manager):
+        manager.filter.return_value.values_list.return_value = [("a", 7)]
+
+        result = serializer.bulk_ingest([ROWS[0], ROWS[2]], key="char_field")
+
+        assert (result.created, result.updated) == (1, 1)
+        manager.filter.assert_called_once_with(char_field__in=["a", "c"])
+        updated, fields = manager.bulk_update.call_args.args
+        assert [obj.pk for obj in updated] == [7]
+        assert fields == ["int_field", "bool_field"]
+
+    def test_bulk_ingest__should_keep_last_payload_of_duplicate_keys(
+        self, serializer, manager
+    ):
+        manager.filter.return_value.values_list.return_value = []
+        rows = [ROWS[0], ROWS[2], dict(ROWS[0], int_field=10)]
+
+        result = serializer.bulk_ingest(rows, key="char_field")
+
+        assert (result.created, result.updated, result.duplicates) == (2, 0, 1)
+        manager.filter.assert_called_once_with(char_field__in=["a", "c"])
+        created = manager.bulk_create.call_args.args[0]
+        assert [(obj.char_field, obj.int_field) for obj in created] == [
+            ("a", 10),
+            ("c", 3),
+        ]
+
+    def test_bulk_ingest__should_raise_when_key_is_not_a_field(self, serializer):
+        with pytest.raises(ValueError):
+            serializer.bulk_ingest(ROWS, key="unknown")
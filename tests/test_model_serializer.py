@@ -1,4 +1,22 @@
+import asyncio
+import json
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from ipaddress import IPv6Address
+from uuid import UUID
+
+import pytest
+from django.db import models
+from django.db.models import Prefetch, QuerySet
+from django.db.models.query import ModelIterable
+from pydantic import ValidationError
+
 from pydref_serializers.builders import ModelSerializerBuilder
+from pydref_serializers.mappers.fields import DJANGO_FIELD_MAP
+from pydref_serializers.relations import QueryPlan
 
 
 class TestModelSerializerFromModel:
@@ -20,3 +38,674 @@ class TestModelSerializerFromModel:
             model_to_dict=lambda obj: model_dict,
         )
         assert model_serializer.model_dump() == model_dict
+
+
+class TestModelSerializerFromModels:
+    def test_from_models__should_return_model_serializers_with_right_data(
+        self, mocker, model_with_fields
+    ):
+        rows = [
+            {"char_field": "a", "int_field": 1, "bool_field": True},
+            {"char_field": "b", "int_field": 2, "bool_field": False},
+        ]
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        serializers = TestModelSerializer.from_models(
+            rows,
+            model_to_dict=lambda obj: obj,
+        )
+        assert all(isinstance(s, TestModelSerializer) for s in serializers)
+        assert [s.model_dump() for s in serializers] == rows
+
+    def test_from_models__should_return_dicts_when_as_dicts_is_true(
+        self, model_with_fields
+    ):
+        rows = [{"char_field": "a", "int_field": 1, "bool_field": True}]
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        assert (
+            TestModelSerializer.from_models(
+                rows, model_to_dict=lambda obj: obj, as_dicts=True
+            )
+            == rows
+        )
+
+    def test_list_adapter__should_be_cached_per_class(self, model_with_fields):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        assert TestModelSerializer.list_adapter() is TestModelSerializer.list_adapter()
+
+
+class TestModelSerializerDefaultModelToDict:
+    def test_from_model__should_use_built_extractor_by_default(
+        self, mocker, model_with_fields
+    ):
+        obj = mocker.Mock(char_field="test", int_field=1, bool_field=True)
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        assert TestModelSerializer.from_model(obj).model_dump() == {
+            "char_field": "test",
+            "int_field": 1,
+            "bool_field": True,
+        }
+
+
+class TestModelSerializerDumpManyJson:
+    ROWS = [
+        {"char_field": "a", "int_field": 1, "bool_field": True},
+        {"char_field": "b", "int_field": 2, "bool_field": False},
+    ]
+
+    def test_dump_many_json__should_dump_serializers_to_json_array(
+        self, model_with_fields
+    ):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+        serializers = TestModelSerializer.from_models(self.ROWS, model_to_dict=dict)
+
+        dumped = TestModelSerializer.dump_many_json(serializers)
+        assert (
+            dumped
+            == ("[" + ",".join(s.model_dump_json() for s in serializers) + "]").encode()
+        )
+
+    def test_dump_many_json__should_apply_masks_to_every_item(self, model_with_fields):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+        serializers = TestModelSerializer.from_models(self.ROWS, model_to_dict=dict)
+
+        assert json.loads(
+            TestModelSerializer.dump_many_json(serializers, include={"int_field"})
+        ) == [{"int_field": 1}, {"int_field": 2}]
+        assert json.loads(
+            TestModelSerializer.dump_many_json(
+                serializers, exclude={"int_field", "bool_field"}
+            )
+        ) == [{"char_field": "a"}, {"char_field": "b"}]
+
+    def test_dump_many_json__should_convert_model_instances(
+        self, mocker, model_with_fields
+    ):
+        objs = [mocker.Mock(spec=models.Model, **row) for row in self.ROWS]
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        assert json.loads(TestModelSerializer.dump_many_json(objs)) == self.ROWS
+
+
+class TestModelSerializerTrusted:
+    # A value of every `DJANGO_FIELD_MAP` field, as read from the database.
+    DATABASE_VALUES = {
+        "AutoField": 1,
+        "BigAutoField": 1,
+        "IntegerField": 1,
+        "SmallIntegerField": 1,
+        "BigIntegerField": 1,
+        "PositiveIntegerField": 1,
+        "PositiveSmallIntegerField": 1,
+        "FloatField": 1.5,
+        "DecimalField": Decimal("1.50"),
+        "CharField": "a",
+        "TextField": "a",
+        "SlugField": "a",
+        "EmailField": "a@example.com",  # Trusted emails are not normalized.
+        "URLField": "https://example.com",
+        "FilePathField": __file__,
+        "FileField": __file__,
+        "ImageField": __file__,
+        "BooleanField": True,
+        "BinaryField": b"\x00",
+        "DateField": date(2024, 1, 1),
+        "DateTimeField": datetime(2024, 1, 1, 12, 30),
+        "DurationField": timedelta(minutes=5),
+        "TimeField": time(12, 30),
+        "UUIDField": UUID(int=1),
+        "GenericIPAddressField": "127.0.0.1",
+        "JSONField": '{"a": 1}',
+    }
+
+    @pytest.mark.parametrize("field_type", list(DJANGO_FIELD_MAP.data))
+    def test_from_model__should_match_validated_output_when_trusted(
+        self, mocked_model, field_type
+    ):
+        mocked_model._meta.fields = [
+            getattr(models, field_type)(name="field", null=True),
+            models.CharField(max_length=1, name="choice", choices=(("a", "A"),)),
+        ]
+        model_dict = {"field": self.DATABASE_VALUES[field_type], "choice": "a"}
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(mocked_model).build()
+
+        validated = TestModelSerializer.from_model(
+            None, model_to_dict=lambda obj: dict(model_dict)
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            trusted = TestModelSerializer.from_model(
+                None, model_to_dict=lambda obj: dict(model_dict), trusted=True
+            )
+            assert trusted.model_dump_json() == validated.model_dump_json()
+        assert trusted.model_dump() == validated.model_dump()
+        assert isinstance(trusted.field, type(validated.field))
+        assert isinstance(trusted.choice, Enum)
+
+    def test_from_model__should_skip_validation_when_trusted(self, model_with_fields):
+        model_dict = {"char_field": "", "int_field": "not an int", "bool_field": True}
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        trusted = TestModelSerializer.from_model(
+            None, model_to_dict=lambda obj: model_dict, trusted=True
+        )
+        assert trusted.int_field == "not an int"
+
+    def test_trusted_constructor__should_not_validate_built_in_mappings(
+        self, mocker, mocked_model
+    ):
+        mocked_model._meta.fields = [
+            models.PositiveIntegerField(name="count", null=True),
+            models.EmailField(name="email"),
+            models.GenericIPAddressField(name="ip"),
+        ]
+        type_adapter = mocker.patch("pydref_serializers.serializers.TypeAdapter")
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(mocked_model).build()
+
+        trusted = TestModelSerializer.from_trusted_dict(
+            {"count": 3, "email": "a@Example.com", "ip": "::1"}
+        )
+        type_adapter.assert_not_called()
+        assert trusted.count == 3
+        assert trusted.email == "a@Example.com"
+        assert trusted.ip == IPv6Address("::1")
+
+    def test_from_trusted_dict__should_apply_defaults_when_fields_are_missing(
+        self, model_with_choices
+    ):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_choices
+        ).build(partial=True)
+
+        trusted = TestModelSerializer.from_trusted_dict({"char_field": "b"})
+        assert trusted.char_field.value == "b"
+        assert trusted.int_field is None
+        assert trusted.model_fields_set == {"char_field"}
+
+    def test_from_models__should_return_trusted_instances(self, model_with_choices):
+        rows = [
+            {"char_field": "a", "int_field": 1, "bool_field": True},
+            {"char_field": "b", "int_field": 2, "bool_field": False},
+        ]
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_choices
+        ).build()
+
+        assert TestModelSerializer.from_models(
+            rows, model_to_dict=dict, trusted=True
+        ) == TestModelSerializer.from_models(rows, model_to_dict=dict)
+
+
+class TestModelSerializerFromValues:
+    def test_from_values__should_map_tuples_to_fields_positionally(
+        self, mocker, model_with_choices
+    ):
+        queryset = mocker.MagicMock(spec=QuerySet)
+        queryset.values_list.return_value = [("a", 1, True), ("b", 2, False)]
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_choices
+        ).build()
+
+        serializers = TestModelSerializer.from_values(queryset)
+        queryset.values_list.assert_called_once_with(
+            "char_field", "int_field", "bool_field"
+        )
+        assert [s.char_field.value for s in serializers] == ["a", "b"]
+        assert serializers == TestModelSerializer.from_models(
+            [
+                {"char_field": "a", "int_field": 1, "bool_field": True},
+                {"char_field": "b", "int_field": 2, "bool_field": False},
+            ],
+            model_to_dict=lambda obj: obj,
+        )
+
+    def test_from_values__should_return_dicts_when_as_dicts_is_true(
+        self, mocker, model_with_fields
+    ):
+        queryset = mocker.MagicMock(spec=QuerySet)
+        queryset.values_list.return_value = [("a", 1, True)]
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        assert TestModelSerializer.from_values(
+            queryset, as_dicts=True, trusted=True
+        ) == [{"char_field": "a", "int_field": 1, "bool_field": True}]
+
+    def test_from_values__should_raise_when_serializer_has_relations(
+        self, mocker, model_with_fields
+    ):
+        extractor = mocker.Mock(relations=(mocker.Mock(),))
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+        mocker.patch.dict(TestModelSerializer.config, extractor=extractor)
+
+        with pytest.raises(ValueError):
+            TestModelSerializer.from_values(mocker.MagicMock(spec=QuerySet))
+
+
+class TestModelSerializerFieldset:
+    def test_fieldset__should_only_extract_and_dump_selected_fields(
+        self, mocker, model_with_choices
+    ):
+        obj = mocker.Mock(char_field="a", int_field=1, bool_field=True)
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_choices
+        ).build()
+
+        fieldset = TestModelSerializer.fieldset(include=["bool_field", "char_field"])
+        assert fieldset.names == ("char_field", "bool_field")
+        assert fieldset.from_models([obj], as_json=True) == (
+            b'[{"char_field":"a","bool_field":true}]'
+        )
+        assert fieldset.from_model(obj) == {
+            k: v
+            for k, v in TestModelSerializer.from_model(obj).model_dump().items()
+            if k != "int_field"
+        }
+
+    def test_fieldset__should_dump_json_compatible_values_in_json_mode(
+        self, mocker, model_with_choices
+    ):
+        obj = mocker.Mock(char_field="a", int_field=1, bool_field=True)
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_choices
+        ).build()
+
+        fieldset = TestModelSerializer.fieldset(include=["char_field"])
+        [python_row] = fieldset.from_models([obj])
+        assert isinstance(python_row["char_field"], Enum)
+        assert fieldset.from_models([obj], mode="json") == [{"char_field": "a"}]
+
+    def test_fieldset__should_exclude_fields(self, model_with_fields):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        fieldset = TestModelSerializer.fieldset(exclude=["int_field"])
+        assert fieldset.names == ("char_field", "bool_field")
+
+    def test_fieldset__should_validate_selected_fields(self, mocker, model_with_fields):
+        obj = mocker.Mock(char_field="a" * 101, int_field=1, bool_field=True)
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        with pytest.raises(ValidationError):
+            TestModelSerializer.fieldset(include=["char_field"]).from_model(obj)
+        assert TestModelSerializer.fieldset(include=["int_field"]).from_model(obj) == {
+            "int_field": 1
+        }
+
+    def test_fieldset__should_be_cached_per_field_set(self, model_with_fields):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        fieldset = TestModelSerializer.fieldset(include=["int_field", "char_field"])
+        assert fieldset is TestModelSerializer.fieldset(
+            include=["char_field", "int_field"]
+        )
+        assert fieldset is TestModelSerializer.fieldset(exclude=["bool_field"])
+
+    def test_fieldset__should_project_queryset_on_selected_fields(
+        self, mocker, model_with_fields
+    ):
+        model_with_fields._meta.pk.name = "id"
+        queryset = mocker.MagicMock(spec=QuerySet)
+        queryset.only.return_value = []
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        assert (
+            TestModelSerializer.fieldset(include=["int_field"]).from_queryset(queryset)
+            == []
+        )
+        queryset.only.assert_called_once_with("id", "int_field")
+
+    def test_fieldset_without_relations__should_be_cached_apart_from_field_sets(
+        self, model_with_fields
+    ):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        fieldset = TestModelSerializer.fieldset_without_relations()
+        assert fieldset.names == ("char_field", "int_field", "bool_field")
+        assert fieldset is TestModelSerializer.fieldset_without_relations()
+        assert fieldset is not TestModelSerializer.fieldset()
+
+    def test_fieldset__should_raise_when_field_is_unknown(self, model_with_fields):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        with pytest.raises(ValueError, match="unknown_field"):
+            TestModelSerializer.fieldset(include=["char_field", "unknown_field"])
+
+
+class TestModelSerializerApplyTo:
+    @pytest.fixture
+    def instance(self, mocker):
+        instance = mocker.Mock()
+        instance._state.adding = False
+        instance.__dict__.update(char_field="a", int_field=1, bool_field=True)
+        return instance
+
+    def test_apply_to__should_only_save_changed_fields(
+        self, instance, model_with_choices
+    ):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_choices
+        ).build()
+        serializer = TestModelSerializer(char_field="b", int_field=1, bool_field=True)
+
+        assert serializer.apply_to(instance) == ["char_field"]
+        # Choice Enums are written as their value.
+        assert instance.char_field == "b"
+        instance.save.assert_called_once_with(using=None, update_fields=["char_field"])
+
+    def test_apply_to__should_not_save_when_nothing_changed(
+        self, instance, model_with_fields
+    ):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+        serializer = TestModelSerializer(char_field="a", int_field=1, bool_field=True)
+
+        assert serializer.apply_to(instance) == []
+        instance.save.assert_not_called()
+
+    def test_apply_to__should_only_apply_set_fields_when_partial(
+        self, instance, model_with_fields
+    ):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build(partial=True)
+        serializer = TestModelSerializer(int_field=2)
+
+        assert serializer.apply_to(instance, partial=True) == ["int_field"]
+        assert instance.char_field == "a"
+        instance.save.assert_called_once_with(using=None, update_fields=["int_field"])
+
+    def test_apply_to__should_apply_partial_serializers_partially_by_default(
+        self, instance, model_with_fields
+    ):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build(partial=True)
+        serializer = TestModelSerializer(int_field=2)
+
+        assert serializer.apply_to(instance) == ["int_field"]
+        assert instance.char_field == "a"
+
+    def test_apply_to__should_raise_when_partial_serializer_is_applied_entirely(
+        self, instance, model_with_fields
+    ):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build(partial=True)
+        serializer = TestModelSerializer(int_field=2)
+
+        with pytest.raises(ValueError):
+            serializer.apply_to(instance, partial=False)
+        instance.save.assert_not_called()
+
+    def test_apply_to__should_write_deferred_fields(self, instance, model_with_fields):
+        del instance.__dict__["bool_field"]
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+        serializer = TestModelSerializer(char_field="a", int_field=1, bool_field=True)
+
+        assert serializer.apply_to(instance, save=False) == ["bool_field"]
+        instance.save.assert_not_called()
+
+    def test_apply_to__should_save_all_fields_of_new_instances(
+        self, instance, model_with_fields
+    ):
+        instance._state.adding = True
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+        serializer = TestModelSerializer(char_field="a", int_field=1, bool_field=True)
+
+        serializer.apply_to(instance)
+        instance.save.assert_called_once_with(using=None)
+
+    def test_writable_attnames__should_skip_primary_key(self, model_with_fields):
+        model_with_fields._meta.pk.name = "int_field"
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        assert TestModelSerializer.writable_attnames() == {
+            "char_field": "char_field",
+            "bool_field": "bool_field",
+        }
+
+
+class TestModelSerializerStreamJson:
+    @pytest.mark.parametrize("count", [0, 1, 5], ids=lambda x: f"Testing {x} rows")
+    def test_stream_json__should_yield_valid_json_array(self, model_with_fields, count):
+        rows = [
+            {"char_field": "a", "int_field": i, "bool_field": True}
+            for i in range(count)
+        ]
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        stream = TestModelSerializer.stream_json(rows, chunk_size=2, model_to_dict=dict)
+        assert json.loads(b"".join(stream)) == rows
+
+    def test_stream_json__should_consume_querysets_with_iterator(
+        self, mocker, model_with_fields
+    ):
+        row = {"char_field": "a", "int_field": 1, "bool_field": True}
+        queryset = mocker.MagicMock(spec=QuerySet)
+        queryset.only.return_value = queryset
+        queryset.iterator.return_value = iter([row])
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        stream = TestModelSerializer.stream_json(
+            queryset, chunk_size=10, model_to_dict=dict
+        )
+        assert json.loads(b"".join(stream)) == [row]
+        queryset.iterator.assert_called_once_with(chunk_size=10)
+
+
+async def aiterate(items):
+    for item in items:
+        yield item
+
+
+class TestModelSerializerAsync:
+    ROWS = [{"char_field": "a", "int_field": i, "bool_field": True} for i in range(5)]
+
+    def test_astream__should_yield_serialized_chunks(self, model_with_fields):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        async def collect():
+            return [
+                chunk
+                async for chunk in TestModelSerializer.astream(
+                    aiterate(self.ROWS), 2, model_to_dict=dict, as_dicts=True
+                )
+            ]
+
+        assert asyncio.run(collect()) == [self.ROWS[:2], self.ROWS[2:4], self.ROWS[4:]]
+
+    def test_astream__should_consume_querysets_with_aiterator(
+        self, mocker, model_with_fields
+    ):
+        queryset = mocker.MagicMock(spec=QuerySet)
+        queryset.only.return_value = queryset
+        queryset.aiterator.return_value = aiterate(self.ROWS)
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        async def collect():
+            return [
+                chunk
+                async for chunk in TestModelSerializer.astream(
+                    queryset, 10, model_to_dict=dict, as_dicts=True
+                )
+            ]
+
+        assert asyncio.run(collect()) == [self.ROWS]
+        queryset.aiterator.assert_called_once_with(chunk_size=10)
+
+    def test_afrom_queryset__should_serialize_in_executor_when_provided(
+        self, model_with_fields
+    ):
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            serializers = asyncio.run(
+                TestModelSerializer.afrom_queryset(
+                    aiterate(self.ROWS),
+                    chunk_size=2,
+                    model_to_dict=dict,
+                    executor=executor,
+                )
+            )
+        assert [s.model_dump() for s in serializers] == self.ROWS
+
+
+class TestModelSerializerQueryPlan:
+    def test_query_plan__should_project_declared_fields_and_pk(self, model_with_fields):
+        model_with_fields._meta.pk.name = "id"
+
+        TestModelSerializer = (
+            ModelSerializerBuilder.from_model(model_with_fields)
+            .with_fields("char_field")
+            .build()
+        )
+
+        assert TestModelSerializer.query_plan().only == ("id", "char_field")
+
+    def test_query_plan__should_be_computed_once_per_class(
+        self, mocker, model_with_fields
+    ):
+        from_relations = mocker.spy(QueryPlan, "from_relations")
+        queryset = mocker.MagicMock(spec=models.QuerySet)
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        plan = TestModelSerializer.query_plan()
+        TestModelSerializer.prepare_queryset(queryset)
+        assert TestModelSerializer.query_plan() is plan
+        from_relations.assert_called_once()
+
+    def test_from_queryset__should_accept_prepared_querysets(
+        self, mocker, model_with_fields
+    ):
+        queryset = mocker.MagicMock(spec=models.QuerySet, _iterable_class=ModelIterable)
+        queryset._prefetch_related_lookups = ()
+        for method in ("select_related", "only"):
+            getattr(queryset, method).return_value = queryset
+
+        def prefetch_related(*lookups):
+            queryset._prefetch_related_lookups += lookups
+            return queryset
+
+        queryset.prefetch_related.side_effect = prefetch_related
+        queryset.iterator.return_value = iter([])
+        tags = Prefetch("tags", queryset=queryset)
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+        mocker.patch.object(
+            TestModelSerializer,
+            "query_plan",
+            return_value=QueryPlan(prefetch_related=(tags,)),
+        )
+
+        prepared = TestModelSerializer.prepare_queryset(queryset)
+        assert TestModelSerializer.from_queryset(prepared) == []
+        assert queryset._prefetch_related_lookups == (tags,)
+
+    def test_warn_deferred_fields__should_log_warning_when_fields_are_deferred(
+        self, mocker, model_with_fields
+    ):
+        warning = mocker.patch("pydref_serializers.serializers.logger.warning")
+        obj = mocker.Mock(spec=models.Model)
+        obj.__dict__.update(char_field="a", int_field=1)
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        TestModelSerializer.warn_deferred_fields(obj)
+        warning.assert_called_once()
+        assert "bool_field" in warning.call_args.args
+
+    def test_warn_deferred_fields__should_warn_once_per_set_of_deferred_fields(
+        self, mocker, model_with_fields
+    ):
+        warning = mocker.patch("pydref_serializers.serializers.logger.warning")
+        objs = [mocker.Mock(spec=models.Model) for _ in range(3)]
+        for obj in objs[:2]:
+            obj.__dict__.update(char_field="a", int_field=1)
+        objs[2].__dict__.update(char_field="a")
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(
+            model_with_fields
+        ).build()
+
+        for obj in objs:
+            TestModelSerializer.warn_deferred_fields(obj)
+        assert [call.args[-1] for call in warning.call_args_list] == [
+            "bool_field",
+            "bool_field, int_field",
+        ]
@@ -1,9 +1,18 @@
+from dataclasses import dataclass
+
 import pytest
+from django.db import models
 
 from pydref_serializers.builders import ModelSerializerBuilder
+from pydref_serializers.mappers.fields import FieldMapper
 from pydref_serializers.serializers import ModelSerializer
 
 
+@dataclass
+class FieldMapperWithEq(FieldMapper):
+    pass
+
+
 class TestModelSerializerBuilderBuild:
     def test_build__should_create_model_serializer_when_empty_model_provided(
         self, empty_model
@@ -55,3 +64,138 @@ class TestModelSerializerBuilderFromModel:
         builder = ModelSerializerBuilder.from_model(empty_model)
         assert builder.model is empty_model
         assert isinstance(builder, ModelSerializerBuilder)
+
+
+class TestModelSerializerBuilderCache:
+    def test_build__should_return_same_class_for_identical_builds(
+        self, model_with_fields
+    ):
+        first = ModelSerializerBuilder(model_with_fields).with_fields("char_field")
+        second = ModelSerializerBuilder(model_with_fields).with_fields("char_field")
+        assert first.build() is second.build()
+
+    def test_build__should_return_different_classes_for_different_builds(
+        self, model_with_fields
+    ):
+        builder = ModelSerializerBuilder(model_with_fields)
+        assert builder.build() is not builder.build(partial=True)
+
+    def test_build__should_not_cache_when_cache_is_none(self, model_with_fields):
+        builder = ModelSerializerBuilder(model_with_fields, cache=None)
+        assert builder.build() is not builder.build()
+
+    def test_build__should_not_cache_when_builder_is_not_hashable(
+        self, model_with_fields
+    ):
+        builder = ModelSerializerBuilder(
+            model_with_fields, field_mapper=FieldMapperWithEq()
+        )
+        assert builder.cache_key() is None
+        assert builder.build() is not builder.build()
+
+    def test_build__should_build_again_when_field_mapper_changes(
+        self, model_with_fields
+    ):
+        builder = ModelSerializerBuilder(model_with_fields, field_mapper=FieldMapper())
+        first = builder.build()
+        builder.field_mapper.register("IntegerField", float)
+        assert builder.build() is not first
+
+
+class TestModelSerializerBuilderDefer:
+    def test_build__should_not_compile_schema_when_deferred(self, model_with_fields):
+        serializer_class = ModelSerializerBuilder(model_with_fields).build(defer=True)
+        assert issubclass(serializer_class, ModelSerializer)
+        assert not serializer_class.is_schema_compiled()
+
+    def test_deferred_serializer__should_compile_schema_on_first_use(
+        self, model_with_fields
+    ):
+        row = {"char_field": "a", "int_field": 1, "bool_field": True}
+        serializer_class = ModelSerializerBuilder(model_with_fields).build(defer=True)
+
+        assert serializer_class.from_trusted_dict(dict(row)).model_dump() == row
+        assert serializer_class.is_schema_compiled()
+        assert serializer_class(**row).model_dump() == row
+
+    def test_build__should_compile_cached_deferred_class_when_not_deferred(
+        self, model_with_fields
+    ):
+        deferred = ModelSerializerBuilder(model_with_fields).build(defer=True)
+        serializer_class = ModelSerializerBuilder(model_with_fields).build()
+        assert serializer_class is deferred
+        assert serializer_class.is_schema_compiled()
+
+
+class TestModelSerializerBuilderWithNested:
+    @pytest.fixture
+    def relation_field(self, mocker, model_with_fields):
+        field = mocker.Mock(
+            spec=models.ForeignKey,
+            is_relation=True,
+            many_to_many=False,
+            one_to_many=False,
+            null=False,
+        )
+        model_with_fields._meta.get_field.return_value = field
+        return field
+
+    @pytest.fixture
+    def nested_builder(self, model_with_fields):
+        return ModelSerializerBuilder(
+            model_with_fields,
+            fields_getter=lambda model, fields=None: model._meta.fields[:1],
+        )
+
+    def test_with_nested__should_return_self(self, empty_model, nested_builder):
+        builder = ModelSerializerBuilder(model=empty_model)
+        assert builder.with_nested(relation=nested_builder) is builder
+
+    def test_build__should_replace_field_with_nested_serializer(
+        self, model_with_fields, relation_field, nested_builder
+    ):
+        serializer_class = (
+            ModelSerializerBuilder(model_with_fields)
+            .with_nested(int_field=nested_builder)
+            .build()
+        )
+        annotation = serializer_class.model_fields["int_field"].annotation
+        assert annotation is nested_builder.build()
+        assert serializer_class.config["relations"][0].accessor == "int_field"
+
+    def test_build__should_use_list_of_nested_serializers_for_many_relations(
+        self, model_with_fields, relation_field, nested_builder
+    ):
+        relation_field.many_to_many = True
+        serializer_class = (
+            ModelSerializerBuilder(model_with_fields)
+            .with_nested(int_field=nested_builder)
+            .build()
+        )
+        annotation = serializer_class.model_fields["int_field"].annotation
+        assert annotation == list[nested_builder.build()]
+
+    def test_build__should_raise_value_error_when_field_is_not_a_relation(
+        self, model_with_fields, relation_field, nested_builder
+    ):
+        relation_field.is_relation = False
+        with pytest.raises(ValueError):
+            ModelSerializerBuilder(model_with_fields).with_nested(
+                int_field=nested_builder
+            ).build()
+
+    def test_from_model__should_serialize_nested_relation(
+        self, mocker, model_with_fields, relation_field, nested_builder
+    ):
+        serializer_class = (
+            ModelSerializerBuilder(model_with_fields)
+            .with_nested(int_field=nested_builder)
+            .build()
+        )
+        obj = mocker.Mock(char_field="a", bool_field=True)
+        obj.int_field = mocker.Mock(char_field="b")
+        assert serializer_class.from_model(obj).model_dump() == {
+            "char_field": "a",
+            "bool_field": True,
+            "int_field": {"char_field": "b"},
+        }
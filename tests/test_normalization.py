@@ -0,0 +1,89 @@
+import json
+
+import pytest
+from django.db import models
+
+from pydref_serializers.builders import ModelSerializerBuilder
+from pydref_serializers.fieldsets import FieldSet
+
+
+@pytest.fixture
+def relation_field(mocker, model_with_fields):
+    field = mocker.Mock(
+        spec=models.ForeignKey,
+        is_relation=True,
+        many_to_many=False,
+        one_to_many=False,
+        null=True,
+    )
+    model_with_fields._meta.get_field.return_value = field
+    model_with_fields._meta.label = "tests.Model"
+    return field
+
+
+@pytest.fixture
+def nested_builder(model_with_fields):
+    return ModelSerializerBuilder(
+        model_with_fields,
+        fields_getter=lambda model, fields=None: model._meta.fields[:1],
+    )
+
+
+class TestModelSerializerNormalize:
+    def test_normalize__should_include_each_related_object_once(
+        self, mocker, model_with_fields, relation_field, nested_builder
+    ):
+        serializer_class = (
+            ModelSerializerBuilder(model_with_fields)
+            .with_nested(int_field=nested_builder)
+            .build()
+        )
+        related = mocker.Mock(pk=7, char_field="b")
+        objs = [
+            mocker.Mock(char_field="a", bool_field=True, int_field=related),
+            mocker.Mock(char_field="c", bool_field=False, int_field=related),
+            mocker.Mock(char_field="d", bool_field=False, int_field=None),
+        ]
+        from_models = mocker.spy(FieldSet, "from_models")
+
+        assert serializer_class.normalize(objs) == {
+            "data": [
+                {"char_field": "a", "bool_field": True, "int_field": 7},
+                {"char_field": "c", "bool_field": False, "int_field": 7},
+                {"char_field": "d", "bool_field": False, "int_field": None},
+            ],
+            "included": {"tests.Model": {7: {"char_field": "b"}}},
+        }
+        assert [len(call.args[1]) for call in from_models.call_args_list] == [3, 1]
+
+    def test_normalize__should_reference_many_relations_by_primary_keys(
+        self, mocker, model_with_fields, relation_field, nested_builder
+    ):
+        relation_field.many_to_many = True
+        serializer_class = (
+            ModelSerializerBuilder(model_with_fields)
+            .with_nested(int_field=nested_builder)
+            .build()
+        )
+        obj = mocker.Mock(char_field="a", bool_field=True)
+        obj.int_field.all.return_value = [
+            mocker.Mock(pk=1, char_field="b"),
+            mocker.Mock(pk=2, char_field="c"),
+        ]
+
+        document = json.loads(serializer_class.normalize([obj], as_json=True))
+        assert document["data"] == [
+            {"char_field": "a", "bool_field": True, "int_field": [1, 2]}
+        ]
+        assert document["included"] == {
+            "tests.Model": {"1": {"char_field": "b"}, "2": {"char_field": "c"}}
+        }
+
+    def test_normalize__should_raise_when_serializer_was_not_built(
+        self, mocker, model_with_fields
+    ):
+        serializer_class = ModelSerializerBuilder(model_with_fields).build()
+        mocker.patch.dict(serializer_class.config, extractor=None)
+
+        with pytest.raises(ValueError):
+            serializer_class.normalize([])
@@ -0,0 +1,150 @@
+import json
+import logging
+
+import pytest
+from pydantic import ValidationError
+
+from pydref_serializers.builders import ModelSerializerBuilder
+from pydref_serializers.observers import (
+    InMemoryObserver,
+    LoggingObserver,
+    SerializerObserver,
+    get_observer,
+    observe,
+)
+
+ROWS = [
+    {"char_field": "a", "int_field": 1, "bool_field": True},
+    {"char_field": "b", "int_field": 2, "bool_field": False},
+]
+
+
+def key(serializer):
+    return f"tests.MockedModel.{serializer.__name__}"
+
+
+class TestObserve:
+    def test_observe__should_restore_previous_observer(self):
+        assert get_observer() is None
+        with observe(SerializerObserver()) as observer:
+            assert get_observer() is observer
+        assert get_observer() is None
+
+
+class TestInMemoryObserver:
+    def test_on_build__should_count_builds_and_cache_hits(self, model_with_fields):
+        with observe(InMemoryObserver()) as observer:
+            first = ModelSerializerBuilder(model_with_fields).build()
+            ModelSerializerBuilder(model_with_fields).build()
+
+        stats = observer.snapshot()[key(first)]
+        assert (stats["builds"], stats["cache_hits"]) == (2, 1)
+        assert stats["build_seconds"] > 0
+
+    def test_on_serialize__should_aggregate_rows_by_operation(self, model_with_fields):
+        TestModelSerializer = ModelSerializerBuilder(model_with_fields).build()
+
+        with observe(InMemoryObserver()) as observer:
+            TestModelSerializer.from_model(None, model_to_dict=lambda obj: ROWS[0])
+            TestModelSerializer.from_models(
+                ROWS, model_to_dict=lambda obj: obj, as_dicts=True
+            )
+            b"".join(
+                TestModelSerializer.stream_json(ROWS, model_to_dict=lambda obj: obj)
+            )
+
+        stats = observer.snapshot()[key(TestModelSerializer)]
+        assert stats["calls"] == {"from_model": 1, "from_models": 1, "stream_json": 1}
+        assert stats["rows"] == {"from_model": 1, "from_models": 2, "stream_json": 2}
+        assert stats["validate_seconds"] > 0
+        assert stats["dump_seconds"] > 0
+
+    def test_on_validation_error__should_count_errors_by_field(self, model_with_fields):
+        rows = [dict(ROWS[0], int_field="one"), dict(ROWS[1], int_field="two")]
+        TestModelSerializer = ModelSerializerBuilder(model_with_fields).build()
+
+        with observe(InMemoryObserver()) as observer:
+            with pytest.raises(ValidationError):
+                TestModelSerializer.from_models(rows, model_to_dict=lambda obj: obj)
+
+        stats = observer.snapshot()[key(TestModelSerializer)]
+        assert stats["validation_errors"] == {"int_field": 2}
+        assert stats["calls"] == {}
+
+    def test_snapshot__should_merge_serializers_with_the_same_name(
+        self, model_with_fields
+    ):
+        FirstSerializer = ModelSerializerBuilder(model_with_fields).build()
+        SecondSerializer = ModelSerializerBuilder(
+            model_with_fields, fields=["char_field"]
+        ).build()
+        assert FirstSerializer.__name__ == SecondSerializer.__name__
+
+        with observe(InMemoryObserver()) as observer:
+            FirstSerializer.from_models(ROWS, model_to_dict=lambda obj: obj)
+            SecondSerializer.from_model(None, model_to_dict=lambda obj: ROWS[0])
+
+        snapshot = observer.snapshot()
+        assert list(snapshot) == [key(FirstSerializer)]
+        assert snapshot[key(FirstSerializer)]["rows"] == {
+            "from_models": 2,
+            "from_model": 1,
+        }
+
+    def test_snapshot__should_be_json_serializable(self, model_with_fields):
+        TestModelSerializer = ModelSerializerBuilder(model_with_fields).build()
+
+        with observe(InMemoryObserver()) as observer:
+            TestModelSerializer.from_models(ROWS, model_to_dict=lambda obj: obj)
+
+        snapshot = json.loads(json.dumps(observer.snapshot()))
+        assert snapshot[key(TestModelSerializer)]["rows"] == {"from_models": 2}
+
+    def test_reset__should_discard_metrics(self, model_with_fields):
+        observer = InMemoryObserver()
+        with observe(observer):
+            ModelSerializerBuilder(model_with_fields).build()
+        observer.reset()
+        assert observer.snapshot() == {}
+
+
+class TestLoggingObserver:
+    def test_on_validation_error__should_log_warning_with_fields(
+        self, mocker, model_with_fields
+    ):
+        logger = mocker.Mock(spec=logging.Logger)
+        TestModelSerializer = ModelSerializerBuilder(model_with_fields).build()
+
+        with observe(LoggingObserver(logger)):
+            with pytest.raises(ValidationError):
+                TestModelSerializer.from_model(
+                    None, model_to_dict=lambda obj: dict(ROWS[0], int_field="one")
+                )
+
+        logger.warning.assert_called_once()
+        assert "int_field" in logger.warning.call_args.args
+
+    def test_on_serialize__should_log_at_configured_level(
+        self, mocker, model_with_fields
+    ):
+        logger = mocker.Mock(spec=logging.Logger)
+        TestModelSerializer = ModelSerializerBuilder(model_with_fields).build()
+
+        with observe(LoggingObserver(logger, level=logging.INFO)):
+            TestModelSerializer.from_models(ROWS, model_to_dict=lambda obj: obj)
+
+        logger.log.assert_called_once()
+        assert logger.log.call_args.args[0] == logging.INFO
+
+    def test_on_serialize__should_defer_formatting_to_the_logger(
+        self, mocker, model_with_fields
+    ):
+        logger = mocker.Mock(spec=logging.Logger)
+        TestModelSerializer = ModelSerializerBuilder(model_with_fields).build()
+
+        with observe(LoggingObserver(logger)):
+            TestModelSerializer.from_models(ROWS, model_to_dict=lambda obj: obj)
+
+        message, *args = logger.log.call_args.args[1:]
+        assert message.startswith("%s.%s: %d rows")
+        assert args[:3] == [TestModelSerializer.__name__, "from_models", 2]
@@ -0,0 +1,143 @@
+import json
+
+import pytest
+from django.db import models
+from django.db.models.signals import post_save
+
+from pydref_serializers.builders import ModelSerializerBuilder
+from pydref_serializers.output_cache import LocalOutputCache
+
+ROWS = [
+    {"char_field": "a", "int_field": 1, "bool_field": True},
+    {"char_field": "b", "int_field": 2, "bool_field": False},
+]
+
+
+@pytest.fixture
+def serializer(model_with_fields):
+    TestModelSerializer = ModelSerializerBuilder.from_model(model_with_fields).build()
+    yield TestModelSerializer
+    TestModelSerializer.disable_output_cache()
+
+
+@pytest.fixture
+def objs(mocker):
+    return [
+        mocker.Mock(spec=models.Model, pk=pk, **row)
+        for pk, row in enumerate(ROWS, start=1)
+    ]
+
+
+class TestLocalOutputCache:
+    def test_set_many__should_evict_least_recently_used_entries(self):
+        cache = LocalOutputCache(maxsize=2)
+        cache.set_many({"a": 1, "b": 2})
+        cache.get_many(["a"])
+        cache.set_many({"c": 3})
+        assert cache.get_many(["a", "b", "c"]) == {"a": 1, "c": 3}
+
+    def test_get_many__should_skip_expired_entries(self, mocker):
+        monotonic = mocker.patch("time.monotonic", return_value=100.0)
+        cache = LocalOutputCache(timeout=60)
+        cache.set_many({"a": 1})
+        cache.set_many({"b": 2}, timeout=10)
+
+        monotonic.return_value = 120.0
+        assert cache.get_many(["a", "b"]) == {"a": 1}
+        assert len(cache) == 1
+
+
+class TestOutputCache:
+    def test_dump_many_json__should_only_convert_rows_missing_from_cache(
+        self, mocker, serializer, objs
+    ):
+        output_cache = serializer.use_output_cache()
+        from_models = mocker.spy(serializer, "from_models")
+
+        assert json.loads(output_cache.dump_many_json(objs[:1])) == ROWS[:1]
+        assert json.loads(output_cache.dump_many_json(objs)) == ROWS
+        assert json.loads(output_cache.dump_many_json(objs)) == ROWS
+        assert [call.args[0] for call in from_models.call_args_list] == [
+            objs[:1],
+            objs[1:],
+        ]
+
+    def test_dump_json__should_convert_rows_again_when_version_changed(
+        self, serializer, objs
+    ):
+        output_cache = serializer.use_output_cache(version_field="int_field")
+        obj = objs[0]
+        output_cache.dump_json(obj)
+        obj.char_field, obj.int_field = "changed", 10
+
+        assert json.loads(output_cache.dump_json(obj)) == {
+            "char_field": "changed",
+            "int_field": 10,
+            "bool_field": True,
+        }
+
+    def test_dump_many_json__should_refresh_rows_updated_without_signals_once_expired(
+        self, mocker, serializer, objs
+    ):
+        monotonic = mocker.patch("time.monotonic", return_value=100.0)
+        output_cache = serializer.use_output_cache(LocalOutputCache(timeout=60))
+        output_cache.dump_many_json(objs)
+        # e.g. `QuerySet.update()`, which sends no `post_save` signal.
+        objs[0].char_field = "updated"
+
+        assert json.loads(output_cache.dump_many_json(objs)) == ROWS
+        monotonic.return_value = 200.0
+        assert json.loads(output_cache.dump_many_json(objs))[0]["char_field"] == (
+            "updated"
+        )
+
+    def test_dump_many_json__should_not_cache_rows_dumped_during_invalidation(
+        self, mocker, serializer, objs
+    ):
+        output_cache = serializer.use_output_cache()
+        from_models = serializer.from_models
+
+        def from_models_then_save(rows):
+            converted = from_models(rows)
+            output_cache.invalidate(rows[0].pk)
+            return converted
+
+        mocker.patch.object(serializer, "from_models", from_models_then_save)
+        assert json.loads(output_cache.dump_many_json(objs)) == ROWS
+        assert len(output_cache.backend) == 0
+
+    def test_post_save__should_invalidate_saved_row(
+        self, serializer, objs, model_with_fields
+    ):
+        output_cache = serializer.use_output_cache()
+        output_cache.dump_many_json(objs)
+
+        post_save.send(sender=model_with_fields, instance=objs[0])
+        assert len(output_cache.backend) == 1
+        assert output_cache.backend.get_many([output_cache.key(2)])
+
+    def test_disable_output_cache__should_disconnect_signals(
+        self, mocker, serializer, objs, model_with_fields
+    ):
+        output_cache = serializer.use_output_cache()
+        invalidate = mocker.spy(output_cache, "invalidate")
+        serializer.disable_output_cache()
+
+        post_save.send(sender=model_with_fields, instance=objs[0])
+        invalidate.assert_not_called()
+        assert serializer.get_output_cache() is None
+
+
+class TestModelSerializerDumpManyJsonCached:
+    def test_dump_many_json__should_use_output_cache_without_options(
+        self, mocker, serializer, objs
+    ):
+        output_cache = serializer.use_output_cache()
+        dump_many_json = mocker.spy(output_cache, "dump_many_json")
+
+        assert json.loads(serializer.dump_many_json(objs)) == ROWS
+        assert json.loads(serializer.dump_many_json(objs, include={"int_field"})) == [
+            {"int_field": 1},
+            {"int_field": 2},
+        ]
+        dump_many_json.assert_called_once_with(objs)
@@ -0,0 +1,153 @@
+from datetime import datetime, timezone
+
+import pytest
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from django.db.models import Q, QuerySet
+
+from pydref_serializers.builders import ModelSerializerBuilder
+from pydref_serializers.pagination import (
+    _keyset_filter,
+    _ordering_keys,
+    decode_cursor,
+    encode_cursor,
+)
+
+KEYS = [("created", "created", True), ("id", "id", False)]
+
+
+@pytest.fixture
+def paginated_model(model_with_fields):
+    pk = models.AutoField(name="id", primary_key=True)
+    author = models.ForeignKey("tests.Author", models.CASCADE, name="author")
+    fields = {
+        field.name: field for field in [pk, author, *model_with_fields._meta.fields]
+    }
+    for field in fields.values():
+        field.set_attributes_from_name(field.name)
+
+    def get_field(name):
+        if name not in fields:
+            raise FieldDoesNotExist(name)
+        return fields[name]
+
+    model_with_fields._meta.pk = pk
+    model_with_fields._meta.get_field.side_effect = get_field
+    return model_with_fields
+
+
+@pytest.fixture
+def queryset(mocker, paginated_model):
+    queryset = mocker.MagicMock(spec=QuerySet)
+    queryset.model = paginated_model
+    queryset.filter.return_value = queryset
+    queryset.order_by.return_value = queryset
+    queryset.only.return_value = queryset
+    return queryset
+
+
+class TestCursor:
+    def test_decode_cursor__should_return_encoded_values(self):
+        created = datetime(2024, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc)
+        cursor = encode_cursor(KEYS, [created, 42], forward=False)
+        assert decode_cursor(cursor, KEYS) == ([created.isoformat(), 42], False)
+
+    def test_decode_cursor__should_raise_when_ordering_changed(self):
+        cursor = encode_cursor(KEYS, ["2024-01-01", 42], forward=True)
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, KEYS[1:])
+
+    def test_decode_cursor__should_raise_when_cursor_is_malformed(self):
+        with pytest.raises(ValueError):
+            decode_cursor("not a cursor", KEYS)
+
+
+class TestKeysetFilter:
+    def test_keyset_filter__should_select_rows_after_values(self):
+        assert _keyset_filter(KEYS, ["x", 1], forward=True) == Q(created__lte="x") & (
+            Q(created__lt="x") | Q(created="x", id__gt=1)
+        )
+
+    def test_keyset_filter__should_select_rows_before_values_when_backward(self):
+        assert _keyset_filter(KEYS, ["x", 1], forward=False) == Q(created__gte="x") & (
+            Q(created__gt="x") | Q(created="x", id__lt=1)
+        )
+
+
+class TestOrderingKeys:
+    def test_ordering_keys__should_end_with_primary_key(self, paginated_model):
+        assert _ordering_keys(paginated_model, ["-int_field"]) == [
+            ("int_field", "int_field", True),
+            ("id", "id", False),
+        ]
+        assert _ordering_keys(paginated_model, ["-pk"]) == [("id", "id", True)]
+
+    def test_ordering_keys__should_compare_foreign_keys_by_attname(
+        self, paginated_model
+    ):
+        assert _ordering_keys(paginated_model, ["author"]) == [
+            ("author", "author_id", False),
+            ("id", "id", False),
+        ]
+
+    def test_ordering_keys__should_raise_when_field_is_nullable_or_unknown(
+        self, paginated_model
+    ):
+        paginated_model._meta.get_field("int_field").null = True
+        with pytest.raises(ValueError):
+            _ordering_keys(paginated_model, ["int_field"])
+        with pytest.raises(ValueError):
+            _ordering_keys(paginated_model, ["unknown_field"])
+
+
+class TestModelSerializerPaginate:
+    @staticmethod
+    def rows(mocker, count):
+        return [
+            mocker.Mock(id=i, char_field=f"row {i}", int_field=i, bool_field=True)
+            for i in range(count)
+        ]
+
+    def test_paginate__should_return_next_cursor_when_more_rows(
+        self, mocker, queryset, paginated_model
+    ):
+        queryset.__getitem__.return_value = self.rows(mocker, 3)
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(paginated_model).build()
+
+        page = TestModelSerializer.paginate(queryset, limit=2, as_dicts=True)
+        queryset.order_by.assert_called_once_with("id")
+        queryset.__getitem__.assert_called_once_with(slice(None, 3))
+        assert [row["int_field"] for row in page.items] == [0, 1]
+        assert page.previous_cursor is None
+        assert decode_cursor(page.next_cursor, [("id", "id", False)]) == ([1], True)
+
+    def test_paginate__should_filter_and_reverse_rows_of_previous_page(
+        self, mocker, queryset, paginated_model
+    ):
+        queryset.__getitem__.return_value = self.rows(mocker, 2)[::-1]
+        cursor = encode_cursor([("id", "id", False)], [2], forward=False)
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(paginated_model).build()
+
+        page = TestModelSerializer.paginate(queryset, cursor, limit=2, as_dicts=True)
+        queryset.filter.assert_called_once_with(Q(id__lte=2) & Q(id__lt=2))
+        queryset.order_by.assert_called_once_with("-id")
+        assert [row["int_field"] for row in page.items] == [0, 1]
+        assert page.previous_cursor is None
+        assert page.next_cursor is not None
+
+    def test_paginate__should_order_foreign_keys_by_attname(
+        self, mocker, queryset, paginated_model
+    ):
+        rows = self.rows(mocker, 2)
+        for row in rows:
+            row.author_id = 7
+        queryset.__getitem__.return_value = rows
+
+        TestModelSerializer = ModelSerializerBuilder.from_model(paginated_model).build()
+
+        page = TestModelSerializer.paginate(queryset, order_by=["-author"], limit=1)
+        queryset.order_by.assert_called_once_with("-author_id", "id")
+        keys = [("author", "author_id", True), ("id", "id", False)]
+        assert decode_cursor(page.next_cursor, keys) == ([7, 0], True)
@@ -0,0 +1,162 @@
+import json
+
+import pytest
+from django.db import models
+from django.db.models import QuerySet
+from django.db.models.functions import Cast
+from pydantic import TypeAdapter, ValidationError
+
+from pydref_serializers.builders import ModelSerializerBuilder
+from pydref_serializers.mappers.passthrough import (
+    Base64Binary,
+    RawJSON,
+    passthrough_field_mapper,
+    splice_raw_json,
+)
+
+
+@pytest.fixture
+def model_with_documents(mocked_model) -> type:
+    mocked_model._meta.fields = [
+        models.CharField(max_length=100, name="char_field"),
+        models.JSONField(name="json_field", null=True),
+        models.BinaryField(name="binary_field"),
+    ]
+    return mocked_model
+
+
+@pytest.fixture
+def serializer(model_with_documents):
+    return ModelSerializerBuilder.from_model(
+        model_with_documents, field_mapper=passthrough_field_mapper
+    ).build()
+
+
+class TestRawJSON:
+    def test_validate__should_encode_python_values(self):
+        adapter = TypeAdapter(RawJSON)
+        assert adapter.validate_python({"a": [1, None]}) == RawJSON('{"a":[1,null]}')
+
+    def test_validate__should_keep_raw_json_values(self):
+        value = RawJSON(b'{"a": 1}')
+        assert TypeAdapter(RawJSON).validate_python(value) is value
+
+    def test_validate__should_raise_when_value_is_not_json_serializable(self):
+        with pytest.raises(ValidationError):
+            TypeAdapter(RawJSON).validate_python(object())
+
+    def test_dump_python__should_keep_raw_json_values(self):
+        value = RawJSON('{"a": 1}')
+        assert TypeAdapter(RawJSON).dump_python(value) is value
+
+    def test_dump_json__should_decode_values_outside_of_splice_raw_json(self):
+        assert TypeAdapter(RawJSON).dump_json(RawJSON('{"a": 1}')) == b'{"a":1}'
+
+
+class TestSpliceRawJSON:
+    def test_splice_raw_json__should_splice_text_verbatim(self):
+        adapter = TypeAdapter(list[RawJSON])
+        values = [RawJSON('{"a": 1}'), RawJSON(b"[1, 2]")]
+        assert splice_raw_json(adapter.dump_json, values) == b'[{"a": 1},[1, 2]]'
+
+    def test_splice_raw_json__should_splice_into_str_dumps(self, serializer):
+        instance = serializer(
+            char_field="a", json_field=RawJSON(b'{"b": 2}'), binary_field=b"\x00"
+        )
+        assert instance.model_dump_json() == (
+            '{"char_field":"a","json_field":{"b": 2},"binary_field":"AA=="}'
+        )
+
+    def test_splice_raw_json__should_keep_strings_looking_like_documents(self):
+        adapter = TypeAdapter(list[str | RawJSON])
+        dumped = splice_raw_json(adapter.dump_json, ['{"a": 1}', RawJSON("{}")])
+        assert json.loads(dumped) == ['{"a": 1}', {}]
+
+
+class TestBase64Binary:
+    def test_dump_json__should_encode_buffers_to_base64(self):
+        adapter = TypeAdapter(Base64Binary)
+        assert adapter.dump_json(memoryview(b"\x00\x01")) == b'"AAE="'
+
+    def test_validate__should_decode_base64_strings(self):
+        assert TypeAdapter(Base64Binary).validate_python("AAE=") == b"\x00\x01"
+
+    def test_validate__should_raise_when_string_is_not_base64(self):
+        with pytest.raises(ValidationError):
+            TypeAdapter(Base64Binary).validate_python("not base64!")
+
+
+class TestModelSerializerPassthrough:
+    def test_from_values__should_read_json_fields_as_text(self, mocker, serializer):
+        queryset = mocker.MagicMock(spec=QuerySet)
+        queryset.values_list.return_value = [
+            ("a", '{"b": [1, 2]}', b"\x00"),
+            ("b", None, b"\x01"),
+        ]
+
+        serializers = serializer.from_values(queryset)
+        columns = queryset.values_list.call_args.args
+        assert columns[0] == "char_field"
+        assert isinstance(columns[1], Cast)
+        assert [s.json_field for s in serializers] == [RawJSON('{"b": [1, 2]}'), None]
+        assert serializer.dump_many_json(serializers) == (
+            b'[{"char_field":"a","json_field":{"b": [1, 2]},"binary_field":"AA=="},'
+            b'{"char_field":"b","json_field":null,"binary_field":"AQ=="}]'
+        )
+
+    def test_from_model__should_encode_decoded_values(self, mocker, serializer):
+        obj = mocker.Mock(char_field="a", json_field={"b": 1}, binary_field=b"\x00")
+        model = mocker.Mock()
+        mocker.patch.dict(serializer.config, model=model)
+
+        instance = serializer.from_model(obj)
+        assert instance.json_field == RawJSON('{"b":1}')
+        instance.to_model()
+        model.assert_called_once_with(
+            char_field="a", json_field={"b": 1}, binary_field=b"\x00"
+        )
+
+    def test_has_raw_json__should_be_decided_when_built(
+        self, model_with_documents, serializer
+    ):
+        plain = ModelSerializerBuilder.from_model(model_with_documents).build()
+        assert serializer.has_raw_json() is True
+        assert plain.has_raw_json() is False
+
+    def test_has_raw_json__should_include_nested_serializers(
+        self, mocker, model_with_documents
+    ):
+        model_with_documents._meta.get_field.return_value = mocker.Mock(
+            spec=models.ForeignKey,
+            is_relation=True,
+            many_to_many=False,
+            one_to_many=False,
+            null=True,
+        )
+        document_builder = ModelSerializerBuilder.from_model(
+            model_with_documents, field_mapper=passthrough_field_mapper
+        )
+        serializer = (
+            ModelSerializerBuilder(
+                model_with_documents,
+                fields_getter=lambda model, fields=None: model._meta.fields[:1],
+            )
+            .with_nested(binary_field=document_builder)
+            .build()
+        )
+        assert serializer.has_raw_json() is True
+
+    def test_dump_many_json__should_skip_splicing_without_raw_json_fields(
+        self, mocker, model_with_fields
+    ):
+        splice = mocker.patch("pydref_serializers.serializers.splice_raw_json")
+        plain = ModelSerializerBuilder.from_model(model_with_fields).build()
+        instance = plain(char_field="a", int_field=1, bool_field=True)
+
+        assert plain.dump_many_json([instance]) == (
+            b'[{"char_field":"a","int_field":1,"bool_field":true}]'
+        )
+        assert instance.model_dump_json() == (
+            '{"char_field":"a","int_field":1,"bool_field":true}'
+        )
+        splice.assert_not_called()
@@ -0,0 +1,167 @@
+import json
+from types import SimpleNamespace
+
+import pydref_serializers
+from pydref_serializers.apps import PydrefSerializersConfig
+from pydref_serializers.builders import ModelSerializerBuilder
+from pydref_serializers.openapi import _merge_schema
+from pydref_serializers.registry import SerializerRegistry
+
+
+def build(model, registry, *field_names, defer=True):
+    builder = ModelSerializerBuilder(model, registry=registry, cache=None)
+    if field_names:
+        builder.with_fields(*field_names)
+    return builder.build(defer=defer)
+
+
+class TestSerializerRegistryRegister:
+    def test_build__should_register_built_serializers(self, model_with_fields):
+        registry = SerializerRegistry()
+        TestModelSerializer = build(model_with_fields, registry, defer=False)
+        assert TestModelSerializer in registry
+        assert registry.pending() == []
+
+    def test_pending__should_return_deferred_serializers(self, model_with_fields):
+        registry = SerializerRegistry()
+        TestModelSerializer = build(model_with_fields, registry)
+        assert registry.pending() == [TestModelSerializer]
+
+
+class TestSerializerRegistryWarmup:
+    def test_warmup__should_compile_pending_serializers(self, model_with_fields):
+        registry = SerializerRegistry()
+        first = build(model_with_fields, registry, "char_field")
+        second = build(model_with_fields, registry, "int_field", defer=False)
+
+        result = registry.warmup()
+        assert (result.compiled, result.total) == (1, 2)
+        assert first.is_schema_compiled() and second.is_schema_compiled()
+        assert registry.warmup().compiled == 0
+
+
+class TestSerializerRegistryOpenAPI:
+    def test_build_openapi_components__should_include_shared_enums_once(
+        self, model_with_choices
+    ):
+        registry = SerializerRegistry()
+        first = build(model_with_choices, registry, "char_field", "int_field")
+        second = build(model_with_choices, registry, "char_field", "bool_field")
+
+        schemas = registry.build_openapi_components()["schemas"]
+        enum_name = first.model_fields["char_field"].annotation.__name__
+        assert sorted(schemas) == sorted(
+            [enum_name, first.__name__, f"{second.__name__}2"]
+        )
+        assert {registry.schema_ref(first), registry.schema_ref(second)} == {
+            f"#/components/schemas/{first.__name__}",
+            f"#/components/schemas/{second.__name__}2",
+        }
+        for schema in schemas.values():
+            if "properties" in schema:
+                assert schema["properties"]["char_field"] == {
+                    "$ref": f"#/components/schemas/{enum_name}"
+                }
+
+    def test_merge_schema__should_suffix_different_definitions_with_same_name(self):
+        schemas = {}
+        for values in (["a"], ["a"], ["b"]):
+            _merge_schema(
+                schemas,
+                {
+                    "$defs": {"StatusEnum": {"enum": values}},
+                    "properties": {"status": {"$ref": "#/$defs/StatusEnum"}},
+                    "title": "Serializer",
+                },
+            )
+        assert schemas["StatusEnum2"] == {"enum": ["b"]}
+        assert schemas["Serializer2"]["properties"]["status"] == {
+            "$ref": "#/components/schemas/StatusEnum2"
+        }
+        assert len(schemas) == 4
+
+    def test_build_openapi_components__should_be_cached_until_a_serializer_is_built(
+        self, mocker, model_with_fields
+    ):
+        registry = SerializerRegistry()
+        TestModelSerializer = build(model_with_fields, registry, "char_field")
+        model_json_schema = mocker.spy(TestModelSerializer, "model_json_schema")
+
+        components = registry.build_openapi_components()
+        assert registry.build_openapi_components() == components
+        assert model_json_schema.call_count == 1
+
+        build(model_with_fields, registry, "int_field")
+        assert len(registry.build_openapi_components()["schemas"]) == 2
+        assert model_json_schema.call_count == 2
+
+    def test_build_openapi_components__should_load_persisted_components(
+        self, mocker, tmp_path, model_with_fields
+    ):
+        path = tmp_path / "components.json"
+        registry = SerializerRegistry()
+        build(model_with_fields, registry)
+        components = registry.build_openapi_components(path=path)
+
+        # An identical serializer built in another process has the same schema.
+        other_registry = SerializerRegistry()
+        build(model_with_fields, other_registry)
+        merge_schema = mocker.patch("pydref_serializers.openapi._merge_schema")
+        assert other_registry.build_openapi_components(path=path) == components
+        merge_schema.assert_not_called()
+
+    def test_build_openapi_components__should_regenerate_when_a_schema_changed(
+        self, tmp_path, model_with_fields
+    ):
+        path = tmp_path / "components.json"
+        registry = SerializerRegistry()
+        build(model_with_fields, registry, "char_field")
+        registry.build_openapi_components(path=path)
+
+        model_with_fields._meta.fields[0].max_length = 10
+        other_registry = SerializerRegistry()
+        build(model_with_fields, other_registry, "char_field")
+        [schema] = other_registry.build_openapi_components(path=path)[
+            "schemas"
+        ].values()
+        assert schema["properties"]["char_field"]["maxLength"] == 10
+
+    def test_build_openapi_components__should_persist_cached_components_to_late_path(
+        self, tmp_path, model_with_fields
+    ):
+        path = tmp_path / "components.json"
+        registry = SerializerRegistry()
+        build(model_with_fields, registry)
+
+        components = registry.build_openapi_components()
+        assert registry.build_openapi_components(path=path) == components
+        assert json.loads(path.read_text())["schemas"] == components["schemas"]
+
+    def test_build_openapi_components__should_return_a_copy(self, model_with_fields):
+        registry = SerializerRegistry()
+        build(model_with_fields, registry)
+
+        components = registry.build_openapi_components()
+        components["schemas"].clear()
+        assert registry.build_openapi_components()["schemas"] != {}
+
+
+class TestPydrefSerializersConfig:
+    def test_ready__should_warm_up_when_enabled(self, mocker):
+        settings = SimpleNamespace(
+            PYDREF_WARMUP=True, PYDREF_WARMUP_MODULES=("api_serializers",)
+        )
+        mocker.patch("pydref_serializers.apps.settings", new=settings)
+        autodiscover = mocker.patch("pydref_serializers.apps.autodiscover_serializers")
+        registry = mocker.patch("pydref_serializers.apps.serializer_registry")
+
+        PydrefSerializersConfig("pydref_serializers", pydref_serializers).ready()
+        autodiscover.assert_called_once_with(("api_serializers",))
+        registry.warmup.assert_called_once_with()
+
+    def test_ready__should_not_warm_up_by_default(self, mocker):
+        mocker.patch("pydref_serializers.apps.settings", new=SimpleNamespace())
+        registry = mocker.patch("pydref_serializers.apps.serializer_registry")
+
+        PydrefSerializersConfig("pydref_serializers", pydref_serializers).ready()
+        registry.warmup.assert_not_called()
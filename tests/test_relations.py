@@ -0,0 +1,209 @@
+from types import SimpleNamespace
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import Prefetch, QuerySet
+from django.db.models.query import ModelIterable
+
+from pydref_serializers.relations import QueryPlan, Relation
+
+
+def mocked_queryset(mocker):
+    queryset = mocker.MagicMock(spec=QuerySet, _iterable_class=ModelIterable)
+    queryset.select_related.return_value = queryset
+    queryset.prefetch_related.return_value = queryset
+    queryset.only.return_value = queryset
+    return queryset
+
+
+def prefetching_queryset(mocker, *lookups):
+    # Records the prefetch lookups like QuerySet.prefetch_related does.
+    queryset = mocked_queryset(mocker)
+    queryset._prefetch_related_lookups = lookups
+
+    def prefetch_related(*added):
+        queryset._prefetch_related_lookups += added
+        return queryset
+
+    queryset.prefetch_related.side_effect = prefetch_related
+    return queryset
+
+
+def prefetch_paths(queryset):
+    return [
+        getattr(lookup, "prefetch_to", lookup)
+        for lookup in queryset._prefetch_related_lookups
+    ]
+
+
+def mocked_serializer(mocker, plan=QueryPlan()):
+    serializer = mocker.MagicMock()
+    serializer.get_model_to_dict.return_value = lambda obj: {"id": obj.id}
+    serializer.query_plan.return_value = plan
+    serializer.config["model"]._default_manager.all.return_value = mocked_queryset(
+        mocker
+    )
+    return serializer
+
+
+class TestRelationExtract:
+    def test_extract__should_return_related_object_dict(self, mocker):
+        relation = Relation("author", "author", False, mocked_serializer(mocker))
+        obj = SimpleNamespace(author=SimpleNamespace(id=1))
+        assert relation.extract(obj) == {"id": 1}
+
+    def test_extract__should_return_none_when_related_object_is_none(self, mocker):
+        relation = Relation("author", "author", False, mocked_serializer(mocker))
+        assert relation.extract(SimpleNamespace(author=None)) is None
+
+    def test_extract__should_return_none_when_related_object_does_not_exist(
+        self, mocker
+    ):
+        relation = Relation("cover", "cover", False, mocked_serializer(mocker))
+        obj = mocker.Mock()
+        type(obj).cover = mocker.PropertyMock(side_effect=ObjectDoesNotExist)
+        assert relation.extract(obj) is None
+
+    def test_extract__should_return_list_for_many_relations(self, mocker):
+        relation = Relation("tags", "tags", True, mocked_serializer(mocker))
+        obj = mocker.Mock()
+        obj.tags.all.return_value = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
+        assert relation.extract(obj) == [{"id": 1}, {"id": 2}]
+
+
+class TestQueryPlanFromRelations:
+    def test_from_relations__should_select_single_relations(self, mocker):
+        nested_plan = QueryPlan(select_related=("publisher",))
+        relation = Relation(
+            "author", "author", False, mocked_serializer(mocker, nested_plan)
+        )
+        plan = QueryPlan.from_relations((relation,))
+        assert plan.select_related == ("author", "author__publisher")
+        assert plan.prefetch_related == ()
+
+    def test_from_relations__should_prefetch_many_relations_with_nested_plan(
+        self, mocker
+    ):
+        nested_plan = QueryPlan(select_related=("publisher",))
+        serializer = mocked_serializer(mocker, nested_plan)
+        queryset = serializer.config["model"]._default_manager.all.return_value
+        relation = Relation("books", "book_set", True, serializer)
+        plan = QueryPlan.from_relations((relation,))
+        assert plan.select_related == ()
+        assert [lookup.prefetch_through for lookup in plan.prefetch_related] == [
+            "book_set"
+        ]
+        queryset.select_related.assert_called_once_with("publisher")
+
+    def test_from_relations__should_prefix_prefetches_of_single_relations(self, mocker):
+        nested_plan = QueryPlan.from_relations(
+            (Relation("books", "books", True, mocked_serializer(mocker)),)
+        )
+        relation = Relation(
+            "author", "author", False, mocked_serializer(mocker, nested_plan)
+        )
+        plan = QueryPlan.from_relations((relation,))
+        assert plan.select_related == ("author",)
+        assert [lookup.prefetch_through for lookup in plan.prefetch_related] == [
+            "author__books"
+        ]
+
+
+class TestQueryPlanApply:
+    def test_apply__should_not_change_queryset_when_plan_is_empty(self, mocker):
+        queryset = mocker.MagicMock(spec=QuerySet)
+        assert QueryPlan().apply(queryset) is queryset
+        queryset.select_related.assert_not_called()
+        queryset.prefetch_related.assert_not_called()
+
+    def test_apply__should_skip_prefetch_when_prefetch_is_false(self, mocker):
+        queryset = mocker.MagicMock(spec=QuerySet)
+        plan = QueryPlan(select_related=("author",), prefetch_related=("tags",))
+        prepared = plan.apply(queryset, prefetch=False)
+        queryset.select_related.assert_called_once_with("author")
+        prepared.prefetch_related.assert_not_called()
+
+    def test_apply__should_not_prefetch_again_when_applied_twice(self, mocker):
+        tags = Prefetch("tags", queryset=mocked_queryset(mocker))
+        plan = QueryPlan(prefetch_related=(tags,))
+        queryset = prefetching_queryset(mocker)
+
+        plan.apply(plan.apply(queryset))
+        assert prefetch_paths(queryset) == ["tags"]
+
+    def test_apply__should_keep_prefetches_of_the_caller(self, mocker):
+        plan = QueryPlan(
+            prefetch_related=(
+                Prefetch("tags", queryset=mocked_queryset(mocker)),
+                Prefetch("author__books", queryset=mocked_queryset(mocker)),
+            )
+        )
+        queryset = prefetching_queryset(mocker, "tags__books")
+
+        plan.apply(queryset)
+        assert prefetch_paths(queryset) == ["tags__books", "author__books"]
+
+
+class TestQueryPlanOnly:
+    def test_from_relations__should_include_forward_relations_and_nested_only(
+        self, mocker
+    ):
+        nested_plan = QueryPlan(only=("id", "name"))
+        relation = Relation(
+            "author", "author", False, mocked_serializer(mocker, nested_plan)
+        )
+        plan = QueryPlan.from_relations((relation,), only=("id", "title"))
+        assert plan.only == ("id", "title", "author", "author__id", "author__name")
+
+    def test_from_relations__should_not_project_without_own_only(self, mocker):
+        nested_plan = QueryPlan(only=("id", "name"))
+        relation = Relation(
+            "author", "author", False, mocked_serializer(mocker, nested_plan)
+        )
+        assert QueryPlan.from_relations((relation,)).only == ()
+
+    def test_from_relations__should_load_join_fields_of_prefetched_relations(
+        self, mocker
+    ):
+        serializer = mocked_serializer(mocker, QueryPlan(only=("id", "title")))
+        queryset = serializer.config["model"]._default_manager.all.return_value
+        relation = Relation(
+            "books", "books", True, serializer, reverse=True, join_fields=("author",)
+        )
+        QueryPlan.from_relations((relation,), only=("id",))
+        queryset.only.assert_called_once_with("id", "title", "author")
+
+    def test_apply__should_restrict_columns_unless_project_is_false(self, mocker):
+        queryset = mocked_queryset(mocker)
+        plan = QueryPlan(only=("id",))
+        plan.apply(queryset, project=False)
+        queryset.only.assert_not_called()
+        plan.apply(queryset)
+        queryset.only.assert_called_once_with("id")
+
+    def test_apply__should_load_relations_selected_by_the_caller(self, mocker):
+        queryset = mocked_queryset(mocker)
+        queryset.model = mocker.MagicMock()
+        queryset.query.select_related = {"author": {}, "cover": {}}
+        fields = {
+            "author": mocker.Mock(is_relation=True, concrete=True),
+            "cover": mocker.Mock(is_relation=True, concrete=False),  # Reverse relation
+        }
+        queryset.model._meta.get_field.side_effect = fields.__getitem__
+        QueryPlan(only=("id", "title")).apply(queryset)
+        queryset.only.assert_called_once_with("id", "title", "author")
+
+    def test_apply__should_not_project_when_the_caller_selects_every_relation(
+        self, mocker
+    ):
+        queryset = mocked_queryset(mocker)
+        queryset.query.select_related = True
+        QueryPlan(only=("id",)).apply(queryset)
+        queryset.only.assert_not_called()
+
+    def test_apply__should_not_change_values_querysets(self, mocker):
+        queryset = mocked_queryset(mocker)
+        queryset._fields = ("id", "title")
+        plan = QueryPlan(select_related=("author",), only=("id", "title"))
+        assert plan.apply(queryset) is queryset
+        queryset.select_related.assert_not_called()
+        queryset.only.assert_not_called()